@@ -0,0 +1,85 @@
+"""
+accounts/websocket_auth.py
+
+Channels counterpart of CookieJWTAuthentication: authenticates WebSocket
+connections from the `access` JWT cookie. The user behind a token is
+cached for a short while, so a reconnect storm (e.g. after a deploy)
+validates tokens in memory instead of loading every user again.
+"""
+from http.cookies import SimpleCookie
+from typing import Optional
+from channels.db import database_sync_to_async
+from channels.middleware import BaseMiddleware
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+
+from accounts.authentication import CookieJWTAuthentication
+import logging
+
+logger = logging.getLogger(__name__)
+
+USER_CACHE_TTL = 60
+USER_CACHE_KEY = 'ws_auth_user:{user_id}'
+
+# Cached for unknown or inactive users, so bad tokens don't reach the DB either
+NO_USER = 'none'
+
+
+def _access_token(scope) -> Optional[str]:
+    cookie_name = getattr(api_settings, 'AUTH_COOKIE', None) or 'access'
+    cookies = SimpleCookie()
+    for name, value in scope.get('headers', []):
+        if name == b'cookie':
+            cookies.load(value.decode('latin-1'))
+    morsel = cookies.get(cookie_name)
+    return morsel.value if morsel else None
+
+
+@database_sync_to_async
+def get_websocket_user(raw_token: Optional[str]):
+    if not raw_token:
+        return AnonymousUser()
+
+    authentication = CookieJWTAuthentication()
+    try:
+        validated_token = authentication.get_validated_token(raw_token)
+        user_id = validated_token[api_settings.USER_ID_CLAIM]
+    except (TokenError, AuthenticationFailed, KeyError) as e:
+        logger.debug(f"Rejected WebSocket token: {str(e)}")
+        return AnonymousUser()
+
+    cache_key = USER_CACHE_KEY.format(user_id=user_id)
+    user = cache.get(cache_key)
+    if user is None:
+        try:
+            user = authentication.get_user(validated_token)
+        except AuthenticationFailed:
+            user = NO_USER
+        cache.set(cache_key, user, USER_CACHE_TTL)
+
+    return AnonymousUser() if isinstance(user, str) else user
+
+
+def scope_user_id(scope, url_user_id=None) -> Optional[str]:
+    """
+    Id of the authenticated user of a connection; None when anonymous or
+    when the URL names somebody else
+    """
+    user = scope.get('user')
+    if user is None or not user.is_authenticated:
+        return None
+    if url_user_id is not None and str(url_user_id) != str(user.id):
+        return None
+    return str(user.id)
+
+
+class JWTCookieAuthMiddleware(BaseMiddleware):
+    """Puts the user of the `access` cookie (or AnonymousUser) in scope['user']"""
+
+    async def __call__(self, scope, receive, send):
+        scope = dict(scope)
+        scope['user'] = await get_websocket_user(_access_token(scope))
+        return await super().__call__(scope, receive, send)
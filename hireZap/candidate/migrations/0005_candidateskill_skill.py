@@ -0,0 +1,24 @@
+# Generated by Django 5.2.5 on 2026-10-19 01:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('candidate', '0004_remove_candidateexperience_candidate_e_candida_80ca1d_idx_and_more'),
+        ('skills', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='candidateskill',
+            name='skill',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='candidates', to='skills.skill'),
+        ),
+        migrations.AddIndex(
+            model_name='candidateskill',
+            index=models.Index(fields=['skill', 'candidate'], name='candidate_s_skill_i_668184_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-19 01:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('candidate', '0005_candidateskill_skill'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='candidateprofile',
+            name='preferred_work_type',
+            field=models.CharField(blank=True, choices=[('hybrid', 'Hybrid'), ('remote', 'Remote'), ('onsite', 'Onsite')], max_length=20, null=True),
+        ),
+    ]
@@ -1,6 +1,7 @@
 from django.db import models
 from django.conf import settings
 from  django.core.validators import MinValueValidator, MaxValueValidator
+from job.models import JobModel
 
 class CandidateProfile(models.Model):
     user = models.OneToOneField(
@@ -16,6 +17,7 @@ class CandidateProfile(models.Model):
     location = models.CharField(max_length=255, blank=True, null=True, db_index=True)
     resume_url = models.URLField(max_length=1024, blank=True, null=True)
     website = models.URLField(max_length=255, blank=True, null=True)
+    preferred_work_type = models.CharField(max_length=20, choices=JobModel.WORK_TYPE_CHOICES, blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -85,6 +87,15 @@ class CandidateSkill(models.Model):
         db_index=True
     )
     skill_name = models.CharField(max_length=100, db_index=True)
+    # Canonical skill of skill_name, set by skills.signals
+    skill = models.ForeignKey(
+        'skills.Skill',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='candidates',
+        db_index=False
+    )
     proficiency = models.IntegerField(
         validators=[MinValueValidator(1), MaxValueValidator(5)],
         help_text="Proficiency level from 1 (beginner) to 5 (expert)"
@@ -100,6 +111,10 @@ class CandidateSkill(models.Model):
         db_table = 'candidate_skills'
         unique_together = ['candidate', 'skill_name']
         ordering = ['-proficiency', 'skill_name']
+        indexes = [
+            # skill -> candidates
+            models.Index(fields=['skill', 'candidate']),
+        ]
 
     def __str__(self):
         return f"{self.skill_name} - {self.proficiency}/5 stars"
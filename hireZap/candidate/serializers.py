@@ -10,6 +10,7 @@ class CandidateProfileSerializer(serializers.Serializer):
     location = serializers.CharField(required=False, allow_blank=True, max_length=255)
     website = serializers.URLField(required=False, allow_blank=True, max_length=255)
     resume_url = serializers.URLField(required=False, allow_blank=True, max_length=1024)
+    preferred_work_type = serializers.ChoiceField(choices=['hybrid', 'remote', 'onsite'], required=False, allow_blank=True)
 
     def validate_phone_number(self, value):
         """Validate phone number format"""
@@ -130,6 +131,7 @@ class ProfileResponseSerializer(serializers.Serializer):
     location = serializers.CharField(allow_null=True)
     resume_url = serializers.URLField(allow_null=True)
     website = serializers.URLField(allow_null=True)
+    preferred_work_type = serializers.CharField(allow_null=True)
     created_at = serializers.DateTimeField(allow_null=True)
     updated_at = serializers.DateTimeField(allow_null=True)
 
@@ -2,13 +2,12 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated,IsAdminUser
-from channels.layers import get_channel_layer
-from asgiref.sync import async_to_sync
 from companies.serializers import(
     CreateCompanySerializer,
     UpdateCompanySerializer
 )
 from infrastructure.repositories.company_repository import CompanyRepository
+from infrastructure.services.notification_service import NotificationService
 from core.use_cases.company.create_company import CreateCompanyUseCase
 from core.use_cases.company.get_company import GetCompanyUseCase
 from core.use_cases.company.pending_company import GetPendingCompanyUseCase
@@ -109,11 +108,10 @@ class ApproveCompany(APIView):
         recruiter_id = company.get('recruiter_id') or company.get('recruiter')
         
         if recruiter_id:
-            channel_layer = get_channel_layer()
-            async_to_sync(channel_layer.group_send)(
-                f'user_{recruiter_id}',  # Room name
-                {
-                    'type': 'company_verified',  # Calls company_verified() in consumer
+            NotificationService().send_websocket_notification(
+                user_id=recruiter_id,
+                notification_type='company_verified',  # Calls company_verified() in consumer
+                data={
                     'company': company,
                     'message': 'Your company has been verified!'
                 }
@@ -144,11 +142,10 @@ class RejectCompany(APIView):
         recruiter_id = company.get('recruiter_id') or company.get('recruiter')
         
         if recruiter_id:
-            channel_layer = get_channel_layer()
-            async_to_sync(channel_layer.group_send)(
-                f'user_{recruiter_id}',
-                {
-                    'type': 'company_rejected',
+            NotificationService().send_websocket_notification(
+                user_id=recruiter_id,
+                notification_type='company_rejected',
+                data={
                     'company': company,
                     'reason': reason
                 }
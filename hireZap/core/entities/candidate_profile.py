@@ -14,6 +14,7 @@ class CandidateProfile:
     location: Optional[str] = None
     resume_url: Optional[str] = None
     website: Optional[str] = None
+    preferred_work_type: Optional[str] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
@@ -27,6 +28,7 @@ class CandidateProfile:
             'location': self.location,
             'resume_url': self.resume_url,
             'website': self.website,
+            'preferred_work_type': self.preferred_work_type,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None,
         }
@@ -35,8 +35,8 @@ class HRRoundRepositoryPort(ABC):
         return NotImplementedError
     
     @abstractmethod
-    def list_interviews_by_job(self, job_id:int, status:str=None) ->List:
-        """List interview for a job"""
+    def list_interviews_by_job(self, job_id:int, status:str=None, page:int=1, page_size:int=20) ->tuple:
+        """One page of a job's interviews: (interviews, total_count, status_counts)"""
         return NotImplementedError
     
     @abstractmethod
@@ -55,15 +55,19 @@ class HRRoundRepositoryPort(ABC):
         """Schedule interview"""
         return NotImplementedError
     
+    @abstractmethod
+    def get_interview_statuses_by_application(self, application_ids:List[int]) -> Dict[int, str]:
+        """{application_id: interview status} for applications that have an interview"""
+        return NotImplementedError
+    
     @abstractmethod
     def bulk_schedule_interviews(self,
-                                application_ids:List[int],
-                                scheduled_at:timezone.datetime,
+                                schedules:List[Dict],
                                 duration_minutes:int,
                                 timezone_str:str,
                                 conducted_by_id:int,
-                                scheduling_notes:str=None)->List:
-        """Schedule multiple interviews at once"""
+                                scheduling_notes:str=None)->List[int]:
+        """Schedule multiple interviews at once, returns interview ids"""
         return NotImplementedError
     
     @abstractmethod
@@ -87,13 +91,13 @@ class HRRoundRepositoryPort(ABC):
         return NotImplementedError
     
     @abstractmethod
-    def mark_reminder_sent(self, interview_id:int):
-        """Mark reminder sent"""
+    def mark_reminders_sent(self, interview_ids:List[int]):
+        """Mark reminders sent"""
         return NotImplementedError
     
     @abstractmethod
-    def get_upcoming_interviews_for_reminder(self, hours_before:int=24):
-        """Get interviews that need reminders"""
+    def get_interviews_due_for_reminder(self, interview_ids:List[int]):
+        """Get the interviews of a reminder batch that still need a reminder"""
         return NotImplementedError
     
     @abstractmethod
@@ -111,6 +115,11 @@ class HRRoundRepositoryPort(ABC):
         """Get meeting session by interview"""
         return NotImplementedError
     
+    @abstractmethod
+    def get_meeting_rooms(self, room_ids:List[str]):
+        """Get session/interview ids of meeting rooms keyed by room id"""
+        return NotImplementedError
+    
     @abstractmethod
     def update_participant_connection(self, session_id:str, participant_type:str, connected:bool):
         """Update participant connection status"""
@@ -141,11 +150,90 @@ class HRRoundRepositoryPort(ABC):
         """Save chat message from ZegoCloud webhook"""
         raise NotImplementedError
     
+    @abstractmethod
+    def bulk_save_zegocloud_chat_messages(self, messages: List[Dict]):
+        """Save a batch of chat messages from ZegoCloud webhooks"""
+        raise NotImplementedError
+    
     @abstractmethod
     def end_meeting_session(self, session_id:str):
         """End meeting session"""
         return NotImplementedError
     
+    @abstractmethod
+    def create_transcription(self, 
+                             interview_id:int,
+                             full_text:str,
+                             segments:List[Dict],
+                             detected_language:str='en',
+                             confidence:Optional[float]=None,
+                             model_used:Optional[str]=None,
+                             processing_time_seconds:Optional[float]=None,
+                             audio_sha256:Optional[str]=None):
+        """Create or replace transcription record"""
+        return NotImplementedError
+    
+    @abstractmethod
+    def get_completed_transcription_by_hash(self, audio_sha256:str):
+        """Find a completed transcription of identical audio"""
+        return NotImplementedError
+    
+    @abstractmethod
+    def get_transcription(self, interview_id:int):
+        """Get transcription for an interview"""
+        return NotImplementedError
+    
+    @abstractmethod
+    def start_transcription(self, interview_id:int, model_used:str, audio_sha256:Optional[str]=None):
+        """Create or reopen an in-progress transcription"""
+        return NotImplementedError
+    
+    @abstractmethod
+    def append_transcription_segments(self,
+                                      interview_id:int,
+                                      segments:List[Dict],
+                                      progress_percent:int):
+        """Append a batch of transcribed segments"""
+        return NotImplementedError
+    
+    @abstractmethod
+    def complete_transcription(self,
+                               interview_id:int,
+                               detected_language:str,
+                               confidence:Optional[float]=None,
+                               model_used:Optional[str]=None,
+                               processing_time_seconds:Optional[float]=None):
+        """Mark transcription as completed"""
+        return NotImplementedError
+    
+    @abstractmethod
+    def update_transcription_status(self,
+                                    interview_id:int,
+                                    status:str,
+                                    error_message:Optional[str]=None):
+        """Update transcription processing status"""
+        return NotImplementedError
+    
+    @abstractmethod
+    def create_pending_recording(self, interview_id:int, source_url:str, source_key:str = None):
+        """Record a provider recording waiting to be ingested"""
+        return NotImplementedError
+    
+    @abstractmethod
+    def mark_recording_uploading(self, interview_id:int):
+        """Mark recording ingestion as started"""
+        return NotImplementedError
+    
+    @abstractmethod
+    def complete_recording_ingestion(self, interview_id:int, **fields):
+        """Store location and metadata of an ingested recording"""
+        return NotImplementedError
+    
+    @abstractmethod
+    def mark_recording_failed(self, interview_id:int, error:str):
+        """Mark recording ingestion as failed"""
+        return NotImplementedError
+    
     @abstractmethod
     def create_recording(self,
                          interview_id:int,
@@ -216,6 +304,11 @@ class HRRoundRepositoryPort(ABC):
         """Get result by interview"""
         return NotImplementedError
     
+    @abstractmethod
+    def get_interviews_by_ids(self, interview_ids:List[int]):
+        """Get interviews with application, job and result in one query"""
+        return NotImplementedError
+    
     @abstractmethod
     def move_to_next_stage(self,interview_ids:List[int], feedback:str='') -> int:
         """Move qualified candidates to next stage"""
@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from typing import List, Dict
+from datetime import datetime
+
+class InterviewCalendarRepositoryPort(ABC):
+
+    @abstractmethod
+    def get_busy_intervals(self,
+                           interviewer_ids:List[int],
+                           candidate_ids:List[int],
+                           window_start:datetime,
+                           window_end:datetime) -> List[Dict]:
+        """
+        Active telephonic and HR interviews of the given interviewers or
+        candidates that overlap [window_start, window_end).
+        Each interval: {'round', 'interview_id', 'application_id',
+        'interviewer_id', 'candidate_id', 'start', 'end'}
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_application_participants(self, application_ids:List[int]) -> Dict[int, Dict]:
+        """{application_id: {'candidate_id', 'job_id', 'recruiter_id'}}"""
+        raise NotImplementedError
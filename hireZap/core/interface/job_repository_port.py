@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional
 from core.entities.job import Job
 
 class JobRepositoryPort(ABC):
@@ -63,6 +63,18 @@ class JobRepositoryPort(ABC):
     def update_job_status(self, job_id:int, status: str) -> Optional[Job]:
         """ Update job status (active , paused , closed )"""
         raise NotImplementedError
-    
-    
 
+    @abstractmethod
+    def refresh_stage_counters(self, job_id:int):
+        """ Recompute configured_stages_count / has_configured_stages of a job """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_active_job_feed(self, filters: Dict, cursor: Optional[str] = None, limit: int = 20) -> Dict:
+        """ One page of active jobs, newest first: {'jobs', 'next_cursor', 'has_more'} """
+        raise NotImplementedError
+
+    @abstractmethod
+    def invalidate_job_feed(self):
+        """ Drop the cached feed pages """
+        raise NotImplementedError
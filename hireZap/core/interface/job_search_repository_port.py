@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+
+class JobSearchRepositoryPort(ABC):
+
+    @abstractmethod
+    def search(self,
+               query:str,
+               location:Optional[str]=None,
+               work_type:Optional[str]=None,
+               employment_type:Optional[str]=None,
+               limit:int=20,
+               offset:int=0) -> Dict:
+        """
+        Ranked active jobs matching the query.
+        {'total', 'results': [job card + 'rank'],
+         'facets': {'location'|'work_type'|'employment_type': [{'value', 'count'}]}}
+        """
+        raise NotImplementedError
@@ -1,11 +1,26 @@
 from abc import ABC, abstractmethod
-from typing import Dict
+from typing import Dict, Iterable, List, Optional, Tuple
 
 class NotificationServicePort(ABC):
     
     @abstractmethod
     def send_websocket_notification(self, user_id: int, notification_type: str, data: Dict):
-        """Send WebSocket notification to user"""
+        """Queue WebSocket notification to user (delivered once the transaction commits)"""
+        pass
+    
+    @abstractmethod
+    def defer_task(self, task, *args, **kwargs):
+        """Queue a Celery task to run once the transaction commits"""
+        pass
+    
+    @abstractmethod
+    def send_many(self, notifications: Iterable[Tuple[int, str, Dict]]) -> List[Optional[Exception]]:
+        """Send many (user_id, notification_type, data) WebSocket notifications right away"""
+        pass
+    
+    @abstractmethod
+    def buffered(self):
+        """Context manager writing the notifications of a block to the outbox at once"""
         pass
     
     @abstractmethod
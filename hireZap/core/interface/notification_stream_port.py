@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
+
+class NotificationStreamPort(ABC):
+
+    @abstractmethod
+    def append_many(self, notifications:List[Tuple[int, Dict]]) -> List[Optional[str]]:
+        """
+        Record (user_id, channels event) notifications before delivery.
+        Returns the stream id of each (None for transient ones)
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def replay(self, user_id, after_id:Optional[str]=None, limit:int=200) -> List[Tuple[Optional[str], Dict]]:
+        """(stream_id, event) recorded after `after_id` (the latest ones without it), oldest first"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def unread_count(self, user_id) -> Dict:
+        """{'unread_count', 'last_id', 'last_read_id'}"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def mark_read(self, user_id, last_id:Optional[str]=None) -> Optional[str]:
+        """Move the read cursor up to `last_id` (the newest notification without it)"""
+        raise NotImplementedError
@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List
+
+class OutboxRepositoryPort(ABC):
+
+    @abstractmethod
+    def add_messages(self, messages:List[Dict]) -> int:
+        """
+        Store side effects ({'kind', 'destination', 'payload'}) in the current
+        transaction, so they exist only if the state change commits
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def dispatch_due(self,
+                     deliver:Callable[[List[Dict]], Dict[int, str]],
+                     limit:int=200) -> Dict:
+        """
+        Lock up to `limit` due messages, hand them to `deliver` (which returns
+        {message_id: error} for the failed ones), delete the delivered ones and
+        back off the failed ones. Returns {'delivered', 'failed', 'dead'}.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def purge_dead(self, older_than_days:int=7) -> int:
+        """Delete dead messages older than the given age"""
+        raise NotImplementedError
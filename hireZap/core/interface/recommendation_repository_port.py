@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Iterator, List
+
+class RecommendationRepositoryPort(ABC):
+
+    @abstractmethod
+    def refresh_candidate(self, candidate_id:int) -> int:
+        """Recompute the candidate's top jobs; returns how many are stored"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def refresh_job(self, job_id:int) -> int:
+        """Rescore one posted or changed job for the candidates it may suit; returns candidates updated"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_recommendations(self, candidate_id:int, limit:int=20) -> List[Dict]:
+        """Stored recommendations of a candidate, best first"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def candidate_ids(self) -> Iterator[int]:
+        """Every candidate to refresh periodically"""
+        raise NotImplementedError
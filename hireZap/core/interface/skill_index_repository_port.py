@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List
+
+class SkillIndexRepositoryPort(ABC):
+
+    @abstractmethod
+    def index_job(self, job_id:int, skills:List[str]) -> int:
+        """Point the job's skill index at the canonical skills of `skills`; returns their count"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_job_skill_ids(self, job_id:int) -> List[int]:
+        """Canonical skill ids required by the job"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_candidate_skill_ids(self, candidate_id:int) -> List[int]:
+        """Canonical skill ids of the candidate"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def jobs_for_candidate(self, candidate_id:int, limit:int=20) -> List[Dict]:
+        """Active jobs sharing skills with the candidate, most shared first"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def candidates_for_job(self, job_id:int, limit:int=20) -> List[Dict]:
+        """Candidates having skills the job requires, most shared first"""
+        raise NotImplementedError
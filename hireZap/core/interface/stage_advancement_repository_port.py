@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+from typing import List, Dict, Optional
+
+class StageAdvancementRepositoryPort(ABC):
+
+    @abstractmethod
+    def advance_applications(self,
+                             advancements:List[Dict],
+                             next_stage_status:str='started',
+                             application_status:str='qualified',
+                             final_stage_application_status:Optional[str]=None) -> Dict[int, object]:
+        """
+        Move applications to the next active stage of their job in bulk.
+        Each advancement: {'application_id', 'from_stage_id' (optional), 'feedback', 'score' (optional)}
+        Returns {application_id: next_stage} for the applications that moved.
+        """
+        raise NotImplementedError
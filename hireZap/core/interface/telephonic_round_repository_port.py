@@ -73,6 +73,19 @@ class TelephonicRoundRepositoryPort(ABC):
         """Create interview records for multiple applications"""
         return NotImplementedError
     
+    @abstractmethod
+    def get_interview_statuses_by_application(self, application_ids:List[int]):
+        """Map application id to its interview status"""
+        return NotImplementedError
+    
+    @abstractmethod
+    def bulk_schedule_interviews(self,
+                                 schedules:List[Dict],
+                                 notification_sent:bool=False,
+                                 email_sent:bool=False):
+        """Upsert scheduled interviews for many applications"""
+        return NotImplementedError
+    
     @abstractmethod
     def create_call_session(self,interview_id:int, session_id:str,caller_id:str,callee_id:str):
         """Create call session"""
@@ -104,8 +117,44 @@ class TelephonicRoundRepositoryPort(ABC):
                              full_text:str,
                              segments:List[Dict],
                              detected_language:str='en',
-                             confidence:Optional[float]=None):
-        """Create transcription record"""
+                             confidence:Optional[float]=None,
+                             model_used:Optional[str]=None,
+                             processing_time_seconds:Optional[float]=None,
+                             audio_sha256:Optional[str]=None):
+        """Create or replace transcription record"""
+        return NotImplementedError
+    
+    @abstractmethod
+    def get_completed_transcription_by_hash(self, audio_sha256:str):
+        """Find a completed transcription of identical audio"""
+        return NotImplementedError
+    
+    @abstractmethod
+    def get_transcription(self, interview_id:int):
+        """Get transcription for an interview"""
+        return NotImplementedError
+    
+    @abstractmethod
+    def start_transcription(self, interview_id:int, model_used:str, audio_sha256:Optional[str]=None):
+        """Create or reopen an in-progress transcription"""
+        return NotImplementedError
+    
+    @abstractmethod
+    def append_transcription_segments(self,
+                                      interview_id:int,
+                                      segments:List[Dict],
+                                      progress_percent:int):
+        """Append a batch of transcribed segments"""
+        return NotImplementedError
+    
+    @abstractmethod
+    def complete_transcription(self,
+                               interview_id:int,
+                               detected_language:str,
+                               confidence:Optional[float]=None,
+                               model_used:Optional[str]=None,
+                               processing_time_seconds:Optional[float]=None):
+        """Mark transcription as completed"""
         return NotImplementedError
     
     @abstractmethod
@@ -140,11 +189,26 @@ class TelephonicRoundRepositoryPort(ABC):
         """Get performance result"""
         return NotImplementedError
     
+    @abstractmethod
+    def get_reanalyzable_interview_ids(self, job_id:int):
+        """Completed interviews of a job with a stored transcript"""
+        return NotImplementedError
+    
     @abstractmethod
     def get_job_interview_stats(self, job_id:int):
         """Get statistics for a job"""
         return NotImplementedError
     
+    @abstractmethod
+    def invalidate_job_stats(self, job_id:int):
+        """Drop cached statistics for a job"""
+        return NotImplementedError
+    
+    @abstractmethod
+    def get_interviews_by_ids(self, interview_ids:List[int]):
+        """Get interviews with application, job and result in one query"""
+        return NotImplementedError
+    
     @abstractmethod
     def move_to_next_stage(self,
                            interview_ids:List[int],
@@ -153,11 +217,11 @@ class TelephonicRoundRepositoryPort(ABC):
         return NotImplementedError
     
     @abstractmethod
-    def get_upcoming_interviews_for_reminder(self, hours_before:int=24):
-        """Get interviews that need reminders"""
+    def get_interviews_due_for_reminder(self, interview_ids:List[int]):
+        """Get the interviews of a reminder batch that still need a reminder"""
         return NotImplementedError
     
     @abstractmethod
-    def mark_reminder_sent(self,interview_id:int):
-        """Mark reminder as sent"""
+    def mark_reminders_sent(self,interview_ids:List[int]):
+        """Mark reminders as sent"""
         return NotImplementedError
\ No newline at end of file
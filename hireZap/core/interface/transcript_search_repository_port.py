@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from typing import List, Dict, Optional
+
+class TranscriptSearchRepositoryPort(ABC):
+
+    @abstractmethod
+    def index_segments(self,
+                       round_type:str,
+                       interview_id:int,
+                       job_id:int,
+                       segments:List[Dict]) -> int:
+        """Add transcript segments ({'start', 'end', 'text'} in seconds) to the index"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear_segments(self, round_type:str, interview_id:int):
+        """Remove every indexed segment of an interview"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def search(self,
+               query:str,
+               recruiter_id:int,
+               round_type:Optional[str]=None,
+               job_id:Optional[int]=None,
+               interview_id:Optional[int]=None,
+               limit:int=20) -> List[Dict]:
+        """
+        Ranked matching segments of the recruiter's jobs.
+        Each hit: {'round', 'interview_id', 'job_id', 'start_ms', 'end_ms',
+        'text', 'headline', 'rank'}
+        """
+        raise NotImplementedError
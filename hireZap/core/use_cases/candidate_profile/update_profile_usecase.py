@@ -21,7 +21,8 @@ class UpdateProfileUsecase:
             github_url=profile_data.get("github_url", existing_profile.github_url),
             location=profile_data.get("location", existing_profile.location),
             resume_url=profile_data.get("resume_url", existing_profile.resume_url),
-            website=profile_data.get("website", existing_profile.website)
+            website=profile_data.get("website", existing_profile.website),
+            preferred_work_type=profile_data.get("preferred_work_type", existing_profile.preferred_work_type)
         )
         saved_profile = self.candidate_repository.update_profile(updated_profile)
         if not saved_profile:
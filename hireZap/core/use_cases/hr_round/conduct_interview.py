@@ -64,7 +64,7 @@ class StartMeetingUseCase:
             # Check if session already exists
             existing_session = self.repo.get_meeting_session_by_interview(interview_id)
             if existing_session and not existing_session.ended_at:
-                recruiter_token = MeetingService.generate_zegocloud_token(
+                recruiter_token = MeetingService.get_zegocloud_token(
                     user_id=str(recruiter_id),
                     room_id=existing_session.room_id
                 )
@@ -92,12 +92,12 @@ class StartMeetingUseCase:
             # Update interview status
             self.repo.update_interview_status(interview_id, 'in_progress')
             
-            recruiter_token = MeetingService.generate_zegocloud_token(
+            recruiter_token = MeetingService.get_zegocloud_token(
                 user_id=str(recruiter_id),
                 room_id=session.room_id
             )
             
-            candidate_token = MeetingService.generate_zegocloud_token(
+            candidate_token = MeetingService.get_zegocloud_token(
                 user_id=str(interview.application.candidate_id),
                 room_id=session.room_id
             )
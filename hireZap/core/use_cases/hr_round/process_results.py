@@ -1,5 +1,6 @@
 from typing import Dict, List
 from django.utils import timezone
+from django.db import transaction
 from core.interface.hr_round_repository_port import HRRoundRepositoryPort
 from infrastructure.repositories.hr_round_repository import HRInterviewRepository
 from infrastructure.services.notification_service import NotificationService
@@ -71,45 +72,48 @@ class FinalizeResultUseCase:
                         'error': f'Score {final_score} is below minimum threshold {min_score}'
                     }
             
-            # Create result
-            result = self.repo.create_or_update_result(
-                interview_id=interview_id,
-                final_score=final_score,
-                decision=decision,
-                decided_by_id=decided_by_id,
-                decision_reason=decision_reason,
-                next_steps=next_steps
-            )
+            from hr_round.tasks import send_hr_interview_result_email_task
+
+            # Result, application status, notifications and email commit together (outbox)
+            with transaction.atomic():
+                # Create result
+                result = self.repo.create_or_update_result(
+                    interview_id=interview_id,
+                    final_score=final_score,
+                    decision=decision,
+                    decided_by_id=decided_by_id,
+                    decision_reason=decision_reason,
+                    next_steps=next_steps
+                )
             
-            # Update application status
-            application = interview.application
+                # Update application status
+                application = interview.application
             
-            if decision == 'qualified':
-                application.current_stage_status = 'qualified'
-                application.status = 'qualified'
-            else:
-                application.current_stage_status = 'rejected'
-                application.status = 'rejected'
+                if decision == 'qualified':
+                    application.current_stage_status = 'qualified'
+                    application.status = 'qualified'
+                else:
+                    application.current_stage_status = 'rejected'
+                    application.status = 'rejected'
             
-            application.save(update_fields=['current_stage_status', 'status', 'updated_at'])
+                application.save(update_fields=['current_stage_status', 'status', 'updated_at'])
             
-            from application.models import ApplicationStageHistory
-            history_status = 'qualified' if decision == 'qualified' else 'rejected'
+                from application.models import ApplicationStageHistory
+                history_status = 'qualified' if decision == 'qualified' else 'rejected'
 
-            ApplicationStageHistory.objects.filter(
-                application=application,
-                stage=interview.stage,
-            ).update(
-                status=history_status,
-                completed_at=timezone.now(),
-                feedback=decision_reason or '',
-            )
-            # Send notifications
-            self._send_result_notifications(interview, result)
+                ApplicationStageHistory.objects.filter(
+                    application=application,
+                    stage=interview.stage,
+                ).update(
+                    status=history_status,
+                    completed_at=timezone.now(),
+                    feedback=decision_reason or '',
+                )
+                # Send notifications
+                self._send_result_notifications(interview, result)
             
-            # Send email
-            from hr_round.tasks import send_hr_interview_result_email_task
-            send_hr_interview_result_email_task.delay(interview_id)
+                # Send email
+                self.notification_service.defer_task(send_hr_interview_result_email_task, interview_id)
             
             logger.info(f" Result finalized for interview {interview_id}: {decision} - {final_score}/100")
             
@@ -190,12 +194,13 @@ class MoveToNextStageUseCase:
             logger.error(f"move_to_next_stage repository error: {str(e)}")
             return {'success': False, 'error': f'Failed to move candidates: {str(e)}'}
 
-        # 3. Get next stage name for response
-        next_stage_name = self._get_next_stage_name(interview_ids[0])
+        # 3. Reload once after the move for the response and notifications
+        interviews = self.repository.get_interviews_by_ids(interview_ids)
+        next_stage_name = self._get_next_stage_name(interviews)
 
         # 4. Send notifications
         self._send_stage_transition_notifications(
-            interview_ids=interview_ids,
+            interviews=interviews,
             next_stage_name=next_stage_name
         )
 
@@ -209,9 +214,13 @@ class MoveToNextStageUseCase:
 
     def _validate_interviews(self, interview_ids: List[int]) -> Dict:
         invalid = []
+        interviews = {
+            interview.id: interview
+            for interview in self.repository.get_interviews_by_ids(interview_ids)
+        }
 
         for interview_id in interview_ids:
-            interview = self.repository.get_interview_by_id(interview_id)
+            interview = interviews.get(interview_id)
 
             if not interview:
                 invalid.append({'interview_id': interview_id, 'reason': 'Interview not found'})
@@ -224,7 +233,7 @@ class MoveToNextStageUseCase:
                 })
                 continue
 
-            result = self.repository.get_result_by_interview(interview_id)
+            result = getattr(interview, 'result', None)
             if not result:
                 invalid.append({'interview_id': interview_id, 'reason': 'No result found'})
                 continue
@@ -244,10 +253,10 @@ class MoveToNextStageUseCase:
 
         return {'valid': True}
 
-    def _get_next_stage_name(self, sample_interview_id: int) -> str:
+    def _get_next_stage_name(self, interviews: List) -> str:
         """Get next stage name from a sample interview for the response message."""
         try:
-            interview = self.repository.get_interview_by_id(sample_interview_id)
+            interview = interviews[0] if interviews else None
             if interview and interview.application.current_stage:
                 return interview.application.current_stage.name
             return 'Next Stage'
@@ -256,33 +265,31 @@ class MoveToNextStageUseCase:
 
     def _send_stage_transition_notifications(
         self,
-        interview_ids: List[int],
+        interviews: List,
         next_stage_name: str
     ):
-        for interview_id in interview_ids:
-            try:
-                interview = self.repository.get_interview_by_id(interview_id)
-                if not interview:
-                    continue
-
-                # WebSocket
-                self.notification_service.send_websocket_notification(
-                    user_id=interview.application.candidate_id,
-                    notification_type='stage_progression',
-                    data={
-                        'application_id': interview.application.id,
-                        'job_title':      interview.job.job_title,
-                        'previous_stage': 'HR Round',
-                        'next_stage':     next_stage_name,
-                        'message':        f"Congratulations! You've been moved to {next_stage_name}"
-                    }
-                )
+        with self.notification_service.buffered():
+            for interview in interviews:
+                interview_id = interview.id
+                try:
+                    # WebSocket
+                    self.notification_service.send_websocket_notification(
+                        user_id=interview.application.candidate_id,
+                        notification_type='stage_progression',
+                        data={
+                            'application_id': interview.application.id,
+                            'job_title':      interview.job.job_title,
+                            'previous_stage': 'HR Round',
+                            'next_stage':     next_stage_name,
+                            'message':        f"Congratulations! You've been moved to {next_stage_name}"
+                        }
+                    )
 
-                # Email (async)
-                self._send_progression_email(interview, next_stage_name)
+                    # Email (async)
+                    self._send_progression_email(interview, next_stage_name)
 
-            except Exception as e:
-                logger.error(f"Failed to notify candidate for interview {interview_id}: {str(e)}")
+                except Exception as e:
+                    logger.error(f"Failed to notify candidate for interview {interview_id}: {str(e)}")
 
     def _send_progression_email(self, interview, next_stage_name: str):
         try:
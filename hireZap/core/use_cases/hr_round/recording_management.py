@@ -1,8 +1,7 @@
-from typing import Dict, BinaryIO
+from typing import Dict, List, BinaryIO
 from core.interface.hr_round_repository_port import HRRoundRepositoryPort
 from infrastructure.services.hr_round_service import VideoProcessingService
 from infrastructure.services.notification_service import NotificationService
-from hr_round.models import MeetingSession
 import logging
 logger = logging.getLogger(__name__)
 
@@ -133,6 +132,8 @@ class DeleteRecordingUseCase:
 class ProcessZegoCloudWebhookUseCase:
     """Handle ZegoCloud webhooks"""
     
+    EVENT_TYPES = ('recording.completed', 'message.sent', 'room.user_joined', 'room.user_left')
+    
     def __init__(
         self,
         repository: HRRoundRepositoryPort,
@@ -151,75 +152,104 @@ class ProcessZegoCloudWebhookUseCase:
         - room.user_joined
         - room.user_left
         """
-        try:
-            event_type = webhook_data.get('event_type')
-            
-            if event_type == 'recording.completed':
-                return self._handle_recording_completed(webhook_data)
-            
-            elif event_type == 'message.sent':
-                return self._handle_message_sent(webhook_data)
+        result = self.process_batch([webhook_data])
+        if result['failed']:
+            return {'success': False, 'error': result['errors'][0]}
+        if not result['processed']:
+            return {'success': True, 'message': 'Event ignored'}
+        return {'success': True}
+    
+    def process_batch(self, events: List[dict], event_ids: List = None) -> Dict:
+        """
+        Process a batch of buffered webhook events.
+        Rooms are resolved through the cache and chat messages are written with
+        one bulk insert; recordings are handled one by one.
+        failed_ids holds the id (event_ids entry, else position) of every
+        event that failed and should be retried.
+        """
+        if event_ids is None:
+            event_ids = list(range(len(events)))
+        room_ids = [event.get('room_id') for event in events if event.get('room_id')]
+        rooms = self.repo.get_meeting_rooms(room_ids) if room_ids else {}
+        
+        processed = 0
+        errors = []
+        failed_ids = []
+        messages = []
+        message_ids = []
+        
+        for event_id, event in zip(event_ids, events):
+            event_type = event.get('event_type')
             
-            elif event_type == 'room.user_joined':
-                return self._handle_user_joined(webhook_data)
+            if event_type not in self.EVENT_TYPES:
+                continue
             
-            elif event_type == 'room.user_left':
-                return self._handle_user_left(webhook_data)
+            room = rooms.get(event.get('room_id'))
+            if room is None:
+                errors.append(f"No meeting session for room {event.get('room_id')}")
+                failed_ids.append(event_id)
+                continue
             
-            return {'success': True, 'message': 'Event ignored'}
+            try:
+                if event_type == 'recording.completed':
+                    self._handle_recording_completed(event, room)
+                
+                elif event_type == 'message.sent':
+                    messages.append({'interview_id': room['interview_id'], 'message_data': event})
+                    message_ids.append(event_id)
+                    continue
+                
+                elif event_type == 'room.user_joined':
+                    self._handle_user_joined(event)
+                
+                elif event_type == 'room.user_left':
+                    self._handle_user_left(event)
+                
+                processed += 1
             
-        except Exception as e:
-            return {'success': False, 'error': str(e)}
+            except Exception as e:
+                logger.error(f" Failed to process ZegoCloud {event_type} event: {e}")
+                errors.append(str(e))
+                failed_ids.append(event_id)
+        
+        if messages:
+            try:
+                self.repo.bulk_save_zegocloud_chat_messages(messages)
+                processed += len(messages)
+            except Exception as e:
+                logger.error(f" Failed to save {len(messages)} ZegoCloud chat messages: {e}")
+                errors.extend(str(e) for _ in message_ids)
+                failed_ids.extend(message_ids)
+        
+        return {
+            'success': not errors,
+            'processed': processed,
+            'failed': len(errors),
+            'errors': errors,
+            'failed_ids': failed_ids
+        }
     
-    def _handle_recording_completed(self, data: dict) -> Dict:
+    def _handle_recording_completed(self, data: dict, room: dict) -> Dict:
         """Handle recording completion webhook"""
-        room_id = data.get('room_id')
         recording_url = data.get('recording_url')
         recording_id = data.get('recording_id')
         
-        # Find session
-        session = MeetingSession.objects.get(room_id=room_id)
-        
         # Save recording URL
         self.repo.save_zegocloud_recording(
-            session_id=session.session_id,
+            session_id=room['session_id'],
             recording_url=recording_url,
             recording_id=recording_id
         )
         
-        # Create recording record
-        from hr_round.models import InterviewRecording
-        InterviewRecording.objects.create(
-            interview_id=session.interview_id,
-            video_url=recording_url,
-            video_key=recording_id,
-            processing_status='completed'
-        )
-        
-        # Notify recruiter
-        self.notification_service.send_websocket_notification(
-            user_id=session.interview.conducted_by_id,
-            notification_type='recording_uploaded',
-            data={
-                'interview_id': session.interview_id,
-                'recording_url': recording_url
-            }
+        # Record it and stream it into storage in the background
+        self.repo.create_pending_recording(
+            interview_id=room['interview_id'],
+            source_url=recording_url,
+            source_key=recording_id
         )
         
-        return {'success': True}
-    
-    def _handle_message_sent(self, data: dict) -> Dict:
-        """Handle chat message webhook"""
-        room_id = data.get('room_id')
-        
-        # Find session
-        session = MeetingSession.objects.get(room_id=room_id)
-        
-        # Save message
-        self.repo.save_zegocloud_chat_message(
-            interview_id=session.interview_id,
-            message_data=data
-        )
+        from hr_round.tasks import ingest_zegocloud_recording_task
+        ingest_zegocloud_recording_task.delay(room['interview_id'])
         
         return {'success': True}
     
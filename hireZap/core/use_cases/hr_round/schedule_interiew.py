@@ -1,10 +1,11 @@
 from typing import Dict, List
 from django.utils import timezone
+from django.db import transaction
 from datetime import timedelta
 from core.interface.hr_round_repository_port import HRRoundRepositoryPort
+from core.interface.interview_calendar_repository_port import InterviewCalendarRepositoryPort
+from core.use_cases.interview_calendar.check_schedule_conflicts_usecase import CheckScheduleConflictsUseCase
 from infrastructure.services.notification_service import NotificationService
-from channels.layers import get_channel_layer
-from asgiref.sync import async_to_sync
 import logging
 
 logger = logging.getLogger(__name__)
@@ -13,9 +14,11 @@ class ScheduleInterviewUsecase:
 
     def __init__(self, 
                  repository: HRRoundRepositoryPort, 
-                 notification_service: NotificationService):
+                 notification_service: NotificationService,
+                 calendar_repository: InterviewCalendarRepositoryPort = None):
         self.repo = repository  
         self.notification_service = notification_service
+        self.calendar_repository = calendar_repository
         
     def execute(
         self,
@@ -32,22 +35,43 @@ class ScheduleInterviewUsecase:
                     'success': False,
                     'error': 'Scheduled time must be in the future'
                 }
+
+            # Reject overlaps with the interviewer's or candidate's other interviews
+            if self.calendar_repository:
+                conflict_check = CheckScheduleConflictsUseCase(self.calendar_repository).execute(
+                    [{
+                        'application_id': application_id,
+                        'scheduled_at': scheduled_at,
+                        'duration': duration_minutes,
+                        'interviewer_id': conducted_by_id
+                    }],
+                    round_name='hr'
+                )
+                conflicts = conflict_check['conflicts'].get(application_id)
+                if conflicts:
+                    return {
+                        'success': False,
+                        'error': CheckScheduleConflictsUseCase.describe(conflicts),
+                        'conflicts': conflicts
+                    }
             
-            # Schedule interview
-            interview = self.repo.schedule_interview(
-                application_id=application_id,
-                scheduled_at=scheduled_at,
-                duration_minutes=duration_minutes,
-                timezone_str=timezone_str,
-                conducted_by_id=conducted_by_id,
-                scheduling_notes=scheduling_notes
-            )
-            
-            self._send_notifications(interview)
-            
-            # Send email (async via Celery)
-            from hr_round.tasks import send_hr_interview_scheduled_email_task
-            send_hr_interview_scheduled_email_task.delay(interview.id)
+            from hr_round.tasks import send_hr_interview_scheduled_email_task, schedule_hr_interview_reminders
+
+            # Interview, notifications and email land in one transaction (outbox)
+            with transaction.atomic():
+                interview = self.repo.schedule_interview(
+                    application_id=application_id,
+                    scheduled_at=scheduled_at,
+                    duration_minutes=duration_minutes,
+                    timezone_str=timezone_str,
+                    conducted_by_id=conducted_by_id,
+                    scheduling_notes=scheduling_notes
+                )
+                
+                self._send_notifications(interview)
+                self.notification_service.defer_task(send_hr_interview_scheduled_email_task, interview.id)
+
+            schedule_hr_interview_reminders([interview.id])
             
             logger.info(f" HR Interview scheduled for {interview.candidate_name} on {scheduled_at}")
             
@@ -66,13 +90,11 @@ class ScheduleInterviewUsecase:
         
     def _send_notifications(self, interview):
         """Send WebSocket notifications via Channels"""
-        channel_layer = get_channel_layer()
-        
         #Send to candidate
-        async_to_sync(channel_layer.group_send)(
-            f'user_{interview.application.candidate_id}',
-            {
-                'type': 'hr_interview_scheduled', 
+        self.notification_service.send_websocket_notification(
+            user_id=interview.application.candidate_id,
+            notification_type='hr_interview_scheduled',
+            data={
                 'message': f'Your HR interview for {interview.job.job_title} has been scheduled',
                 'data': {
                     'interview_id': interview.id,
@@ -90,10 +112,10 @@ class ScheduleInterviewUsecase:
         logger.info(f"WebSocket notification sent to candidate {interview.application.candidate_id}")
         
         # ✅ Send to recruiter
-        async_to_sync(channel_layer.group_send)(
-            f'user_{interview.conducted_by_id}',
-            {
-                'type': 'hr_interview_scheduled', 
+        self.notification_service.send_websocket_notification(
+            user_id=interview.conducted_by_id,
+            notification_type='hr_interview_scheduled',
+            data={
                 'message': f'Interview scheduled with {interview.candidate_name}',
                 'data': {
                     'interview_id': interview.id,
@@ -115,13 +137,18 @@ class ScheduleInterviewUsecase:
 
 
 class BulkScheduleHRInterviewUsecase:
+    # Interviews in these states can still be (re)scheduled
+    SCHEDULABLE_STATUSES = ['not_scheduled', 'scheduled']
+
     def __init__(
         self,
         repository: HRRoundRepositoryPort,
-        notification_service: NotificationService):
+        notification_service: NotificationService,
+        calendar_repository: InterviewCalendarRepositoryPort = None):
         
         self.repo = repository
         self.notification_service = notification_service
+        self.calendar_repository = calendar_repository
 
     def execute(
         self,
@@ -133,57 +160,124 @@ class BulkScheduleHRInterviewUsecase:
         scheduling_notes: str = None,
         interval_minutes: int = 0) -> Dict:
 
-        scheduled_interviews = []
         errors = []
-        current_time = scheduled_at
-        
-        for index, app_id in enumerate(application_ids):
-            # Calculate time for this interview
-            if interval_minutes > 0 and index > 0:
-                current_time = scheduled_at + timedelta(minutes=interval_minutes * index)
-            
-            # Create ScheduleInterviewUsecase for each interview
-            schedule_use_case = ScheduleInterviewUsecase(
-                repository=self.repo,
-                notification_service=self.notification_service
-            )
-            
-            result = schedule_use_case.execute(
-                application_id=app_id,
-                scheduled_at=current_time,
-                duration_minutes=duration_minutes,
-                timezone_str=timezone_str,
-                conducted_by_id=conducted_by_id,
-                scheduling_notes=scheduling_notes
-            )
-            
-            if result['success']:
-                scheduled_interviews.append(result['interview'])
-            else:
+        application_ids = list(dict.fromkeys(application_ids))
+
+        if scheduled_at <= timezone.now():
+            errors = [{'application_id': app_id, 'error': 'Scheduled time must be in the future'} for app_id in application_ids]
+            return self._result([], errors)
+
+        # 1. Validate the whole batch up front. Slots start interval_minutes
+        #    apart (back to back by default) so the batch never overlaps itself
+        step_minutes = max(interval_minutes, duration_minutes)
+        schedules = [
+            {
+                'application_id': app_id,
+                'scheduled_at': scheduled_at + timedelta(minutes=step_minutes * index),
+                'duration': duration_minutes,
+                'interviewer_id': conducted_by_id
+            }
+            for index, app_id in enumerate(application_ids)
+        ]
+        schedules = self._validate_schedules(schedules, errors)
+
+        # 2. One bulk write for every valid interview; notifications and
+        #    emails go to the outbox in the same transaction
+        interviews = []
+        if schedules:
+            try:
+                with transaction.atomic():
+                    interview_ids = self.repo.bulk_schedule_interviews(
+                        schedules,
+                        duration_minutes=duration_minutes,
+                        timezone_str=timezone_str,
+                        conducted_by_id=conducted_by_id,
+                        scheduling_notes=scheduling_notes
+                    )
+                    interviews = self.repo.get_interviews_by_ids(interview_ids)
+                    self._send_notifications(interviews)
+            except Exception as e:
+                logger.error(f" Bulk HR scheduling error: {str(e)}")
+                errors.extend({'application_id': schedule['application_id'], 'error': str(e)} for schedule in schedules)
+                return self._result([], errors)
+
+        scheduled_application_ids = {interview.application_id for interview in interviews}
+        for schedule in schedules:
+            if schedule['application_id'] not in scheduled_application_ids:
+                errors.append({'application_id': schedule['application_id'], 'error': 'Application not found'})
+
+        # 3. Reminders for the scheduled interviews
+        if interviews:
+            from hr_round.tasks import schedule_hr_interview_reminders
+            schedule_hr_interview_reminders([interview.id for interview in interviews])
+
+        logger.info(f"✅ Bulk scheduling complete: {len(interviews)} scheduled, {len(errors)} failed")
+        return self._result(interviews, errors)
+
+    def _validate_schedules(self, schedules: List[Dict], errors: List[Dict]) -> List[Dict]:
+        statuses = self.repo.get_interview_statuses_by_application(
+            [schedule['application_id'] for schedule in schedules]
+        )
+        valid = []
+        for schedule in schedules:
+            current_status = statuses.get(schedule['application_id'])
+            if current_status and current_status not in self.SCHEDULABLE_STATUSES:
                 errors.append({
-                    'application_id': app_id,
-                    'error': result['error']
+                    'application_id': schedule['application_id'],
+                    'error': f'Interview cannot be scheduled. Current status: {current_status}'
                 })
-        
-        logger.info(f"✅ Bulk scheduling complete: {len(scheduled_interviews)} scheduled, {len(errors)} failed")
-        
+                continue
+            valid.append(schedule)
+
+        if not self.calendar_repository or not valid:
+            return valid
+
+        # Overlaps with existing interviews and within the batch itself
+        conflicts = CheckScheduleConflictsUseCase(self.calendar_repository).execute(valid, round_name='hr')['conflicts']
+        free = []
+        for schedule in valid:
+            if schedule['application_id'] in conflicts:
+                errors.append({
+                    'application_id': schedule['application_id'],
+                    'error': CheckScheduleConflictsUseCase.describe(conflicts[schedule['application_id']]),
+                    'conflicts': conflicts[schedule['application_id']]
+                })
+                continue
+            free.append(schedule)
+        return free
+
+    def _send_notifications(self, interviews):
+        from hr_round.tasks import send_hr_interview_scheduled_email_task
+
+        notifier = ScheduleInterviewUsecase(self.repo, self.notification_service)
+        with self.notification_service.buffered():
+            for interview in interviews:
+                try:
+                    notifier._send_notifications(interview)
+                    self.notification_service.defer_task(send_hr_interview_scheduled_email_task, interview.id)
+                except Exception as e:
+                    logger.error(f" Scheduling notification failed for HR interview {interview.id}: {str(e)}")
+
+    def _result(self, interviews, errors) -> Dict:
         return {
             'success': len(errors) == 0,
-            'scheduled_count': len(scheduled_interviews),
+            'scheduled_count': len(interviews),
             'failed_count': len(errors),
-            'interviews': scheduled_interviews,
+            'interviews': interviews,
             'errors': errors,
-            'message': f'{len(scheduled_interviews)} interviews scheduled successfully'
+            'message': f'{len(interviews)} interviews scheduled successfully'
         }
     
 class RescheduleHRInterviewUsecase:
     def __init__(
         self,
         repository: HRRoundRepositoryPort,
-        notification_service: NotificationService):
+        notification_service: NotificationService,
+        calendar_repository: InterviewCalendarRepositoryPort = None):
         
         self.repo = repository
         self.notification_service = notification_service
+        self.calendar_repository = calendar_repository
 
     def execute(
         self,
@@ -212,6 +306,24 @@ class RescheduleHRInterviewUsecase:
                     'error': f'Cannot reschedule interview with status: {interview.status}'
                 }
             
+            if self.calendar_repository:
+                conflict_check = CheckScheduleConflictsUseCase(self.calendar_repository).execute(
+                    [{
+                        'application_id': interview.application_id,
+                        'scheduled_at': new_scheduled_at,
+                        'duration': new_duration_minutes or interview.scheduled_duration_minutes,
+                        'interviewer_id': interview.conducted_by_id
+                    }],
+                    round_name='hr'
+                )
+                conflicts = conflict_check['conflicts'].get(interview.application_id)
+                if conflicts:
+                    return {
+                        'success': False,
+                        'error': CheckScheduleConflictsUseCase.describe(conflicts),
+                        'conflicts': conflicts
+                    }
+            
             # Update interview
             old_time = interview.scheduled_at
             interview.scheduled_at = new_scheduled_at
@@ -220,13 +332,17 @@ class RescheduleHRInterviewUsecase:
             if reschedule_reason:
                 interview.scheduling_notes = f"Rescheduled: {reschedule_reason}\n{interview.scheduling_notes or ''}"
             interview.reminder_sent = False  # Reset reminder
-            interview.save()
-            
-            self._send_reschedule_notifications(interview, old_time)
-            
-            # Send email
-            from hr_round.tasks import send_hr_interview_scheduled_email_task
-            send_hr_interview_scheduled_email_task.delay(interview.id)
+
+            from hr_round.tasks import schedule_hr_interview_reminders, send_hr_interview_scheduled_email_task
+
+            # New time, notifications and email commit together (outbox)
+            with transaction.atomic():
+                interview.save()
+                self._send_reschedule_notifications(interview, old_time)
+                self.notification_service.defer_task(send_hr_interview_scheduled_email_task, interview.id)
+
+            # Move the pending reminder to the new time
+            schedule_hr_interview_reminders([interview.id])
             
             logger.info(f"✅ Interview rescheduled from {old_time} to {new_scheduled_at}")
             
@@ -245,12 +361,10 @@ class RescheduleHRInterviewUsecase:
     
     def _send_reschedule_notifications(self, interview, old_time):
         """Send reschedule notifications via Channels"""
-        channel_layer = get_channel_layer()
-        
-        async_to_sync(channel_layer.group_send)(
-            f'user_{interview.application.candidate_id}',
-            {
-                'type': 'hr_interview_rescheduled', 
+        self.notification_service.send_websocket_notification(
+            user_id=interview.application.candidate_id,
+            notification_type='hr_interview_rescheduled',
+            data={
                 'message': f'Your HR interview has been rescheduled',
                 'data': {
                     'interview_id': interview.id,
@@ -264,10 +378,10 @@ class RescheduleHRInterviewUsecase:
         )
         
         # To recruiter
-        async_to_sync(channel_layer.group_send)(
-            f'user_{interview.conducted_by_id}',
-            {
-                'type': 'hr_interview_rescheduled', 
+        self.notification_service.send_websocket_notification(
+            user_id=interview.conducted_by_id,
+            notification_type='hr_interview_rescheduled',
+            data={
                 'message': f'Interview with {interview.candidate_name} rescheduled',
                 'data': {
                     'interview_id': interview.id,
@@ -298,6 +412,9 @@ class CancelHRInterviewUsecase:
                 reason=cancellation_reason
             )
             
+            from hr_round.tasks import cancel_hr_interview_reminder
+            cancel_hr_interview_reminder(interview.id)
+            
             self._send_cancellation_notifications(interview, cancelled_by_id)
             
             # Send email
@@ -320,13 +437,11 @@ class CancelHRInterviewUsecase:
     
     def _send_cancellation_notifications(self, interview, cancelled_by_id):
         """Send cancellation notifications via Channels"""
-        channel_layer = get_channel_layer()
-        
         # To candidate
-        async_to_sync(channel_layer.group_send)(
-            f'user_{interview.application.candidate_id}',
-            {
-                'type': 'hr_interview_cancelled',
+        self.notification_service.send_websocket_notification(
+            user_id=interview.application.candidate_id,
+            notification_type='hr_interview_cancelled',
+            data={
                 'message': 'Your HR interview has been cancelled',
                 'data': {
                     'interview_id': interview.id,
@@ -339,10 +454,10 @@ class CancelHRInterviewUsecase:
         
         # To recruiter (if cancelled by someone else)
         if cancelled_by_id != interview.conducted_by_id:
-            async_to_sync(channel_layer.group_send)(
-                f'user_{interview.conducted_by_id}',
-                {
-                    'type': 'hr_interview_cancelled', 
+            self.notification_service.send_websocket_notification(
+                user_id=interview.conducted_by_id,
+                notification_type='hr_interview_cancelled',
+                data={
                     'message': f'Interview with {interview.candidate_name} cancelled',
                     'data': {
                         'interview_id': interview.id,
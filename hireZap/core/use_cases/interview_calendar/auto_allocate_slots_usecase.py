@@ -0,0 +1,74 @@
+"""
+core/use_cases/interview_calendar/auto_allocate_slots_usecase.py
+"""
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime
+from core.interface.interview_calendar_repository_port import InterviewCalendarRepositoryPort
+from infrastructure.services.interview_calendar_service import InterviewCalendar
+
+
+class AutoAllocateSlotsUseCase:
+    """
+    Pack N applications into an interviewer's availability windows in one
+    call. Slots avoid the interviewer's and every candidate's existing
+    interviews; nothing is written - the caller schedules the result.
+    """
+
+    def __init__(self, calendar_repository: InterviewCalendarRepositoryPort):
+        self.calendar_repository = calendar_repository
+
+    def execute(
+        self,
+        application_ids: List[int],
+        windows: List[Tuple[datetime, datetime]],
+        duration_minutes: int,
+        round_name: str,
+        buffer_minutes: int = 0,
+        interviewer_id: Optional[int] = None) -> Dict:
+
+        if not windows:
+            return {'success': False, 'error': 'At least one availability window is required'}
+
+        for window_start, window_end in windows:
+            if window_end <= window_start:
+                return {'success': False, 'error': 'Window end must be after window start'}
+
+        participants = self.calendar_repository.get_application_participants(application_ids)
+        missing = [app_id for app_id in application_ids if app_id not in participants]
+        found_ids = [app_id for app_id in dict.fromkeys(application_ids) if app_id in participants]
+
+        if not found_ids:
+            return {'success': False, 'error': 'No applications found'}
+
+        if not interviewer_id:
+            recruiters = {participants[app_id]['recruiter_id'] for app_id in found_ids}
+            if len(recruiters) != 1:
+                return {'success': False, 'error': 'Applications belong to different recruiters'}
+            interviewer_id = recruiters.pop()
+
+        busy = self.calendar_repository.get_busy_intervals(
+            interviewer_ids=[interviewer_id],
+            candidate_ids=[participants[app_id]['candidate_id'] for app_id in found_ids],
+            window_start=min(start for start, _ in windows),
+            window_end=max(end for _, end in windows)
+        )
+        # Re-allocating already scheduled interviews of this round frees their old slot
+        calendar = InterviewCalendar(busy, exclude={(round_name, app_id) for app_id in found_ids})
+
+        allocations, unallocated = calendar.allocate(
+            interviewer_id,
+            [(app_id, participants[app_id]['candidate_id']) for app_id in found_ids],
+            windows,
+            duration_minutes=duration_minutes,
+            buffer_minutes=buffer_minutes
+        )
+
+        return {
+            'success': True,
+            'interviewer_id': interviewer_id,
+            'allocations': allocations,
+            'unallocated': unallocated,
+            'not_found': missing,
+            'allocated_count': len(allocations),
+            'message': f'Allocated {len(allocations)} out of {len(application_ids)} interviews'
+        }
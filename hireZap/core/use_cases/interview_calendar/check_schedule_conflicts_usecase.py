@@ -0,0 +1,79 @@
+"""
+core/use_cases/interview_calendar/check_schedule_conflicts_usecase.py
+"""
+from typing import Dict, List
+from datetime import timedelta
+from core.interface.interview_calendar_repository_port import InterviewCalendarRepositoryPort
+from infrastructure.services.interview_calendar_service import InterviewCalendar
+
+
+class CheckScheduleConflictsUseCase:
+    """
+    Check proposed interview slots against the interviewer's and the
+    candidate's existing telephonic and HR interviews, and against the
+    other slots of the same batch.
+    """
+
+    def __init__(self, calendar_repository: InterviewCalendarRepositoryPort):
+        self.calendar_repository = calendar_repository
+
+    def execute(self, slots: List[Dict], round_name: str) -> Dict:
+        """
+        slots: [{'application_id', 'scheduled_at', 'duration', 'interviewer_id' (optional)}]
+        Returns {'success', 'conflicts': {application_id: [conflict, ...]}}
+        """
+        if not slots:
+            return {'success': True, 'conflicts': {}}
+
+        participants = self.calendar_repository.get_application_participants(
+            [slot['application_id'] for slot in slots]
+        )
+
+        prepared = []
+        for slot in slots:
+            participant = participants.get(slot['application_id'], {})
+            start = slot['scheduled_at']
+            prepared.append({
+                'application_id': slot['application_id'],
+                'interviewer_id': slot.get('interviewer_id') or participant.get('recruiter_id'),
+                'candidate_id': participant.get('candidate_id'),
+                'start': start,
+                'end': start + timedelta(minutes=slot['duration']),
+            })
+
+        busy = self.calendar_repository.get_busy_intervals(
+            interviewer_ids=[slot['interviewer_id'] for slot in prepared],
+            candidate_ids=[slot['candidate_id'] for slot in prepared],
+            window_start=min(slot['start'] for slot in prepared),
+            window_end=max(slot['end'] for slot in prepared)
+        )
+        calendar = InterviewCalendar(
+            busy,
+            exclude={(round_name, slot['application_id']) for slot in prepared}
+        )
+
+        conflicts = {}
+        for slot in prepared:
+            found = calendar.conflicts(slot['interviewer_id'], slot['candidate_id'], slot['start'], slot['end'])
+            if found:
+                conflicts[slot['application_id']] = found
+                continue
+            # Accepted slots block the rest of the batch
+            calendar.reserve(
+                slot['interviewer_id'],
+                slot['candidate_id'],
+                slot['start'],
+                slot['end'],
+                {'round': round_name, **slot}
+            )
+
+        return {
+            'success': True,
+            'conflicts': conflicts
+        }
+
+    @staticmethod
+    def describe(conflicts: List[Dict]) -> str:
+        first = conflicts[0]
+        who = 'Interviewer' if first['conflict_with'] == 'interviewer' else 'Candidate'
+        return f"{who} already has an interview from {first['start']} to {first['end']}"
@@ -0,0 +1,54 @@
+"""
+core/use_cases/interview_calendar/get_free_slots_usecase.py
+"""
+from typing import Dict, List, Tuple
+from datetime import datetime
+from core.interface.interview_calendar_repository_port import InterviewCalendarRepositoryPort
+from infrastructure.services.interview_calendar_service import InterviewCalendar
+
+
+class GetFreeSlotsUseCase:
+    """Free interview slots of an interviewer inside availability windows"""
+
+    def __init__(self, calendar_repository: InterviewCalendarRepositoryPort):
+        self.calendar_repository = calendar_repository
+
+    def execute(
+        self,
+        interviewer_id: int,
+        windows: List[Tuple[datetime, datetime]],
+        duration_minutes: int,
+        buffer_minutes: int = 0,
+        limit: int = 50) -> Dict:
+
+        if not windows:
+            return {'success': False, 'error': 'At least one availability window is required'}
+
+        for window_start, window_end in windows:
+            if window_end <= window_start:
+                return {'success': False, 'error': 'Window end must be after window start'}
+
+        busy = self.calendar_repository.get_busy_intervals(
+            interviewer_ids=[interviewer_id],
+            candidate_ids=[],
+            window_start=min(start for start, _ in windows),
+            window_end=max(end for _, end in windows)
+        )
+        calendar = InterviewCalendar(busy)
+
+        slots = calendar.free_slots(
+            interviewer_id,
+            windows,
+            duration_minutes=duration_minutes,
+            buffer_minutes=buffer_minutes,
+            limit=limit
+        )
+
+        return {
+            'success': True,
+            'slots': [
+                {'start': slot['start'].isoformat(), 'end': slot['end'].isoformat()}
+                for slot in slots
+            ],
+            'count': len(slots)
+        }
@@ -0,0 +1,19 @@
+from core.interface.job_repository_port import JobRepositoryPort
+from typing import Dict, Optional
+
+class FetchActiveJobFeedUsecase:
+    def __init__(self,job_repository:JobRepositoryPort):
+        self.job_repo = job_repository
+
+    def execute(self, filters: Dict, cursor: Optional[str] = None, limit: int = 20):
+        try:
+            page = self.job_repo.get_active_job_feed(filters, cursor=cursor, limit=limit)
+        except ValueError as e:
+            return {
+                'success': False,
+                'error': str(e)
+            }
+        return {
+            'success': True,
+            **page
+        }
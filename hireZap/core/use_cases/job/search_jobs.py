@@ -0,0 +1,43 @@
+from typing import Dict, Optional
+from core.interface.job_search_repository_port import JobSearchRepositoryPort
+
+
+class SearchJobsUsecase:
+    """ Ranked job search for the candidate job board, with facet counts """
+
+    MAX_LIMIT = 50
+    MAX_OFFSET = 1000
+
+    def __init__(self, search_repository: JobSearchRepositoryPort):
+        self.search_repository = search_repository
+
+    def execute(
+        self,
+        query: str,
+        location: Optional[str] = None,
+        work_type: Optional[str] = None,
+        employment_type: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0) -> Dict:
+
+        query = (query or '').strip()
+        if not query:
+            return {'success': False, 'error': 'Search query is required'}
+
+        if offset < 0 or offset > self.MAX_OFFSET:
+            return {'success': False, 'error': f'offset must be between 0 and {self.MAX_OFFSET}'}
+
+        result = self.search_repository.search(
+            query=query,
+            location=location,
+            work_type=work_type,
+            employment_type=employment_type,
+            limit=max(1, min(limit, self.MAX_LIMIT)),
+            offset=offset
+        )
+
+        return {
+            'success': True,
+            'query': query,
+            **result
+        }
@@ -0,0 +1,53 @@
+"""
+core/use_cases/notifications/notification_history_usecase.py
+"""
+from typing import Dict, Optional
+from core.interface.notification_stream_port import NotificationStreamPort
+
+
+class GetUnreadNotificationsUseCase:
+    """Unread count (and optionally the missed notifications) from the user's stream"""
+
+    MAX_LIMIT = 200
+
+    def __init__(self, notification_stream: NotificationStreamPort):
+        self.notification_stream = notification_stream
+
+    def execute(self, user_id: int, include_notifications: bool = False, limit: int = 50) -> Dict:
+        counts = self.notification_stream.unread_count(user_id)
+        result = {'success': True, **counts}
+
+        if include_notifications:
+            limit = max(1, min(limit, self.MAX_LIMIT))
+            events = self.notification_stream.replay(user_id, after_id=counts['last_read_id'], limit=limit)
+            result['notifications'] = [
+                {**event, 'stream_id': stream_id}
+                for stream_id, event in events if stream_id
+            ]
+        return result
+
+
+class MarkNotificationsReadUseCase:
+    """Move the user's read cursor (to the newest notification by default)"""
+
+    def __init__(self, notification_stream: NotificationStreamPort):
+        self.notification_stream = notification_stream
+
+    def execute(self, user_id: int, last_id: Optional[str] = None) -> Dict:
+        if last_id and not self._is_stream_id(last_id):
+            return {
+                'success': False,
+                'error': 'last_id must be a notification stream id'
+            }
+
+        last_read_id = self.notification_stream.mark_read(user_id, last_id)
+        return {
+            'success': True,
+            **self.notification_stream.unread_count(user_id),
+            'last_read_id': last_read_id
+        }
+
+    @staticmethod
+    def _is_stream_id(value: str) -> bool:
+        ms, _, seq = value.partition('-')
+        return ms.isdigit() and (seq == '' or seq.isdigit())
@@ -0,0 +1,24 @@
+"""
+core/use_cases/notifications/notification_metrics_usecase.py
+"""
+from typing import Dict
+
+
+class GetNotificationMetricsUseCase:
+    """Per-type WebSocket notification size and send-rate metrics"""
+
+    MAX_MINUTES = 24 * 60
+
+    def __init__(self, notification_metrics):
+        self.notification_metrics = notification_metrics
+
+    def execute(self, minutes: int = 15) -> Dict:
+        minutes = max(1, min(minutes, self.MAX_MINUTES))
+        metrics = self.notification_metrics.summary(minutes)
+        return {
+            'success': True,
+            'minutes': minutes,
+            'total_sent': sum(item['sent'] for item in metrics.values()),
+            'total_bytes': sum(item['bytes'] for item in metrics.values()),
+            'types': metrics
+        }
@@ -0,0 +1,22 @@
+from typing import Dict
+from core.interface.recommendation_repository_port import RecommendationRepositoryPort
+
+
+class GetJobRecommendationsUseCase:
+    """The candidate's precomputed job recommendations, best first"""
+
+    MAX_LIMIT = 20
+
+    def __init__(self, recommendation_repository: RecommendationRepositoryPort):
+        self.recommendation_repository = recommendation_repository
+
+    def execute(self, candidate_id: int, limit: int = 20) -> Dict:
+        recommendations = self.recommendation_repository.get_recommendations(
+            candidate_id,
+            limit=max(1, min(limit, self.MAX_LIMIT))
+        )
+        return {
+            'success': True,
+            'recommendations': recommendations,
+            'count': len(recommendations)
+        }
@@ -0,0 +1,59 @@
+"""
+core/use_cases/skills/skill_match_usecase.py
+"""
+from typing import Dict
+from core.interface.skill_index_repository_port import SkillIndexRepositoryPort
+from core.interface.job_repository_port import JobRepositoryPort
+
+
+class GetJobsForCandidateUseCase:
+    """Active jobs requiring the candidate's skills, most shared skills first"""
+
+    MAX_LIMIT = 50
+
+    def __init__(self, skill_index_repository: SkillIndexRepositoryPort):
+        self.skill_index_repository = skill_index_repository
+
+    def execute(self, candidate_id: int, limit: int = 20) -> Dict:
+        jobs = self.skill_index_repository.jobs_for_candidate(
+            candidate_id,
+            limit=max(1, min(limit, self.MAX_LIMIT))
+        )
+        return {
+            'success': True,
+            'jobs': jobs,
+            'count': len(jobs)
+        }
+
+
+class GetCandidatesForJobUseCase:
+    """Candidates with the skills a recruiter's job requires"""
+
+    MAX_LIMIT = 100
+
+    def __init__(
+        self,
+        skill_index_repository: SkillIndexRepositoryPort,
+        job_repository: JobRepositoryPort):
+
+        self.skill_index_repository = skill_index_repository
+        self.job_repository = job_repository
+
+    def execute(self, job_id: int, recruiter_id: int, limit: int = 20) -> Dict:
+        job = self.job_repository.get_job_by_id(job_id)
+        if not job:
+            return {'success': False, 'error': 'Job not found'}
+
+        if job.recruiter_id != recruiter_id:
+            return {'success': False, 'error': 'You do not have access to this job'}
+
+        candidates = self.skill_index_repository.candidates_for_job(
+            job_id,
+            limit=max(1, min(limit, self.MAX_LIMIT))
+        )
+        return {
+            'success': True,
+            'job_id': job_id,
+            'candidates': candidates,
+            'count': len(candidates)
+        }
@@ -5,7 +5,8 @@ from typing import Dict
 from core.interface.telephonic_round_repository_port import TelephonicRoundRepositoryPort
 from infrastructure.services.telephonic_service import (
     TranscriptionService,
-    InterviewScorerService
+    InterviewScorerService,
+    AudioProcessorService
 )
 from infrastructure.services.notification_service import NotificationService
 import time
@@ -48,31 +49,43 @@ class AnalyzeInterviewUseCase:
             settings = self.repository.create_default_settings(interview.job_id)
         
         try:
-            # 3. Transcribe audio with Whisper
-            logger.info(f" Starting transcription for interview {interview_id}...")
+            # 3. Transcribe audio with Whisper (reuse stored transcript of identical audio)
+            audio_sha256 = AudioProcessorService.compute_sha256(audio_file_path)
+            transcription_result = self._get_stored_transcription(interview_id, audio_sha256)
             
-            with open(audio_file_path, 'rb') as audio_file:
-                transcription_result = self.transcription_service.transcribe_audio(
-                    audio_file=audio_file,
-                    language='en'
+            if transcription_result:
+                logger.info(f" Reusing stored transcription for interview {interview_id}")
+            else:
+                logger.info(f" Starting transcription for interview {interview_id}...")
+                
+                with open(audio_file_path, 'rb') as audio_file:
+                    transcription_result = self.transcription_service.transcribe_audio(
+                        audio_file=audio_file,
+                        language='en',
+                        profile=settings.transcription_profile,
+                        two_pass=settings.enable_two_pass_transcription,
+                        confidence_threshold=settings.two_pass_confidence_threshold
+                    )
+                
+                if not transcription_result['success']:
+                    return {
+                        'success': False,
+                        'error': f"Transcription failed: {transcription_result.get('error')}"
+                    }
+                
+                # Save transcription to database
+                self.repository.create_transcription(
+                    interview_id=interview_id,
+                    full_text=transcription_result['text'],
+                    segments=transcription_result['segments'],
+                    detected_language=transcription_result['language'],
+                    confidence=transcription_result.get('confidence'),
+                    model_used=transcription_result.get('model_used'),
+                    processing_time_seconds=transcription_result.get('processing_time'),
+                    audio_sha256=audio_sha256
                 )
-            
-            if not transcription_result['success']:
-                return {
-                    'success': False,
-                    'error': f"Transcription failed: {transcription_result.get('error')}"
-                }
-            
-            # Save transcription to database
-            transcription = self.repository.create_transcription(
-                interview_id=interview_id,
-                full_text=transcription_result['text'],
-                segments=transcription_result['segments'],
-                detected_language=transcription_result['language'],
-                confidence=transcription_result.get('confidence')
-            )
-            
-            logger.error(f" Transcription completed: {len(transcription_result['text'])} characters")
+                
+                logger.info(f" Transcription completed: {len(transcription_result['text'])} characters")
             
             # 4. Prepare job requirements
             job_requirements = {
@@ -99,7 +112,8 @@ class AnalyzeInterviewUseCase:
             analysis_result = self.scorer_service.analyze_interview(
                 transcription=transcription_result['text'],
                 job_requirements=job_requirements,
-                settings=settings_dict
+                settings=settings_dict,
+                segments=transcription_result.get('segments')
             )
             
             if not analysis_result['success']:
@@ -163,6 +177,35 @@ class AnalyzeInterviewUseCase:
                 'error': f'Analysis failed: {str(e)}'
             }
     
+    def _get_stored_transcription(self, interview_id: int, audio_sha256: str):
+        """Completed transcript of the same audio, for this or any interview"""
+        transcription = self.repository.get_transcription(interview_id)
+        
+        if not (transcription and transcription.processing_status == 'completed'
+                and transcription.audio_sha256 == audio_sha256):
+            transcription = self.repository.get_completed_transcription_by_hash(audio_sha256)
+            if not transcription:
+                return None
+            
+            self.repository.create_transcription(
+                interview_id=interview_id,
+                full_text=transcription.full_text,
+                segments=transcription.segments,
+                detected_language=transcription.detected_language,
+                confidence=transcription.confidence,
+                model_used=transcription.model_used,
+                processing_time_seconds=0,
+                audio_sha256=audio_sha256
+            )
+        
+        return {
+            'success': True,
+            'text': transcription.full_text,
+            'segments': transcription.segments,
+            'language': transcription.detected_language,
+            'confidence': transcription.confidence
+        }
+    
     def _update_application_status(self, interview, decision: str):
         application = interview.application
         
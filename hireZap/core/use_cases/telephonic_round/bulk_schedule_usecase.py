@@ -3,118 +3,166 @@ core/use_cases/telephonic_round/bulk_schedule_usecase.py
 """
 from typing import Dict, List
 from datetime import datetime
+from django.db import transaction
 from core.interface.telephonic_round_repository_port import TelephonicRoundRepositoryPort
+from core.interface.interview_calendar_repository_port import InterviewCalendarRepositoryPort
+from core.use_cases.interview_calendar.check_schedule_conflicts_usecase import CheckScheduleConflictsUseCase
 from infrastructure.services.notification_service import NotificationService
 
 
 class BulkScheduleUseCase:
+    # Interviews in these states can still be (re)scheduled
+    SCHEDULABLE_STATUSES = ['not_scheduled', 'scheduled']
+
     def __init__(
         self,
         repository: TelephonicRoundRepositoryPort,
-        notification_service: NotificationService):
+        notification_service: NotificationService,
+        calendar_repository: InterviewCalendarRepositoryPort = None):
 
         self.repository = repository
         self.notification_service = notification_service
-    
+        self.calendar_repository = calendar_repository
+
     def execute(
         self,
         schedules: List[Dict],
         send_notifications: bool = True,
         send_emails: bool = True) -> Dict:
-        
-        scheduled_count = 0
-        failed_count = 0
+
         errors = []
-        
-        for schedule_data in schedules:
+
+        # 1. Validate the whole batch up front
+        valid_schedules = self._validate_schedules(schedules, errors)
+
+        # 2. One upsert for every valid interview, sent-flags included, and
+        #    one batched notification task queued in the same transaction
+        scheduled = {}
+        if valid_schedules:
             try:
-                # 1. Get or create interview record
-                application_id = schedule_data['application_id']
-                interview = self.repository.get_interview_by_application(application_id)
-                
-                if not interview:
-                    interview = self.repository.create_interview(
-                        application_id=application_id,
-                        status='not_scheduled'
-                    )
-                
-                # 2. Validate scheduled time
-                scheduled_at = schedule_data['scheduled_at']
-                from django.utils import timezone as django_tz
-                now = django_tz.now()
-                
-                if scheduled_at <= now:
-                    errors.append({
-                        'application_id': application_id,
-                        'error': 'Scheduled time must be in the future'
-                    })
-                    failed_count += 1
-                    continue
-                
-                # 3. Schedule the interview
-                interview = self.repository.schedule_interview(
-                    interview_id=interview.id,
-                    scheduled_at=scheduled_at,
-                    duration=schedule_data.get('duration', 30),
-                    timezone=schedule_data.get('timezone', 'America/New_York'),
-                    notes=schedule_data.get('notes', '')
-                )
-                
-                # 4. Send notifications
-                if send_notifications:
-                    self._send_websocket_notification(interview)
-                    self.repository.update_interview_status(
-                        interview.id,
-                        interview.status,
-                        notification_sent=True
+                with transaction.atomic():
+                    scheduled = self.repository.bulk_schedule_interviews(
+                        valid_schedules,
+                        notification_sent=send_notifications,
+                        email_sent=send_emails
                     )
-                
-                if send_emails:
-                    self._send_email_notification(interview)
-                    self.repository.update_interview_status(
-                        interview.id,
-                        interview.status,
-                        email_sent=True
-                    )
-                
-                scheduled_count += 1
-                
+                    if scheduled and (send_notifications or send_emails):
+                        self._send_notifications(list(scheduled.values()), send_notifications, send_emails)
             except Exception as e:
-                failed_count += 1
+                return {
+                    'success': False,
+                    'error': f'Failed to schedule interviews: {str(e)}'
+                }
+
+        for schedule in valid_schedules:
+            if schedule['application_id'] not in scheduled:
                 errors.append({
-                    'application_id': schedule_data.get('application_id'),
-                    'error': str(e)
+                    'application_id': schedule['application_id'],
+                    'error': 'Application not found'
                 })
-        
+
+        # 3. Reminders for the scheduled interviews
+        if scheduled:
+            self._schedule_reminders(list(scheduled.values()))
+
+        scheduled_count = len(scheduled)
+
         return {
             'success': True,
             'scheduled_count': scheduled_count,
-            'failed_count': failed_count,
+            'failed_count': len(errors),
             'total': len(schedules),
             'errors': errors,
+            'interview_ids': list(scheduled.values()),
             'message': f'Successfully scheduled {scheduled_count} out of {len(schedules)} interviews'
         }
-    
-    def _send_websocket_notification(self, interview):
-        """Send WebSocket notification to candidate"""
-        self.notification_service.send_websocket_notification(
-            user_id=interview.application.candidate_id,
-            notification_type='interview_scheduled',
-            data={
-                'interview_id': interview.id,
-                'job_id': interview.job_id,
-                'job_title': interview.job.job_title,
-                'scheduled_at': interview.scheduled_at.isoformat(),
-                'duration': interview.scheduled_duration_minutes,
-                'timezone': interview.timezone,
-                'notes': interview.scheduling_notes
-            }
+
+    def _validate_schedules(self, schedules: List[Dict], errors: List[Dict]) -> List[Dict]:
+        from django.utils import timezone as django_tz
+        now = django_tz.now()
+
+        valid = []
+        seen = set()
+
+        for schedule_data in schedules:
+            # Serializer field is candidate_id but it carries the application id
+            application_id = schedule_data.get('application_id') or schedule_data.get('candidate_id')
+
+            if not application_id:
+                errors.append({'application_id': None, 'error': 'application_id is required'})
+                continue
+
+            if application_id in seen:
+                errors.append({'application_id': application_id, 'error': 'Duplicate application in batch'})
+                continue
+            seen.add(application_id)
+
+            scheduled_at = schedule_data['scheduled_at']
+            if scheduled_at <= now:
+                errors.append({
+                    'application_id': application_id,
+                    'error': 'Scheduled time must be in the future'
+                })
+                continue
+
+            valid.append({
+                'application_id': application_id,
+                'scheduled_at': scheduled_at,
+                'duration': schedule_data.get('duration') or 30,
+                'timezone': schedule_data.get('timezone') or 'America/New_York',
+                'notes': schedule_data.get('notes', '')
+            })
+
+        # Existing interviews that already started or finished cannot be rescheduled
+        statuses = self.repository.get_interview_statuses_by_application(
+            [schedule['application_id'] for schedule in valid]
+        )
+        schedulable = []
+        for schedule in valid:
+            current_status = statuses.get(schedule['application_id'])
+            if current_status and current_status not in self.SCHEDULABLE_STATUSES:
+                errors.append({
+                    'application_id': schedule['application_id'],
+                    'error': f'Interview cannot be scheduled. Current status: {current_status}'
+                })
+                continue
+            schedulable.append(schedule)
+
+        if not self.calendar_repository:
+            return schedulable
+
+        # Overlaps with existing interviews and within the batch itself
+        conflict_check = CheckScheduleConflictsUseCase(self.calendar_repository).execute(
+            schedulable,
+            round_name='telephonic'
         )
-    
-    def _send_email_notification(self, interview):
-        """Send email to candidate"""
-        from telephonic_round.tasks import send_interview_scheduled_email_task
-        
-        send_interview_scheduled_email_task.delay(
-            interview_id=interview.id
-        )
\ No newline at end of file
+        conflicts = conflict_check['conflicts']
+        free = []
+        for schedule in schedulable:
+            if schedule['application_id'] in conflicts:
+                errors.append({
+                    'application_id': schedule['application_id'],
+                    'error': CheckScheduleConflictsUseCase.describe(conflicts[schedule['application_id']]),
+                    'conflicts': conflicts[schedule['application_id']]
+                })
+                continue
+            free.append(schedule)
+
+        return free
+
+    def _send_notifications(self, interview_ids: List[int], send_notifications: bool, send_emails: bool):
+        """Queue a single task that fans out websocket notifications and emails"""
+        from telephonic_round.tasks import send_bulk_interview_scheduled_notifications_task
+
+        self.notification_service.defer_task(
+            send_bulk_interview_scheduled_notifications_task,
+            interview_ids,
+            send_notifications,
+            send_emails
+        )
+
+    def _schedule_reminders(self, interview_ids: List[int]):
+        """Queue the ETA reminders of the whole batch in the background"""
+        from telephonic_round.tasks import schedule_interview_reminders_task
+
+        schedule_interview_reminders_task.delay(interview_ids)
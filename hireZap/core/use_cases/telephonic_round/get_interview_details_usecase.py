@@ -101,9 +101,12 @@ class GetInterviewDetailsUseCase:
                         'confidence': transcription.confidence,
                     }
                 else:
+                    # Partial transcript is readable while segments stream in
                     result['interview']['transcription'] = {
                         'status': transcription.processing_status,
                         'error': transcription.error_message,
+                        'progress': transcription.progress_percent,
+                        'segments': transcription.segments,
                     }
         
         # 6. Add performance results
@@ -38,5 +38,8 @@ class GetTelephonicRoundSettings():
             'auto_schedule_enabled': getattr(settings, 'auto_schedule_enabled', False),
             'default_duration_minutes': getattr(settings, 'default_duration_minutes', 30),
             'auto_send_notifications': getattr(settings, 'auto_send_notifications', True),
+            'transcription_profile': getattr(settings, 'transcription_profile', 'balanced'),
+            'enable_two_pass_transcription': getattr(settings, 'enable_two_pass_transcription', False),
+            'two_pass_confidence_threshold': getattr(settings, 'two_pass_confidence_threshold', 0.6),
         }
         
\ No newline at end of file
@@ -42,12 +42,13 @@ class MoveToNextStageUseCase:
                 feedback=feedback
             )
             
-            # 3. Get next stage info for response
-            next_stage_name = self._get_next_stage_name(interview_ids[0])
+            # 3. Reload once after the move for the response and notifications
+            interviews = self.repository.get_interviews_by_ids(interview_ids)
+            next_stage_name = self._get_next_stage_name(interviews)
             
             # 4. Send notifications
             self._send_stage_transition_notifications(
-                interview_ids=interview_ids,
+                interviews=interviews,
                 next_stage_name=next_stage_name
             )
             
@@ -68,9 +69,13 @@ class MoveToNextStageUseCase:
     def _validate_interviews(self, interview_ids: List[int]) -> Dict:
         
         invalid_interviews = []
+        interviews = {
+            interview.id: interview
+            for interview in self.repository.get_interviews_by_ids(interview_ids)
+        }
         
         for interview_id in interview_ids:
-            interview = self.repository.get_interview_by_id(interview_id)
+            interview = interviews.get(interview_id)
             
             if not interview:
                 invalid_interviews.append({
@@ -88,7 +93,7 @@ class MoveToNextStageUseCase:
                 continue
             
             # Check if performance result exists
-            performance_result = self.repository.get_performance_result(interview_id)
+            performance_result = getattr(interview, 'performance_result', None)
             
             if not performance_result:
                 invalid_interviews.append({
@@ -114,9 +119,9 @@ class MoveToNextStageUseCase:
         
         return {'valid': True}
     
-    def _get_next_stage_name(self, sample_interview_id: int) -> str:
+    def _get_next_stage_name(self, interviews: List) -> str:
         try:
-            interview = self.repository.get_interview_by_id(sample_interview_id)
+            interview = interviews[0] if interviews else None
             if interview and interview.application.current_stage:
                 return interview.application.current_stage.name
             return 'Next Stage'
@@ -125,34 +130,31 @@ class MoveToNextStageUseCase:
     
     def _send_stage_transition_notifications(
         self,
-        interview_ids: List[int],
+        interviews: List,
         next_stage_name: str):
         
-        for interview_id in interview_ids:
-            try:
-                interview = self.repository.get_interview_by_id(interview_id)
-                
-                if not interview:
-                    continue
-                
-                # WebSocket notification
-                self.notification_service.send_websocket_notification(
-                    user_id=interview.application.candidate_id,
-                    notification_type='stage_progression',
-                    data={
-                        'interview_id': interview_id,
-                        'job_title': interview.job.job_title,
-                        'previous_stage': 'Telephonic Round',
-                        'next_stage': next_stage_name,
-                        'message': f'Congratulations! You have been moved to {next_stage_name}'
-                    }
-                )
+        with self.notification_service.buffered():
+            for interview in interviews:
+                interview_id = interview.id
+                try:
+                    # WebSocket notification
+                    self.notification_service.send_websocket_notification(
+                        user_id=interview.application.candidate_id,
+                        notification_type='stage_progression',
+                        data={
+                            'interview_id': interview_id,
+                            'job_title': interview.job.job_title,
+                            'previous_stage': 'Telephonic Round',
+                            'next_stage': next_stage_name,
+                            'message': f'Congratulations! You have been moved to {next_stage_name}'
+                        }
+                    )
                 
-                # Email notification (async)
-                self._send_progression_email(interview, next_stage_name)
+                    # Email notification (async)
+                    self._send_progression_email(interview, next_stage_name)
                 
-            except Exception as e:
-                logger.error(f" Failed to notify candidate for interview {interview_id}: {str(e)}")
+                except Exception as e:
+                    logger.error(f" Failed to notify candidate for interview {interview_id}: {str(e)}")
     
     def _send_progression_email(self, interview, next_stage_name: str):
         from telephonic_round.tasks import send_stage_progression_email
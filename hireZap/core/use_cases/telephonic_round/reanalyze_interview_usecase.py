@@ -0,0 +1,166 @@
+"""
+core/use_cases/telephonic_round/reanalyze_interview_usecase.py
+"""
+from typing import Dict
+from core.interface.telephonic_round_repository_port import TelephonicRoundRepositoryPort
+from infrastructure.services.telephonic_service import InterviewScorerService
+from infrastructure.services.notification_service import NotificationService
+from django.utils import timezone
+from django.db import transaction
+import logging
+logger = logging.getLogger(__name__)
+
+
+class ReanalyzeInterviewUseCase:
+    """
+    Score an interview from its stored InterviewTranscription.
+    Costs one LLM call - the recording is never downloaded or transcribed
+    again, and long transcripts reuse the cached per-chunk evidence so only
+    the final scoring call runs. Safe to re-run after changing weights or a
+    Groq failure.
+    """
+
+    def __init__(
+        self,
+        repository: TelephonicRoundRepositoryPort,
+        scorer_service: InterviewScorerService,
+        notification_service: NotificationService):
+
+        self.repository = repository
+        self.scorer_service = scorer_service
+        self.notification_service = notification_service
+
+    def execute(self, interview_id: int, notify_candidate: bool = False) -> Dict:
+        interview = self.repository.get_interview_by_id(interview_id)
+
+        if not interview:
+            return {
+                'success': False,
+                'error': 'Interview not found'
+            }
+
+        transcription = self.repository.get_transcription(interview_id)
+        if not transcription or transcription.processing_status != 'completed' or not transcription.full_text:
+            return {
+                'success': False,
+                'error': 'No completed transcription available for this interview'
+            }
+
+        settings = self.repository.get_settings_by_job(interview.job_id)
+        if not settings:
+            settings = self.repository.create_default_settings(interview.job_id)
+
+        job_requirements = {
+            'job_title': interview.job.job_title,
+            'required_skills': interview.job.skills_required or [],
+            'minimum_experience': interview.job.min_experience or 0,
+            'responsibilities': interview.job.key_responsibilities or ''
+        }
+
+        settings_dict = {
+            'communication_weight': settings.communication_weight,
+            'technical_knowledge_weight': settings.technical_knowledge_weight,
+            'problem_solving_weight': settings.problem_solving_weight,
+            'enthusiasm_weight': settings.enthusiasm_weight,
+            'clarity_weight': settings.clarity_weight,
+            'professionalism_weight': settings.professionalism_weight,
+            'minimum_qualifying_score': settings.minimum_qualifying_score
+        }
+
+        logger.info(f" Starting AI analysis for interview {interview_id}...")
+        analysis_result = self.scorer_service.analyze_interview(
+            transcription=transcription.full_text,
+            job_requirements=job_requirements,
+            settings=settings_dict,
+            segments=transcription.segments
+        )
+
+        if not analysis_result['success']:
+            return {
+                'success': False,
+                'error': f"Analysis failed: {analysis_result.get('error')}"
+            }
+
+        # Result, application status and notifications commit together (outbox)
+        with transaction.atomic():
+            performance = self.repository.save_performance_result(
+                interview_id=interview_id,
+                scores=analysis_result['scores'],
+                decision=analysis_result['decision'],
+                analysis=analysis_result['analysis']
+            )
+
+            self._update_application_status(interview, performance)
+            self._send_notifications(interview, performance, notify_candidate)
+
+        logger.info(f" Analysis completed for interview {interview_id}")
+        logger.info(f" Score: {performance.overall_score}/100 - Decision: {performance.decision}")
+
+        return {
+            'success': True,
+            'interview_id': interview_id,
+            'score': performance.overall_score,
+            'decision': performance.decision,
+            'final_score': performance.final_score,
+            'final_decision': performance.final_decision,
+            'analysis': analysis_result['analysis']
+        }
+
+    def _update_application_status(self, interview, performance):
+        application = interview.application
+
+        # Leave the application alone once it has moved past this round
+        if interview.stage_id and application.current_stage_id != interview.stage_id:
+            return
+
+        # A manual override from the recruiter wins over the AI decision
+        if performance.manual_decision_override:
+            return
+
+        if performance.decision == 'qualified':
+            application.current_stage_status = 'qualified'
+            application.status = 'qualified'
+        else:
+            from application.models import ApplicationStageHistory
+            ApplicationStageHistory.objects.filter(
+                application=application,
+                stage=application.current_stage_id
+            ).update(
+                status='rejected',
+                completed_at=timezone.now(),
+                feedback='Telephonic Round failed'
+            )
+            application.current_stage_status = 'rejected'
+            application.status = 'rejected'
+
+        application.save()
+
+    def _send_notifications(self, interview, performance, notify_candidate: bool):
+        recruiter_id = interview.conducted_by_id or interview.job.recruiter_id
+        if recruiter_id:
+            self.notification_service.send_websocket_notification(
+                user_id=recruiter_id,
+                notification_type='interview_analyzed',
+                data={
+                    'interview_id': interview.id,
+                    'candidate_name': interview.candidate_name,
+                    'score': performance.overall_score,
+                    'decision': performance.decision
+                }
+            )
+
+        if not notify_candidate:
+            return
+
+        self.notification_service.send_websocket_notification(
+            user_id=interview.application.candidate_id,
+            notification_type='interview_completed',
+            data={
+                'interview_id': interview.id,
+                'job_title': interview.job.job_title,
+                'decision': performance.decision
+            }
+        )
+
+        from telephonic_round.tasks import send_interview_result_email
+        self.notification_service.defer_task(send_interview_result_email, interview.id)
@@ -4,6 +4,8 @@ core/use_cases/telephonic_round/reschedule_interview_usecase.py
 from typing import Dict, Optional
 from datetime import datetime
 from core.interface.telephonic_round_repository_port import TelephonicRoundRepositoryPort
+from core.interface.interview_calendar_repository_port import InterviewCalendarRepositoryPort
+from core.use_cases.interview_calendar.check_schedule_conflicts_usecase import CheckScheduleConflictsUseCase
 from infrastructure.services.notification_service import NotificationService
 
 
@@ -12,10 +14,12 @@ class RescheduleInterviewUseCase:
     def __init__(
         self,
         repository: TelephonicRoundRepositoryPort,
-        notification_service: NotificationService):
+        notification_service: NotificationService,
+        calendar_repository: InterviewCalendarRepositoryPort = None):
 
         self.repository = repository
         self.notification_service = notification_service
+        self.calendar_repository = calendar_repository
     
     def execute(
         self,
@@ -68,8 +72,27 @@ class RescheduleInterviewUseCase:
                 update_notes = notes
         else:
             update_notes = interview.scheduling_notes
+
+        # 6. Reject overlaps with the recruiter's or candidate's other interviews
+        if self.calendar_repository:
+            conflict_check = CheckScheduleConflictsUseCase(self.calendar_repository).execute(
+                [{
+                    'application_id': interview.application_id,
+                    'scheduled_at': new_scheduled_at,
+                    'duration': update_duration,
+                    'interviewer_id': interview.conducted_by_id
+                }],
+                round_name='telephonic'
+            )
+            conflicts = conflict_check['conflicts'].get(interview.application_id)
+            if conflicts:
+                return {
+                    'success': False,
+                    'error': CheckScheduleConflictsUseCase.describe(conflicts),
+                    'conflicts': conflicts
+                }
         
-        # 6. Reschedule the interview
+        # 7. Reschedule the interview
         interview = self.repository.schedule_interview(
             interview_id=interview_id,
             scheduled_at=new_scheduled_at,
@@ -84,8 +107,12 @@ class RescheduleInterviewUseCase:
             status='scheduled',
             reminder_sent=False
         )
+
+        # Move the pending reminder to the new time
+        from telephonic_round.tasks import schedule_interview_reminders
+        schedule_interview_reminders([interview_id])
         
-        # 7. Send notifications
+        # 8. Send notifications
         if send_notification:
             self._send_reschedule_notification(
                 interview=interview,
@@ -1,15 +1,20 @@
 from typing import Dict
 from datetime import datetime
+from django.db import transaction
 from core.interface.telephonic_round_repository_port import TelephonicRoundRepositoryPort
+from core.interface.interview_calendar_repository_port import InterviewCalendarRepositoryPort
+from core.use_cases.interview_calendar.check_schedule_conflicts_usecase import CheckScheduleConflictsUseCase
 from infrastructure.services.notification_service import NotificationService
 
 class ScheduleInterviewUsecase:
     """Schedule telephonic interview"""
     def __init__(self, 
                  repository:TelephonicRoundRepositoryPort,
-                 notification_service:NotificationService):
+                 notification_service:NotificationService,
+                 calendar_repository:InterviewCalendarRepositoryPort = None):
         self.repository = repository
         self.notification_service = notification_service
+        self.calendar_repository = calendar_repository
 
     def execute(self,
                 application_id: int,
@@ -37,32 +42,50 @@ class ScheduleInterviewUsecase:
                 'success': False,
                 'error': 'Scheduled time must be in the future'
             }
-        
-        # 3. Schedule the interview
-        interview = self.repository.schedule_interview(
-            interview_id=interview.id,
-            scheduled_at=scheduled_at,
-            duration=duration,
-            timezone=timezone,
-            notes=notes
-        )
-        
-        # 4. Send notifications
-        if send_notification:
-            self._send_websocket_notification(interview)
-            self.repository.update_interview_status(
-                interview.id,
-                interview.status,
-                notification_sent=True
+
+        # 3. Reject overlaps with the recruiter's or candidate's other interviews
+        if self.calendar_repository:
+            conflict_check = CheckScheduleConflictsUseCase(self.calendar_repository).execute(
+                [{'application_id': application_id, 'scheduled_at': scheduled_at, 'duration': duration}],
+                round_name='telephonic'
             )
+            conflicts = conflict_check['conflicts'].get(application_id)
+            if conflicts:
+                return {
+                    'success': False,
+                    'error': CheckScheduleConflictsUseCase.describe(conflicts),
+                    'conflicts': conflicts
+                }
         
-        if send_email:
-            self._send_email_notification(interview)
-            self.repository.update_interview_status(
-                interview.id,
-                interview.status,
-                email_sent=True
+        # 4. Schedule the interview; notifications and email go to the
+        #    outbox in the same transaction
+        with transaction.atomic():
+            interview = self.repository.schedule_interview(
+                interview_id=interview.id,
+                scheduled_at=scheduled_at,
+                duration=duration,
+                timezone=timezone,
+                notes=notes
             )
+            
+            # 5. Send notifications
+            if send_notification:
+                self._send_websocket_notification(interview)
+                self.repository.update_interview_status(
+                    interview.id,
+                    interview.status,
+                    notification_sent=True
+                )
+            
+            if send_email:
+                self._send_email_notification(interview)
+                self.repository.update_interview_status(
+                    interview.id,
+                    interview.status,
+                    email_sent=True
+                )
+
+        self._schedule_reminder(interview)
         
         return {
             'success': True,
@@ -92,6 +115,13 @@ class ScheduleInterviewUsecase:
         """Send email to candidate"""
         from telephonic_round.tasks import send_interview_scheduled_email_task
         
-        send_interview_scheduled_email_task.delay(
+        self.notification_service.defer_task(
+            send_interview_scheduled_email_task,
             interview_id=interview.id
         )
+
+    def _schedule_reminder(self, interview):
+        """Queue the ETA reminder for this interview"""
+        from telephonic_round.tasks import schedule_interview_reminders
+
+        schedule_interview_reminders([interview.id])
@@ -0,0 +1,199 @@
+"""
+core/use_cases/telephonic_round/stream_transcription_usecase.py
+"""
+from typing import Dict, Optional
+from core.interface.telephonic_round_repository_port import TelephonicRoundRepositoryPort
+from core.interface.transcript_search_repository_port import TranscriptSearchRepositoryPort
+from infrastructure.services.telephonic_service import TranscriptionService
+from infrastructure.services.notification_service import NotificationService
+import time
+import logging
+logger = logging.getLogger(__name__)
+
+
+class StreamTranscriptionUseCase:
+    """
+    Transcribe a recording incrementally: segments are saved to
+    InterviewTranscription in batches and the recruiter receives
+    percent-complete events, so the transcript can be read while the
+    rest is still processing. A run that crashed resumes after the last
+    stored segment.
+
+    Used for telephonic and HR recordings alike - the repository decides
+    where the transcription is stored. Segments are also added to the
+    transcript search index when a search repository is given.
+    """
+
+    BATCH_SIZE = 10
+
+    def __init__(
+        self,
+        repository: TelephonicRoundRepositoryPort,
+        transcription_service: TranscriptionService,
+        notification_service: NotificationService,
+        search_repository: Optional[TranscriptSearchRepositoryPort] = None,
+        round_name: str = 'telephonic'):
+
+        self.repository = repository
+        self.transcription_service = transcription_service
+        self.notification_service = notification_service
+        self.search_repository = search_repository
+        self.round_name = round_name
+
+    def execute(self, interview, audio_file_path: str, settings, audio_sha256: str = None) -> Dict:
+        existing = self.repository.get_transcription(interview.id)
+        same_audio = bool(existing) and (
+            not audio_sha256 or existing.audio_sha256 == audio_sha256
+        )
+
+        if same_audio and existing.processing_status == 'completed':
+            logger.info(f" Transcription already completed for interview {interview.id}")
+            return self._result(existing)
+
+        # Identical recording already transcribed (e.g. re-uploaded) - copy it
+        if not same_audio:
+            reusable = self.repository.get_completed_transcription_by_hash(audio_sha256)
+            if reusable:
+                logger.info(f" Reusing transcript {reusable.id} for interview {interview.id} (same audio)")
+                transcription = self.repository.create_transcription(
+                    interview_id=interview.id,
+                    full_text=reusable.full_text,
+                    segments=reusable.segments,
+                    detected_language=reusable.detected_language,
+                    confidence=reusable.confidence,
+                    model_used=reusable.model_used,
+                    processing_time_seconds=0,
+                    audio_sha256=audio_sha256
+                )
+                self._reindex(interview, transcription.segments)
+                return self._result(transcription)
+
+        # HR settings have no transcription options - profile defaults, single pass
+        profile = self.transcription_service.get_profile(getattr(settings, 'transcription_profile', None))
+        second_pass_used = None
+
+        # Resume after the last segment stored by a previous run on the same audio
+        start_offset = 0.0
+        if same_audio and existing.segments:
+            start_offset = existing.segments[-1]['end']
+            logger.info(f" Resuming transcription for interview {interview.id} from {start_offset:.2f}s")
+        else:
+            self._reindex(interview, [])
+
+        self.repository.start_transcription(
+            interview.id,
+            model_used=self.transcription_service.build_model_label(profile),
+            audio_sha256=audio_sha256
+        )
+        recruiter_id = interview.conducted_by_id or interview.job.recruiter_id
+        start_time = time.time()
+
+        try:
+            audio = self.transcription_service.load_audio(audio_file_path)
+            total_duration = len(audio) / self.transcription_service.SAMPLING_RATE
+
+            info, segments = self.transcription_service.stream_segments(
+                audio,
+                language='en',
+                profile=profile['name'],
+                start_offset=start_offset
+            )
+
+            batch = []
+            for segment in segments:
+                batch.append(segment)
+                if len(batch) >= self.BATCH_SIZE:
+                    second_pass_used = self._flush(
+                        interview, recruiter_id, audio, batch, info.language,
+                        profile, settings, total_duration
+                    ) or second_pass_used
+                    batch = []
+
+            if batch:
+                second_pass_used = self._flush(
+                    interview, recruiter_id, audio, batch, info.language,
+                    profile, settings, total_duration
+                ) or second_pass_used
+
+            transcription = self.repository.complete_transcription(
+                interview_id=interview.id,
+                detected_language=info.language,
+                confidence=info.language_probability,
+                model_used=self.transcription_service.build_model_label(profile, second_pass_used),
+                processing_time_seconds=round(time.time() - start_time, 2)
+            )
+
+            self._send_progress(recruiter_id, interview.id, 100, [], 'completed')
+            logger.info(f" Transcription completed for interview {interview.id}")
+
+            return self._result(transcription)
+
+        except Exception as e:
+            logger.error(f" Streaming transcription failed for interview {interview.id}: {str(e)}")
+            # Stored segments are kept so the next run can resume
+            self.repository.update_transcription_status(
+                interview_id=interview.id,
+                status='failed',
+                error_message=str(e)
+            )
+            return {
+                'success': False,
+                'error': str(e)
+            }
+
+    def _flush(self, interview, recruiter_id, audio, batch, language, profile, settings, total_duration):
+        second_pass = None
+        if getattr(settings, 'enable_two_pass_transcription', False):
+            second_pass = self.transcription_service.retranscribe_low_confidence(
+                audio,
+                batch,
+                language=language,
+                first_pass=profile,
+                confidence_threshold=settings.two_pass_confidence_threshold
+            )
+
+        # Completion is reported separately, so cap progress below 100 here
+        progress = min(99, int(batch[-1]['end'] / total_duration * 100)) if total_duration else 0
+
+        self.repository.append_transcription_segments(
+            interview_id=interview.id,
+            segments=batch,
+            progress_percent=progress
+        )
+        if self.search_repository:
+            self.search_repository.index_segments(self.round_name, interview.id, interview.job_id, batch)
+        self._send_progress(recruiter_id, interview.id, progress, batch, 'processing')
+        return second_pass
+
+    def _reindex(self, interview, segments):
+        """Replace the indexed segments of an interview"""
+        if not self.search_repository:
+            return
+        self.search_repository.clear_segments(self.round_name, interview.id)
+        if segments:
+            self.search_repository.index_segments(self.round_name, interview.id, interview.job_id, segments)
+
+    def _send_progress(self, recruiter_id, interview_id, progress, segments, status):
+        if not recruiter_id:
+            return
+        self.notification_service.send_websocket_notification(
+            user_id=recruiter_id,
+            notification_type='transcription_progress',
+            data={
+                'interview_id': interview_id,
+                'progress': progress,
+                'status': status,
+                'segments': segments
+            }
+        )
+
+    def _result(self, transcription) -> Dict:
+        return {
+            'success': True,
+            'text': transcription.full_text,
+            'segments': transcription.segments,
+            'language': transcription.detected_language,
+            'confidence': transcription.confidence,
+            'model_used': transcription.model_used,
+            'processing_time': transcription.processing_time_seconds
+        }
@@ -40,6 +40,11 @@ class UpdateSettingsUseCase:
         # Update settings
         try:
             settings = self.repository.update_settings(job_id, settings_data)
+
+            # Pending reminders of this job follow the new reminder settings
+            if 'reminder_hours_before' in settings_data or 'send_reminders' in settings_data:
+                from telephonic_round.tasks import reschedule_job_reminders_task
+                reschedule_job_reminders_task.delay(job_id)
             
             return {
                 'success': True,
@@ -66,4 +71,7 @@ class UpdateSettingsUseCase:
             'auto_schedule_enabled': getattr(settings, 'auto_schedule_enabled', False),
             'default_duration_minutes': getattr(settings, 'default_duration_minutes', 30),
             'auto_send_notifications': getattr(settings, 'auto_send_notifications', True),
+            'transcription_profile': getattr(settings, 'transcription_profile', 'balanced'),
+            'enable_two_pass_transcription': getattr(settings, 'enable_two_pass_transcription', False),
+            'two_pass_confidence_threshold': getattr(settings, 'two_pass_confidence_threshold', 0.6),
         }
\ No newline at end of file
@@ -0,0 +1,53 @@
+"""
+core/use_cases/transcript_search/search_transcripts_usecase.py
+"""
+from typing import Dict, Optional
+from core.interface.transcript_search_repository_port import TranscriptSearchRepositoryPort
+
+
+class SearchTranscriptsUseCase:
+    """
+    Find where something was discussed across a recruiter's interview
+    transcripts. Hits carry millisecond offsets into the recording.
+    """
+
+    ROUNDS = ('telephonic', 'hr')
+    MAX_LIMIT = 100
+
+    def __init__(self, search_repository: TranscriptSearchRepositoryPort):
+        self.search_repository = search_repository
+
+    def execute(
+        self,
+        query: str,
+        recruiter_id: int,
+        round_type: Optional[str] = None,
+        job_id: Optional[int] = None,
+        interview_id: Optional[int] = None,
+        limit: int = 20) -> Dict:
+
+        query = (query or '').strip()
+        if not query:
+            return {'success': False, 'error': 'Search query is required'}
+
+        if round_type and round_type not in self.ROUNDS:
+            return {'success': False, 'error': f"round must be one of {', '.join(self.ROUNDS)}"}
+
+        if interview_id and not round_type:
+            return {'success': False, 'error': 'round is required when filtering by interview'}
+
+        hits = self.search_repository.search(
+            query=query,
+            recruiter_id=recruiter_id,
+            round_type=round_type,
+            job_id=job_id,
+            interview_id=interview_id,
+            limit=max(1, min(limit, self.MAX_LIMIT))
+        )
+
+        return {
+            'success': True,
+            'query': query,
+            'results': hits,
+            'count': len(hits)
+        }
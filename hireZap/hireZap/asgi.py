@@ -11,7 +11,6 @@ import os
 
 from django.core.asgi import get_asgi_application
 from channels.routing import ProtocolTypeRouter, URLRouter
-from channels.auth import AuthMiddlewareStack
 from channels.security.websocket import AllowedHostsOriginValidator
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'hireZap.settings')
@@ -19,11 +18,12 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'hireZap.settings')
 django_asgi_app = get_asgi_application()
 
 from notifications import routing
+from accounts.websocket_auth import JWTCookieAuthMiddleware
 
 application = ProtocolTypeRouter({
     "http": django_asgi_app,
     "websocket": AllowedHostsOriginValidator(
-        AuthMiddlewareStack(
+        JWTCookieAuthMiddleware(
             URLRouter(
                 routing.websocket_urlpatterns
             )
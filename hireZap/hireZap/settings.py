@@ -65,6 +65,8 @@ INSTALLED_APPS = [
     'telephonic_round',
     'hr_round',
     'offer',
+    'skills',
+    'recommendations',
 
 ]
 
@@ -328,27 +330,39 @@ GROQ_API_KEY = env('GROQ_API_KEY')
 WHISPER_MODEL_SIZE = 'base'
 WHISPER_DEVICE = 'cpu'
 
+# Transcription profiles selectable per job (TelephonicRoundSettings.transcription_profile)
+# compute_type None -> int8 on cpu, float16 on cuda
+WHISPER_PROFILES = {
+    'fast': {'model_size': 'tiny', 'beam_size': 1, 'compute_type': None},
+    'balanced': {'model_size': WHISPER_MODEL_SIZE, 'beam_size': 5, 'compute_type': None},
+    'accurate': {'model_size': 'small', 'beam_size': 5, 'compute_type': None},
+}
+WHISPER_DEFAULT_PROFILE = 'balanced'
+# Profile used to re-transcribe low confidence segments in two-pass mode
+WHISPER_SECOND_PASS_PROFILE = 'accurate'
+
 #zegocloud
 ZEGOCLOUD_APP_ID = env('ZEGOCLOUD_APP_ID')
 ZEGOCLOUD_SERVER_SECRET = env('ZEGOCLOUD_SERVER_SECRET')
 
 #cache configuration
-#REDIS_DB_CACHE = int(env('REDIS_DB_CACHE'))
-# CACHES = {
-#     'default': {
-#         'BACKEND': 'django_redis.cache.RedisCache',
-#         'LOCATION': 'redis://{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB_CACHE}',
-#         'OPTIONS': {
-#             'CLIENT_CLASS': 'django_redis.client.DefaultClient',
-#             'PARSER_CLASS': 'redis.connection.HiredisParser',
-#             'CONNECTION_POOL_KWARGS': {'max_connections': 50},
-#             'SOCKET_CONNECT_TIMEOUT': 5,
-#             'SOCKET_TIMEOUT': 5,
-#         },
-#         'KEY_PREFIX': 'jobportal',
-#         'TIMEOUT': 300,  # Default 5 minutes
-#     }
-# }
+REDIS_DB_CACHE = int(env('REDIS_DB_CACHE', default=REDIS_DB))
+CACHES = {
+    'default': {
+        'BACKEND': 'django_redis.cache.RedisCache',
+        'LOCATION': f'redis://{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB_CACHE}',
+        'OPTIONS': {
+            'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+            'CONNECTION_POOL_KWARGS': {'max_connections': 50},
+            'SOCKET_CONNECT_TIMEOUT': 5,
+            'SOCKET_TIMEOUT': 5,
+            # Cache is an optimisation - fall through to the database if Redis is down
+            'IGNORE_EXCEPTIONS': True,
+        },
+        'KEY_PREFIX': 'jobportal',
+        'TIMEOUT': 300,  # Default 5 minutes
+    }
+}
 
 # celery configuration
 REDIS_DB_CELERY_BROKER = int(env('REDIS_DB_CELERY_BROKER'))
@@ -377,7 +391,32 @@ CELERY_BEAT_SCHEDULE = {
     'expire-deadline-passed-jobs':{
         'task':'jobs.expire_deadline_passed_jobs',
         'schedule':crontab(hour='0', minute='0'),
-    }
+    },
+    # Reminder buckets are queued as ETA tasks once within 30 minutes
+    'queue-telephonic-interview-reminders':{
+        'task':'telephonic_round.queue_interview_reminders',
+        'schedule':crontab(minute='*/10'),
+    },
+    'queue-hr-interview-reminders':{
+        'task':'hr_interview.queue_hr_interview_reminders',
+        'schedule':crontab(minute='*/10'),
+    },
+    'flush-zegocloud-events':{
+        'task':'hr_interview.flush_zegocloud_events',
+        'schedule':crontab(minute='*'),
+    },
+    'dispatch-outbox':{
+        'task':'notifications.dispatch_outbox',
+        'schedule':crontab(minute='*'),
+    },
+    'purge-dead-outbox':{
+        'task':'notifications.purge_dead_outbox',
+        'schedule':crontab(hour=4, minute=0),
+    },
+    'refresh-job-recommendations':{
+        'task':'recommendations.refresh_all',
+        'schedule':crontab(hour=3, minute=0),
+    },
 }
 
 STRIPE_SECRET_KEY = env('STRIPE_SECRET_KEY')
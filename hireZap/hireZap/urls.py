@@ -32,5 +32,8 @@ urlpatterns = [
     path('api/hr-round/',include('hr_round.urls')),
     path('api/offer/',include('offer.urls')),
     path('api/chatbot/', include('chatbot.urls')),
+    path('api/notifications/', include('notifications.urls')),
+    path('api/skills/', include('skills.urls')),
+    path('api/recommendations/', include('recommendations.urls')),
     
 ]
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class HrRoundConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'hr_round'
+
+    def ready(self):
+        import hr_round.signals
@@ -0,0 +1,38 @@
+"""
+hr_round/management/commands/consume_zegocloud_events.py
+
+Long-running consumer for the ZegoCloud webhook event buffer. Run one or
+more of these next to the web workers; each needs a distinct name.
+
+Usage:
+    python manage.py consume_zegocloud_events
+    python manage.py consume_zegocloud_events --name worker-2 --batch-size 500
+"""
+from django.core.management.base import BaseCommand
+from hr_round.tasks import drain_zegocloud_events
+import socket
+import os
+
+
+class Command(BaseCommand):
+    help = 'Consume buffered ZegoCloud webhook events in batches'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--name',
+            default=f'{socket.gethostname()}-{os.getpid()}',
+            help='Consumer name within the consumer group'
+        )
+        parser.add_argument('--batch-size', type=int, default=200)
+        parser.add_argument('--block-ms', type=int, default=5000, help='How long to wait for new events')
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"Consuming ZegoCloud events as {options['name']}")
+        try:
+            drain_zegocloud_events(
+                consumer=options['name'],
+                block_ms=options['block_ms'],
+                batch_size=options['batch_size']
+            )
+        except KeyboardInterrupt:
+            self.stdout.write('Stopped')
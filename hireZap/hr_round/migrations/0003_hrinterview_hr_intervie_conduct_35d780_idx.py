@@ -0,0 +1,22 @@
+# Generated by Django 5.2.5 on 2026-10-19 00:32
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('application', '0008_applicationstagehistory_score'),
+        ('hr_round', '0002_interviewchatmessage_message_type_and_more'),
+        ('job', '0007_jobmodel_min_experience'),
+        ('selection_process', '0004_alter_selectionprocessmodel_job_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='hrinterview',
+            index=models.Index(fields=['conducted_by', 'scheduled_at'], name='hr_intervie_conduct_35d780_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.5 on 2026-10-19 00:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hr_round', '0003_hrinterview_hr_intervie_conduct_35d780_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='interviewrecording',
+            name='checksum_sha256',
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name='interviewrecording',
+            name='source_url',
+            field=models.URLField(blank=True, max_length=1024, null=True),
+        ),
+    ]
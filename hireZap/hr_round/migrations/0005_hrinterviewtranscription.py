@@ -0,0 +1,37 @@
+# Generated by Django 5.2.5 on 2026-10-19 00:51
+
+import django.core.validators
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hr_round', '0004_interviewrecording_checksum_sha256_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HRInterviewTranscription',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('full_text', models.TextField()),
+                ('segments', models.JSONField(default=list)),
+                ('detected_language', models.CharField(default='en', max_length=10)),
+                ('confidence', models.FloatField(blank=True, null=True, validators=[django.core.validators.MinValueValidator(0.0), django.core.validators.MaxValueValidator(1.0)])),
+                ('processing_status', models.CharField(choices=[('pending', 'Pending'), ('processing', 'Processing'), ('completed', 'Completed'), ('failed', 'Failed')], default='pending', max_length=20)),
+                ('processing_time_seconds', models.FloatField(blank=True, null=True)),
+                ('error_message', models.TextField(blank=True, null=True)),
+                ('progress_percent', models.IntegerField(default=0, validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(100)])),
+                ('model_used', models.CharField(default='whisper-1', max_length=50)),
+                ('audio_sha256', models.CharField(blank=True, db_index=True, max_length=64, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('interview', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='transcription', to='hr_round.hrinterview')),
+            ],
+            options={
+                'db_table': 'hr_interview_transcriptions',
+            },
+        ),
+    ]
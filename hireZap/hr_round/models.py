@@ -123,6 +123,7 @@ class HRInterview(models.Model):
             models.Index(fields=['application', 'status']),
             models.Index(fields=['scheduled_at', 'status']),
             models.Index(fields=['status', 'scheduled_at']),
+            models.Index(fields=['conducted_by', 'scheduled_at']),
         ]
     
     def __str__(self):
@@ -233,6 +234,10 @@ class InterviewRecording(models.Model):
     file_size_bytes = models.BigIntegerField(null=True, blank=True)
     video_format = models.CharField(max_length=20, default='webm')
     resolution = models.CharField(max_length=20, blank=True, null=True)  # e.g., "1280x720"
+    checksum_sha256 = models.CharField(max_length=64, blank=True, null=True)
+    
+    # Provider (ZegoCloud) recording the file is ingested from
+    source_url = models.URLField(max_length=1024, blank=True, null=True)
     
     # Processing Status
     processing_status = models.CharField(
@@ -256,6 +261,59 @@ class InterviewRecording(models.Model):
         return f"Recording - {self.interview.candidate_name}"
 
 
+class HRInterviewTranscription(models.Model):
+    """Whisper transcription of an HR interview recording"""
+
+    interview = models.OneToOneField(
+        HRInterview,
+        on_delete=models.CASCADE,
+        related_name='transcription'
+    )
+    
+    full_text = models.TextField()
+    
+    # Timestamped segments (JSON), same format as telephonic transcriptions
+    segments = models.JSONField(default=list)
+    
+    detected_language = models.CharField(max_length=10, default='en')
+    confidence = models.FloatField(
+        validators=[MinValueValidator(0.0), MaxValueValidator(1.0)],
+        null=True,
+        blank=True
+    )
+    
+    processing_status = models.CharField(
+        max_length=20,
+        choices=[
+            ('pending', 'Pending'),
+            ('processing', 'Processing'),
+            ('completed', 'Completed'),
+            ('failed', 'Failed'),
+        ],
+        default='pending'
+    )
+    processing_time_seconds = models.FloatField(null=True, blank=True)
+    error_message = models.TextField(blank=True, null=True)
+    progress_percent = models.IntegerField(
+        default=0,
+        validators=[MinValueValidator(0), MaxValueValidator(100)]
+    )
+    
+    model_used = models.CharField(max_length=50, default='whisper-1')
+    
+    # SHA-256 of the recording (InterviewRecording.checksum_sha256)
+    audio_sha256 = models.CharField(max_length=64, blank=True, null=True, db_index=True)
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'hr_interview_transcriptions'
+    
+    def __str__(self):
+        return f"Transcription - {self.interview.candidate_name}"
+
+
 class InterviewNotes(models.Model):
 
     interview = models.OneToOneField(
@@ -213,6 +213,7 @@ class BulkScheduleHRInterviewSerializer(serializers.Serializer):
     )
     scheduled_at = serializers.DateTimeField()
     duration_minutes = serializers.IntegerField(min_value=15, max_value=180, default=45)
+    interval_minutes = serializers.IntegerField(min_value=0, max_value=24 * 60, default=0)
     timezone = serializers.CharField(default='Asia/Kolkata')
     scheduling_notes = serializers.CharField(required=False, allow_blank=True)
 
@@ -246,12 +247,12 @@ class InterviewRecordingSerializer(serializers.ModelSerializer):
             'id', 'interview', 'interview_id', 'candidate_name',
             'video_url', 'video_key', 'thumbnail_url', 'thumbnail_key',
             'duration_seconds', 'file_size_bytes', 'video_format',
-            'resolution', 'processing_status', 'processing_error',
+            'resolution', 'checksum_sha256', 'processing_status', 'processing_error',
             'upload_started_at', 'upload_completed_at',
             'created_at', 'updated_at'
         ]
         read_only_fields = [
-            'id', 'processing_status', 'processing_error',
+            'id', 'checksum_sha256', 'processing_status', 'processing_error',
             'upload_started_at', 'upload_completed_at',
             'created_at', 'updated_at'
         ]
@@ -0,0 +1,10 @@
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+from .models import HRInterview
+from infrastructure.repositories.transcript_search_repository import TranscriptSearchRepository
+
+
+@receiver(post_delete, sender=HRInterview)
+def clear_transcript_segments(sender, instance, **kwargs):
+    """ Indexed segments only reference the interview by id """
+    TranscriptSearchRepository().clear_segments('hr', instance.id)
@@ -1,8 +1,14 @@
 from celery import shared_task
 from django.utils import timezone
+from datetime import timedelta
 from infrastructure.repositories.hr_round_repository import HRInterviewRepository
 from infrastructure.services.notification_service import NotificationService
+from infrastructure.services.reminder_scheduler import InterviewReminderScheduler
 from infrastructure.services.hr_round_service import VideoProcessingService
+from infrastructure.services.storage_factory import StorageFactory
+import requests
+import tempfile
+import os
 import logging
 logger = logging.getLogger(__name__)
 
@@ -67,42 +73,81 @@ Regards,
         return {'success': False, 'error': str(e)}
 
 
-@shared_task(name='hr_interview.send_hr_interview_reminders')
-def send_hr_interview_reminders_task():
+def schedule_hr_interview_reminders(interview_ids: list):
+    """Queue ETA reminders for (re)scheduled HR interviews, using each job's reminder settings"""
+    repo = HRInterviewRepository()
+    scheduler = InterviewReminderScheduler()
+    settings_by_job = {}
+
+    for interview in repo.get_interviews_by_ids(interview_ids):
+        try:
+            if interview.job_id not in settings_by_job:
+                settings_by_job[interview.job_id] = repo.get_settings_by_id(interview.job_id)
+            settings = settings_by_job[interview.job_id]
+
+            if interview.status != 'scheduled' or not interview.scheduled_at or (settings and not settings.send_reminders):
+                scheduler.cancel('hr', interview.id)
+                continue
+
+            hours_before = settings.reminder_hours_before if settings else 24
+            scheduler.schedule(
+                'hr',
+                interview.id,
+                interview.scheduled_at - timedelta(hours=hours_before)
+            )
+        except Exception as e:
+            logger.error(f" Reminder scheduling failed for HR interview {interview.id}: {str(e)}")
+
+
+def cancel_hr_interview_reminder(interview_id: int):
+    try:
+        InterviewReminderScheduler().cancel('hr', interview_id)
+    except Exception as e:
+        logger.error(f" Reminder cancel failed for HR interview {interview_id}: {str(e)}")
+
+
+@shared_task(name='hr_interview.send_due_hr_interview_reminders')
+def send_due_hr_interview_reminders_task(bucket: int):
+    """Send every HR reminder due in one minute bucket as a single batch"""
     try:
         repo = HRInterviewRepository()
         notification_service = NotificationService()
         
-        # Get interviews that need reminders
-        interviews = repo.get_upcoming_interviews_for_reminder(hours_before=24)
-        
-        sent_count = 0
-        for interview in interviews:
-            # Send WebSocket notification
-            notification_service.send_websocket_notification(
-                user_id=interview.application.candidate_id,
-                notification_type='interview_reminder',
-                data={
-                    'interview_id': interview.id,
-                    'job_title': interview.job.job_title,
-                    'scheduled_at': interview.scheduled_at.isoformat(),
-                    'duration': interview.scheduled_duration_minutes,
-                    'type': 'hr_interview'
-                }
-            )
-            
-            # Send email
-            _send_reminder_email(interview)
-            
-            # Mark as sent
-            repo.mark_reminder_sent(interview.id)
-            sent_count += 1
-        
-        logger.info(f" Sent {sent_count} HR interview reminders")
+        interview_ids = InterviewReminderScheduler().pop_due('hr', bucket)
+        if not interview_ids:
+            return {'success': True, 'reminders_sent': 0}
+        
+        # Cancelled, started or already reminded interviews drop out here
+        interviews = repo.get_interviews_due_for_reminder(interview_ids)
+        
+        sent_ids = []
+        with notification_service.buffered():
+            for interview in interviews:
+                try:
+                    notification_service.send_websocket_notification(
+                        user_id=interview.application.candidate_id,
+                        notification_type='interview_reminder',
+                        data={
+                            'interview_id': interview.id,
+                            'job_title': interview.job.job_title,
+                            'scheduled_at': interview.scheduled_at.isoformat(),
+                            'duration': interview.scheduled_duration_minutes,
+                            'type': 'hr_interview'
+                        }
+                    )
+                    _send_reminder_email(interview)
+                    sent_ids.append(interview.id)
+                except Exception as e:
+                    logger.error(f" Reminder failed for HR interview {interview.id}: {str(e)}")
+        
+        if sent_ids:
+            repo.mark_reminders_sent(sent_ids)
+        
+        logger.info(f" Sent {len(sent_ids)} HR interview reminders for bucket {bucket}")
         
         return {
             'success': True,
-            'reminders_sent': sent_count
+            'reminders_sent': len(sent_ids)
         }
         
     except Exception as e:
@@ -110,6 +155,13 @@ def send_hr_interview_reminders_task():
         return {'success': False, 'error': str(e)}
 
 
+@shared_task(name='hr_interview.queue_hr_interview_reminders')
+def queue_hr_interview_reminders_task():
+    """Hand reminder buckets that are now within the ETA horizon to Celery"""
+    queued = InterviewReminderScheduler().queue_upcoming('hr')
+    return {'success': True, 'queued_buckets': queued}
+
+
 def _send_reminder_email(interview):
     """Send reminder email"""
     candidate_name = interview.candidate_name
@@ -117,7 +169,7 @@ def _send_reminder_email(interview):
     job_title = interview.job.job_title
     scheduled_time = interview.scheduled_at.strftime('%B %d, %Y at %I:%M %p')
     
-    subject = f"Reminder: HR Interview Tomorrow - {job_title}"
+    subject = f"Reminder: Upcoming HR Interview - {job_title}"
     
     message = f"""
 Dear {candidate_name},
@@ -198,6 +250,189 @@ def process_interview_completion_task(interview_id: int):
         return {'success': False, 'error': str(e)}
 
 
+@shared_task(bind=True, name='hr_interview.ingest_zegocloud_recording', max_retries=3, default_retry_delay=60)
+def ingest_zegocloud_recording_task(self, interview_id: int):
+    """
+    Copy a ZegoCloud recording into R2 (streamed, multipart) and record
+    size, checksum, duration, resolution and a keyframe thumbnail.
+    """
+    repo = HRInterviewRepository()
+    recording = repo.get_recording_by_interview(interview_id)
+
+    if not recording or not recording.source_url:
+        return {'success': False, 'error': 'Recording not found'}
+
+    if recording.processing_status == 'completed' and recording.checksum_sha256:
+        return {'success': True, 'message': 'Already ingested'}
+
+    stored = probe = None
+    try:
+        repo.mark_recording_uploading(interview_id)
+
+        service = VideoProcessingService()
+        filename = recording.source_url.split('?')[0].rsplit('/', 1)[-1] or 'recording.webm'
+        stored = service.ingest_recording(recording.source_url, interview_id, filename)
+
+        # Probe the stored copy - provider URLs may expire
+        signed_url = StorageFactory.create_storage('r2').generate_signed_url(stored['video_key'])
+        probe = service.probe_recording(signed_url, interview_id)
+
+        fields = {
+            'video_url': stored['video_url'],
+            'video_key': stored['video_key'],
+            'file_size_bytes': stored['file_size'],
+            'checksum_sha256': stored['checksum'],
+            'video_format': stored['video_format'],
+        }
+        if probe['success']:
+            fields.update({
+                'duration_seconds': probe['duration_seconds'],
+                'resolution': probe['resolution'],
+                'thumbnail_url': probe['thumbnail_url'],
+                'thumbnail_key': probe['thumbnail_key'],
+            })
+        repo.complete_recording_ingestion(interview_id, **fields)
+
+    except Exception as e:
+        logger.error(f" Recording ingestion failed for interview {interview_id}: {str(e)}")
+        # Every attempt uploads to a new key; don't leave this one behind
+        if stored:
+            service.delete_recording(
+                video_key=stored['video_key'],
+                thumbnail_key=probe.get('thumbnail_key') if probe else None
+            )
+        if self.request.retries >= self.max_retries:
+            repo.mark_recording_failed(interview_id, str(e))
+            return {'success': False, 'error': str(e)}
+        raise self.retry(exc=e)
+
+    interview = repo.get_interview_by_id(interview_id)
+    if interview and interview.conducted_by_id:
+        NotificationService().send_websocket_notification(
+            user_id=interview.conducted_by_id,
+            notification_type='recording_uploaded',
+            data={
+                'interview_id': interview_id,
+                'recording_url': stored['video_url']
+            }
+        )
+
+    transcribe_hr_recording_task.delay(interview_id)
+
+    logger.info(f" Recording of interview {interview_id} ingested ({stored['file_size']} bytes)")
+    return {'success': True, 'file_size': stored['file_size'], 'checksum': stored['checksum']}
+
+
+@shared_task(name='hr_interview.transcribe_hr_recording')
+def transcribe_hr_recording_task(interview_id: int):
+    """
+    Run the stored HR recording through the Whisper pipeline used for
+    telephonic calls; segments are indexed for transcript search.
+    """
+    from infrastructure.services.telephonic_service import TranscriptionService
+    from infrastructure.repositories.transcript_search_repository import TranscriptSearchRepository
+    from core.use_cases.telephonic_round.stream_transcription_usecase import StreamTranscriptionUseCase
+
+    try:
+        repo = HRInterviewRepository()
+        interview = repo.get_interview_by_id(interview_id)
+        recording = repo.get_recording_by_interview(interview_id)
+
+        if not interview or not recording or recording.processing_status != 'completed':
+            return {'success': False, 'error': 'Ingested recording not found'}
+
+        settings = repo.get_settings_by_id(interview.job_id)
+        signed_url = StorageFactory.create_storage('r2').generate_signed_url(recording.video_key)
+
+        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=f".{recording.video_format or 'webm'}")
+        try:
+            with requests.get(signed_url, stream=True, timeout=(10, 60)) as response:
+                response.raise_for_status()
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
+                    temp_file.write(chunk)
+            temp_file.close()
+
+            # Whisper decodes the audio track of the video container
+            result = StreamTranscriptionUseCase(
+                repo,
+                TranscriptionService(),
+                NotificationService(),
+                search_repository=TranscriptSearchRepository(),
+                round_name='hr'
+            ).execute(interview, temp_file.name, settings, audio_sha256=recording.checksum_sha256)
+
+        finally:
+            try:
+                os.unlink(temp_file.name)
+            except OSError:
+                pass
+
+        if not result['success']:
+            return {'success': False, 'error': f"Transcription failed: {result.get('error')}"}
+
+        return {'success': True, 'interview_id': interview_id, 'segments': len(result['segments'])}
+
+    except Exception as e:
+        logger.error(f" HR recording transcription failed for interview {interview_id}: {str(e)}")
+        return {'success': False, 'error': str(e)}
+
+
+def drain_zegocloud_events(consumer: str, block_ms: int = None, max_batches: int = None, batch_size: int = 200) -> dict:
+    """
+    Process buffered ZegoCloud webhook events batch by batch.
+    Only processed entries are acknowledged: failed ones stay pending and
+    are redelivered (then dead-lettered), and a crash leaves the whole
+    batch pending for another consumer to claim.
+    """
+    from infrastructure.services.zegocloud_event_buffer import ZegoCloudEventBuffer
+    from core.use_cases.hr_round.recording_management import ProcessZegoCloudWebhookUseCase
+
+    buffer = ZegoCloudEventBuffer()
+    use_case = ProcessZegoCloudWebhookUseCase(HRInterviewRepository(), NotificationService())
+
+    batches = processed = failed = dead_lettered = 0
+    while max_batches is None or batches < max_batches:
+        entries = buffer.read(consumer, count=batch_size, block_ms=block_ms)
+        if not entries:
+            if block_ms is None:
+                break
+            continue
+
+        result = use_case.process_batch(
+            [event for _, event in entries],
+            event_ids=[entry_id for entry_id, _ in entries]
+        )
+        errors = dict(zip(result['failed_ids'], result['errors']))
+        buffer.ack([entry_id for entry_id, _ in entries if entry_id not in errors])
+
+        batches += 1
+        processed += result['processed']
+        failed += result['failed']
+        if errors:
+            logger.warning(f" {result['failed']} ZegoCloud events failed, left for retry: {result['errors'][:5]}")
+            dead_lettered += buffer.retry_later([
+                (entry_id, event, errors[entry_id]) for entry_id, event in entries if entry_id in errors
+            ])
+
+    return {
+        'success': True,
+        'batches': batches,
+        'processed': processed,
+        'failed': failed,
+        'dead_lettered': dead_lettered
+    }
+
+
+@shared_task(name='hr_interview.flush_zegocloud_events')
+def flush_zegocloud_events_task():
+    """Safety net draining the ZegoCloud event buffer when no consumer is running"""
+    try:
+        return drain_zegocloud_events(consumer='celery-flush', max_batches=50)
+    except Exception as e:
+        logger.error(f" Error flushing ZegoCloud events: {e}")
+        return {'success': False, 'error': str(e)}
+
+
 # @shared_task(name='hr_interview.cleanup_interview_chat')
 # def cleanup_interview_chat_task(interview_id: int):
 #     """Cleanup interview chat from Redis after interview ends"""
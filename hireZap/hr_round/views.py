@@ -3,6 +3,7 @@ from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from django.conf import settings
 
 from hr_round.serializers import(
@@ -23,6 +24,7 @@ from hr_round.serializers import(
 from infrastructure.services.notification_service import NotificationService
 from infrastructure.services.storage_factory import StorageFactory
 from infrastructure.repositories.hr_round_repository import HRInterviewRepository
+from infrastructure.repositories.interview_calendar_repository import InterviewCalendarRepository
 
 from core.use_cases.hr_round.schedule_interiew import (
     ScheduleInterviewUsecase,
@@ -53,6 +55,9 @@ from core.use_cases.hr_round.notes_management import(
     FinalizeNotesUseCase
 )
 from infrastructure.services.hr_round_service import MeetingService, VideoProcessingService
+from infrastructure.services.zegocloud_event_buffer import ZegoCloudEventBuffer
+import logging
+logger = logging.getLogger(__name__)
 
 
 class GetHRRoundSettingsAPIView(APIView):
@@ -133,16 +138,27 @@ class GetHRInterviewsAPIView(APIView):
     def get(self, request, job_id):
         try:
             status_filter = request.query_params.get('status', None)
+            page = max(int(request.query_params.get('page', 1)), 1)
+            page_size = min(max(int(request.query_params.get('page_size', 20)), 1), 100)
             
             repository = HRInterviewRepository()
-            interviews = repository.list_interviews_by_job(job_id, status_filter)
+            interviews, total_count, status_counts = repository.list_interviews_by_job(
+                job_id,
+                status_filter,
+                page=page,
+                page_size=page_size
+            )
             
             serializer = HRInterviewListSerializer(interviews, many=True)
             
             return Response({
                 'success': True,
                 'interviews': serializer.data,
-                'count': len(interviews)
+                'count': total_count,
+                'page': page,
+                'page_size': page_size,
+                'total_pages': (total_count + page_size - 1) // page_size,
+                'status_counts': status_counts
             })
             
         except Exception as e:
@@ -258,7 +274,7 @@ class ScheduleHRInterviewAPIView(APIView):
             data = serializer.validated_data
             
             # Execute use case
-            use_case = ScheduleInterviewUsecase(repository, notification_service)
+            use_case = ScheduleInterviewUsecase(repository, notification_service, InterviewCalendarRepository())
             result = use_case.execute(
                 application_id=data['application_id'],
                 scheduled_at=data['scheduled_at'],
@@ -301,14 +317,15 @@ class BulkScheduleHRInterviewsAPIView(APIView):
             repository = HRInterviewRepository()
             notification_service = NotificationService()
             # Execute use case
-            use_case = BulkScheduleHRInterviewUsecase(repository, notification_service)
+            use_case = BulkScheduleHRInterviewUsecase(repository, notification_service, InterviewCalendarRepository())
             result = use_case.execute(
                 application_ids=data['application_ids'],
                 scheduled_at=data['scheduled_at'],
                 duration_minutes=data.get('duration_minutes', 45),
                 timezone_str=data.get('timezone', 'Asia/Kolkata'),
                 conducted_by_id=request.user.id,
-                scheduling_notes=data.get('scheduling_notes')
+                scheduling_notes=data.get('scheduling_notes'),
+                interval_minutes=data.get('interval_minutes', 0)
             )
             
             return Response({
@@ -330,20 +347,24 @@ class RescheduleHRInterviewAPIView(APIView):
     
     def put(self, request, interview_id):
         try:
-            new_scheduled_at = request.data.get('scheduled_at')
+            new_scheduled_at = parse_datetime(str(request.data.get('scheduled_at') or ''))
             new_duration = request.data.get('duration_minutes')
             reschedule_reason = request.data.get('reason')
             
             if not new_scheduled_at:
                 return Response({
                     'success': False,
-                    'error': 'scheduled_at is required'
+                    'error': 'A valid scheduled_at is required'
                 }, status=status.HTTP_400_BAD_REQUEST)
+
+            if timezone.is_naive(new_scheduled_at):
+                new_scheduled_at = timezone.make_aware(new_scheduled_at)
+            new_duration = int(new_duration) if new_duration else None
             
             # Execute use case
             repository = HRInterviewRepository()
             notification_service = NotificationService()
-            use_case = RescheduleHRInterviewUsecase(repository, notification_service)
+            use_case = RescheduleHRInterviewUsecase(repository, notification_service, InterviewCalendarRepository())
             result = use_case.execute(
                 interview_id=interview_id,
                 new_scheduled_at=new_scheduled_at,
@@ -551,7 +572,7 @@ class JoinMeetingAPIView(APIView):
                 role = getattr(request.user, 'role', None)
                 participant_type = 'candidate' if role == 'candidate' else 'recruiter'
             from infrastructure.services.hr_round_service import MeetingService
-            user_token = MeetingService.generate_zegocloud_token(
+            user_token = MeetingService.get_zegocloud_token(
                 user_id=str(request.user.id),
                 room_id=session.room_id
             )
@@ -714,6 +735,13 @@ class ZegoCloudWebhookAPIView(APIView):
                     'error': 'Invalid signature'
                 }, status=status.HTTP_401_UNAUTHORIZED)
             
+            # Write-behind: queue the event and acknowledge right away
+            try:
+                ZegoCloudEventBuffer().append(request.data)
+                return Response({'success': True, 'queued': True})
+            except Exception as e:
+                logger.warning(f" ZegoCloud event buffer unavailable, processing inline: {e}")
+            
             repository = HRInterviewRepository()
             notification_service = NotificationService()
             use_case = ProcessZegoCloudWebhookUseCase(repository, notification_service)
@@ -731,6 +759,9 @@ class ZegoCloudWebhookAPIView(APIView):
         import hmac
         import hashlib
         
+        if not signature:
+            return False
+        
         secret = settings.ZEGOCLOUD_SERVER_SECRET.encode()
         expected_signature = hmac.new(
             secret,
@@ -205,7 +205,7 @@ class ApplicationProgressRepository(ApplicationProgressRepositoryPort):
                     
                     candidate_id = str(interview.application.candidate_id)
                     logger.info(f"Generating token for candidate_id={candidate_id}, room_id={session.room_id}")
-                    candidate_token = MeetingService.generate_zegocloud_token(
+                    candidate_token = MeetingService.get_zegocloud_token(
                         user_id=candidate_id,
                         room_id=session.room_id
                     )
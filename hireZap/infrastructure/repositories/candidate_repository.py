@@ -42,6 +42,8 @@ class CandidateRepository(CandidateRepositoryPort):
                 model.website = profile.website
             if profile.resume_url is not None:
                 model.resume_url = profile.resume_url
+            if profile.preferred_work_type is not None:
+                model.preferred_work_type = profile.preferred_work_type or None
 
             model.save()
             return self._profile_to_entity(model)
@@ -73,6 +75,7 @@ class CandidateRepository(CandidateRepositoryPort):
             location=model.location,
             resume_url=model.resume_url,
             website=model.website,
+            preferred_work_type=model.preferred_work_type,
             created_at=model.created_at,
             updated_at=model.updated_at
         )
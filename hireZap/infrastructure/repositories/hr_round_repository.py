@@ -1,7 +1,8 @@
 from typing import List, Optional, Dict
 from django.db import transaction
+from django.db.models import Count
+from django.core.cache import cache
 from django.utils import timezone
-from datetime import timedelta
 import uuid
 
 from hr_round.models import(
@@ -9,6 +10,7 @@ from hr_round.models import(
     HRRoundSettings,
     MeetingSession,
     InterviewRecording,
+    HRInterviewTranscription,
     InterviewNotes,
     InterviewChatMessage,
     InterviewResult
@@ -79,61 +81,74 @@ class HRInterviewRepository(HRRoundRepositoryPort):
         except HRInterview.DoesNotExist:
             return None
     
-    def list_interviews_by_job(self, job_id: int, status: str = None):
-
-        queryset = HRInterview.objects.filter(job_id=job_id)
-        if status and status != 'not_scheduled':
-            queryset = queryset.filter(status=status)
-        
-        existing_interviews = list(queryset.select_related(
-            'application', 'job', 'stage', 'conducted_by',
-            'meeting_session', 'result', 'recording', 'notes'
-        ).order_by('-scheduled_at'))
+    def list_interviews_by_job(
+        self,
+        job_id: int,
+        status: str = None,
+        page: int = 1,
+        page_size: int = 20) -> tuple[List[HRInterview], int, Dict[str, int]]:
+        """
+        One page of a job's HR interviews plus per-status counts.
+        Applications in the HR stage without an interview row are returned
+        as unsaved, virtual 'not_scheduled' interviews (id None) first;
+        rows are only created when the interview is scheduled.
+        """
+        status = None if status == 'all' else status
 
-        if status and status != 'not_scheduled' and status != 'all':
-            return existing_interviews
+        existing = HRInterview.objects.filter(job_id=job_id)
+        status_counts = dict(
+            existing.order_by().values('status').annotate(count=Count('id')).values_list('status', 'count')
+        )
 
+        # Applications waiting in the HR stage that have no interview row yet
+        virtual = ApplicationModel.objects.none()
         hr_stage_process = SelectionProcessModel.objects.filter(
             job_id=job_id,
             stage__slug='hr-round',
             is_active=True
         ).select_related('stage').first()
 
-        if not hr_stage_process:
-            return existing_interviews
+        if hr_stage_process:
+            virtual = ApplicationModel.objects.filter(
+                job_id=job_id,
+                current_stage=hr_stage_process.stage,
+                is_draft=False,
+                current_stage_status__in=['pending', 'started'],
+                hr_interview__isnull=True
+            )
+        # Counted for every tab; only listed on the 'all' and 'not_scheduled' ones
+        virtual_count = virtual.count()
+        status_counts['not_scheduled'] = status_counts.get('not_scheduled', 0) + virtual_count
+        listed_virtual_count = virtual_count if status in (None, 'not_scheduled') else 0
 
-        existing_application_ids = {i.application_id for i in existing_interviews}
+        if status:
+            existing = existing.filter(status=status)
+        existing_count = existing.count()
 
-        unscheduled_applications = ApplicationModel.objects.filter(
-            job_id=job_id,
-            current_stage=hr_stage_process.stage,
-            is_draft=False,
-            current_stage_status__in=['pending', 'started'],
-        ).exclude(
-            id__in=existing_application_ids
-        ).select_related('candidate', 'candidate__user', 'current_stage', 'job')
+        start = (page - 1) * page_size
+        end = start + page_size
 
-        new_interviews = []
-        for app in unscheduled_applications:
-            interview, created = HRInterview.objects.get_or_create(
-                application=app,
-                defaults={
-                    'job_id': job_id,
-                    'stage': hr_stage_process.stage,
-                    'status': 'not_scheduled',
-                }
-            )
-            if created:
-                # Re-fetch with all relations
-                interview = HRInterview.objects.select_related(
-                    'application', 'job', 'stage', 'conducted_by'
-                ).get(id=interview.id)
-            new_interviews.append(interview)
+        # Virtual rows come first, then stored interviews
+        interviews = []
+        if start < listed_virtual_count:
+            for app in virtual.select_related('job', 'job__company', 'current_stage').order_by('-created_at', 'id')[start:end]:
+                interviews.append(HRInterview(
+                    application=app,
+                    job=app.job,
+                    stage=hr_stage_process.stage,
+                    status='not_scheduled'
+                ))
 
-        if status == 'not_scheduled':
-            return new_interviews
+        remaining = page_size - len(interviews)
+        if remaining > 0:
+            existing_start = max(start - listed_virtual_count, 0)
+            interviews.extend(existing.select_related(
+                'application', 'job', 'job__company', 'stage', 'conducted_by',
+                'meeting_session', 'result', 'recording', 'notes'
+            ).order_by('-scheduled_at', 'id')[existing_start:existing_start + remaining])
 
-        return new_interviews + existing_interviews
+        status_counts['all'] = sum(v for k, v in status_counts.items() if k != 'all')
+        return interviews, listed_virtual_count + existing_count, status_counts
     
     def list_interviews_by_recruiter(
         self,
@@ -185,30 +200,76 @@ class HRInterviewRepository(HRRoundRepositoryPort):
         
         return interview
     
+    def get_interview_statuses_by_application(self, application_ids: List[int]) -> Dict[int, str]:
+        return dict(
+            HRInterview.objects.filter(
+                application_id__in=application_ids
+            ).values_list('application_id', 'status')
+        )
+    
     @transaction.atomic
     def bulk_schedule_interviews(
         self,
-        application_ids: List[int],
-        scheduled_at: timezone.datetime,
+        schedules: List[Dict],
         duration_minutes: int,
         timezone_str: str,
         conducted_by_id: int,
-        scheduling_notes: str = None) -> List[HRInterview]:
-        """Schedule multiple interviews at once"""
-        
-        interviews = []
-        for app_id in application_ids:
-            interview = self.schedule_interview(
-                application_id=app_id,
-                scheduled_at=scheduled_at,
-                duration_minutes=duration_minutes,
-                timezone_str=timezone_str,
-                conducted_by_id=conducted_by_id,
-                scheduling_notes=scheduling_notes
+        scheduling_notes: str = None) -> List[int]:
+        """
+        Schedule many interviews at once: missing interview rows are created
+        in one bulk_create, existing ones updated in one bulk_update.
+        schedules: [{'application_id', 'scheduled_at'}]
+        Returns the ids of the scheduled interviews.
+        """
+        times = {schedule['application_id']: schedule['scheduled_at'] for schedule in schedules}
+        applications = list(ApplicationModel.objects.select_for_update().filter(id__in=times.keys()))
+        existing = {
+            interview.application_id: interview
+            for interview in HRInterview.objects.filter(application_id__in=times.keys())
+        }
+        now = timezone.now()
+
+        to_create = []
+        to_update = []
+        for application in applications:
+            interview = existing.get(application.id)
+            if interview is None:
+                interview = HRInterview(
+                    application=application,
+                    job_id=application.job_id,
+                    stage_id=application.current_stage_id
+                )
+                to_create.append(interview)
+            else:
+                to_update.append(interview)
+
+            interview.scheduled_at = times[application.id]
+            interview.scheduled_duration_minutes = duration_minutes
+            interview.timezone = timezone_str
+            interview.conducted_by_id = conducted_by_id
+            interview.scheduling_notes = scheduling_notes
+            interview.status = 'scheduled'
+            interview.reminder_sent = False
+            interview.updated_at = now
+
+            application.status = 'interview_scheduled'
+            application.interview_date = times[application.id]
+            application.updated_at = now
+
+        HRInterview.objects.bulk_create(to_create)
+        HRInterview.objects.bulk_update(
+            to_update,
+            ['scheduled_at', 'scheduled_duration_minutes', 'timezone', 'conducted_by',
+             'scheduling_notes', 'status', 'reminder_sent', 'updated_at']
+        )
+        ApplicationModel.objects.bulk_update(applications, ['status', 'interview_date', 'updated_at'])
+
+        if to_create and to_create[0].pk is None:
+            # Backends that do not return primary keys from bulk_create
+            return list(
+                HRInterview.objects.filter(application_id__in=times.keys()).values_list('id', flat=True)
             )
-            interviews.append(interview)
-        
-        return interviews
+        return [interview.id for interview in to_create + to_update]
     
     def update_interview_status(
         self,
@@ -265,25 +326,22 @@ class HRInterviewRepository(HRRoundRepositoryPort):
             email_sent=True
         )
     
-    def mark_reminder_sent(self, interview_id: int):
-        """Mark reminder as sent"""
-        HRInterview.objects.filter(id=interview_id).update(
+    def mark_reminders_sent(self, interview_ids: List[int]):
+        """Mark reminders as sent with one UPDATE"""
+        HRInterview.objects.filter(id__in=interview_ids).update(
             reminder_sent=True
         )
     
-    def get_upcoming_interviews_for_reminder(
-        self,
-        hours_before: int = 24) -> List[HRInterview]:
-        """Get interviews that need reminders"""
-        now = timezone.now()
-        target_time = now + timedelta(hours=hours_before)
-        
-        return HRInterview.objects.filter(
-            status='scheduled',
-            scheduled_at__lte=target_time,
-            scheduled_at__gte=now,
-            reminder_sent=False
-        ).select_related('application', 'job')
+    def get_interviews_due_for_reminder(self, interview_ids: List[int]) -> List[HRInterview]:
+        """Interviews of a reminder batch that are still upcoming and not yet reminded"""
+        return list(
+            HRInterview.objects.filter(
+                id__in=interview_ids,
+                status='scheduled',
+                scheduled_at__gte=timezone.now(),
+                reminder_sent=False
+            ).select_related('application', 'job', 'job__company')
+        )
     
     #Meeting Sessions
     
@@ -296,11 +354,6 @@ class HRInterviewRepository(HRRoundRepositoryPort):
         session_id = str(uuid.uuid4())
         room_id = f"hr-{interview_id}-{uuid.uuid4().hex[:8]}"
         
-        from infrastructure.services.hr_round_service import MeetingService
-        zegocloud_token = MeetingService.generate_zegocloud_token(
-            user_id=recruiter_id,
-            room_id=room_id
-        )
         return MeetingSession.objects.create(
             interview_id=interview_id,
             session_id=session_id,
@@ -319,6 +372,41 @@ class HRInterviewRepository(HRRoundRepositoryPort):
         except MeetingSession.DoesNotExist:
             return None
     
+    ROOM_CACHE_TTL = 60 * 60 * 6
+
+    def _room_cache_key(self, room_id: str) -> str:
+        return f'hr_interview:meeting_room:{room_id}'
+
+    def get_meeting_rooms(self, room_ids: List[str]) -> Dict[str, Dict]:
+        """
+        room_id -> {'session_id', 'interview_id', 'conducted_by_id'}.
+        Served from the cache; only unknown rooms hit the database (one query).
+        """
+        room_ids = set(room_ids)
+        keys = {self._room_cache_key(room_id): room_id for room_id in room_ids}
+        rooms = {keys[key]: value for key, value in cache.get_many(list(keys)).items()}
+
+        missing = room_ids - set(rooms)
+        if missing:
+            fetched = {}
+            sessions = MeetingSession.objects.filter(room_id__in=missing).values(
+                'room_id', 'session_id', 'interview_id', 'interview__conducted_by_id'
+            )
+            for session in sessions:
+                fetched[session['room_id']] = {
+                    'session_id': session['session_id'],
+                    'interview_id': session['interview_id'],
+                    'conducted_by_id': session['interview__conducted_by_id'],
+                }
+            if fetched:
+                cache.set_many(
+                    {self._room_cache_key(room_id): room for room_id, room in fetched.items()},
+                    self.ROOM_CACHE_TTL
+                )
+            rooms.update(fetched)
+
+        return rooms
+
     def get_meeting_session_by_interview(
         self,
         interview_id: int) -> Optional[MeetingSession]:
@@ -354,6 +442,10 @@ class HRInterviewRepository(HRRoundRepositoryPort):
         return session
     
     def delete_meeting_session(self, session_id:str):
+        from infrastructure.services.hr_round_service import MeetingService
+        for room_id in MeetingSession.objects.filter(session_id=session_id).values_list('room_id', flat=True):
+            MeetingService.invalidate_zegocloud_tokens(room_id)
+            cache.delete(self._room_cache_key(room_id))
         try:
             MeetingSession.objects.filter(session_id=session_id).delete()
         except MeetingSession.DoesNotExist:
@@ -390,6 +482,9 @@ class HRInterviewRepository(HRRoundRepositoryPort):
             session.recording_stopped_at = timezone.now()
         
         session.save()
+
+        from infrastructure.services.hr_round_service import MeetingService
+        MeetingService.invalidate_zegocloud_tokens(session.room_id)
         
         # Update interview status
         interview = session.interview
@@ -427,6 +522,60 @@ class HRInterviewRepository(HRRoundRepositoryPort):
             }
         )
         return recording
+    def create_pending_recording(
+        self,
+        interview_id: int,
+        source_url: str,
+        source_key: str = None) -> InterviewRecording:
+        """
+        Record a provider recording waiting to be ingested into storage.
+        A recording already ingested is left as is (webhooks are redelivered).
+        """
+        pending = {
+            'source_url': source_url,
+            'video_url': source_url,
+            'video_key': source_key,
+            'checksum_sha256': None,
+            'processing_status': 'pending',
+            'processing_error': None
+        }
+        recording, created = InterviewRecording.objects.get_or_create(
+            interview_id=interview_id,
+            defaults=pending
+        )
+        if created or (recording.processing_status == 'completed' and recording.checksum_sha256):
+            return recording
+
+        for field, value in pending.items():
+            setattr(recording, field, value)
+        recording.save(update_fields=[*pending, 'updated_at'])
+        return recording
+    
+    def mark_recording_uploading(self, interview_id: int):
+        InterviewRecording.objects.filter(interview_id=interview_id).update(
+            processing_status='uploading',
+            upload_started_at=timezone.now(),
+            updated_at=timezone.now()
+        )
+    
+    def complete_recording_ingestion(self, interview_id: int, **fields) -> InterviewRecording:
+        """Store R2 location and metadata (size, checksum, duration...) of an ingested recording"""
+        InterviewRecording.objects.filter(interview_id=interview_id).update(
+            processing_status='completed',
+            processing_error=None,
+            upload_completed_at=timezone.now(),
+            updated_at=timezone.now(),
+            **fields
+        )
+        return InterviewRecording.objects.get(interview_id=interview_id)
+    
+    def mark_recording_failed(self, interview_id: int, error: str):
+        InterviewRecording.objects.filter(interview_id=interview_id).update(
+            processing_status='failed',
+            processing_error=error,
+            updated_at=timezone.now()
+        )
+    
     def save_zegocloud_recording(
         self,
         session_id: str,
@@ -460,6 +609,131 @@ class HRInterviewRepository(HRRoundRepositoryPort):
         except InterviewRecording.DoesNotExist:
             return None
     
+    # Transcription
+    
+    def create_transcription(
+        self,
+        interview_id: int,
+        full_text: str,
+        segments: List[Dict],
+        detected_language: str = 'en',
+        confidence: Optional[float] = None,
+        model_used: Optional[str] = None,
+        processing_time_seconds: Optional[float] = None,
+        audio_sha256: Optional[str] = None) -> HRInterviewTranscription:
+        
+        defaults = {
+            'full_text': full_text,
+            'segments': segments,
+            'detected_language': detected_language,
+            'confidence': confidence,
+            'processing_status': 'completed',
+            'progress_percent': 100,
+            'processing_time_seconds': processing_time_seconds,
+            'audio_sha256': audio_sha256,
+            'error_message': None,
+        }
+        if model_used:
+            defaults['model_used'] = model_used
+        
+        transcription, created = HRInterviewTranscription.objects.update_or_create(
+            interview_id=interview_id,
+            defaults=defaults
+        )
+        return transcription
+    
+    def get_completed_transcription_by_hash(self, audio_sha256: str) -> Optional[HRInterviewTranscription]:
+        if not audio_sha256:
+            return None
+        return HRInterviewTranscription.objects.filter(
+            audio_sha256=audio_sha256,
+            processing_status='completed'
+        ).order_by('-updated_at').first()
+    
+    def get_transcription(self, interview_id: int) -> Optional[HRInterviewTranscription]:
+        try:
+            return HRInterviewTranscription.objects.get(interview_id=interview_id)
+        except HRInterviewTranscription.DoesNotExist:
+            return None
+    
+    def start_transcription(
+        self,
+        interview_id: int,
+        model_used: str,
+        audio_sha256: Optional[str] = None) -> HRInterviewTranscription:
+        """Create (or reopen) a transcription that will be filled in batches"""
+        transcription, created = HRInterviewTranscription.objects.get_or_create(
+            interview_id=interview_id,
+            defaults={
+                'full_text': '',
+                'segments': [],
+                'processing_status': 'processing',
+                'model_used': model_used,
+                'audio_sha256': audio_sha256
+            }
+        )
+        if not created:
+            # A different recording invalidates the stored partial segments
+            if audio_sha256 and transcription.audio_sha256 != audio_sha256:
+                transcription.full_text = ''
+                transcription.segments = []
+                transcription.progress_percent = 0
+                transcription.processing_time_seconds = None
+                transcription.audio_sha256 = audio_sha256
+                transcription.model_used = model_used
+            transcription.processing_status = 'processing'
+            transcription.error_message = None
+            transcription.save()
+        return transcription
+    
+    def append_transcription_segments(
+        self,
+        interview_id: int,
+        segments: List[Dict],
+        progress_percent: int) -> HRInterviewTranscription:
+        
+        transcription = HRInterviewTranscription.objects.get(interview_id=interview_id)
+        transcription.segments = (transcription.segments or []) + segments
+        batch_text = " ".join(s['text'] for s in segments if s.get('text'))
+        transcription.full_text = f"{transcription.full_text} {batch_text}".strip()
+        transcription.progress_percent = progress_percent
+        transcription.save(update_fields=['segments', 'full_text', 'progress_percent', 'updated_at'])
+        return transcription
+    
+    def complete_transcription(
+        self,
+        interview_id: int,
+        detected_language: str,
+        confidence: Optional[float] = None,
+        model_used: Optional[str] = None,
+        processing_time_seconds: Optional[float] = None) -> HRInterviewTranscription:
+        
+        transcription = HRInterviewTranscription.objects.get(interview_id=interview_id)
+        transcription.detected_language = detected_language
+        transcription.confidence = confidence
+        transcription.processing_status = 'completed'
+        transcription.progress_percent = 100
+        # Resumed runs add to the time already spent
+        transcription.processing_time_seconds = (
+            (transcription.processing_time_seconds or 0) + (processing_time_seconds or 0)
+        )
+        if model_used:
+            transcription.model_used = model_used
+        transcription.save()
+        return transcription
+    
+    def update_transcription_status(
+        self,
+        interview_id: int,
+        status: str,
+        error_message: Optional[str] = None) -> HRInterviewTranscription:
+        transcription = HRInterviewTranscription.objects.get(interview_id=interview_id)
+        transcription.processing_status = status
+        if error_message:
+            transcription.error_message = error_message
+        transcription.save()
+        return transcription
+    
     #Notes
     
     def create_or_update_notes(
@@ -541,6 +815,41 @@ class HRInterviewRepository(HRRoundRepositoryPort):
             message=message_data.get('message'),
             message_type=message_data.get('type', 'text')
         )
+    def bulk_save_zegocloud_chat_messages(self, messages: List[Dict]) -> int:
+        """
+        Save a batch of ZegoCloud chat messages ({'interview_id', 'message_data'}).
+        Messages already stored (redelivered webhooks) are skipped.
+        """
+        message_ids = [
+            item['message_data'].get('message_id') for item in messages
+            if item['message_data'].get('message_id')
+        ]
+        existing = set(
+            InterviewChatMessage.objects.filter(
+                zegocloud_message_id__in=message_ids
+            ).values_list('zegocloud_message_id', flat=True)
+        ) if message_ids else set()
+
+        to_create = []
+        for item in messages:
+            message_data = item['message_data']
+            message_id = message_data.get('message_id')
+            if message_id and message_id in existing:
+                continue
+            if message_id:
+                existing.add(message_id)
+            to_create.append(InterviewChatMessage(
+                interview_id=item['interview_id'],
+                zegocloud_message_id=message_id or '',
+                sender_id=message_data.get('sender_id'),
+                sender_type=message_data.get('sender_type'),
+                message=message_data.get('message'),
+                message_type=message_data.get('type', 'text')
+            ))
+
+        InterviewChatMessage.objects.bulk_create(to_create, batch_size=500)
+        return len(to_create)
+
     def delete_chat_messages(self, interview_id: int):
         """Delete all chat messages for interview"""
         InterviewChatMessage.objects.filter(interview_id=interview_id).delete()
@@ -580,77 +889,36 @@ class HRInterviewRepository(HRRoundRepositoryPort):
             return None
         
     def move_to_next_stage(self, interview_ids: List[int], feedback: str = '') -> int:
-        from selection_process.models import SelectionProcessModel
-        from application.models import ApplicationStageHistory
-
-        moved_count = 0
+        from infrastructure.repositories.stage_advancement_repository import StageAdvancementRepository
 
-        for interview_id in interview_ids:
-            try:
-                interview = self.get_interview_by_id(interview_id)
-                result    = self.get_result_by_interview(interview_id)
-
-                if not interview or not result:
-                    continue
-
-                application = interview.application
-
-                current_process = SelectionProcessModel.objects.get(
-                    job=interview.job,
-                    stage=interview.stage
-                )
+        interviews = HRInterview.objects.filter(
+            id__in=interview_ids,
+            result__isnull=False
+        ).values('application_id', 'stage_id', 'result__final_score')
 
-                next_process = SelectionProcessModel.objects.filter(
-                    job=interview.job,
-                    order__gt=current_process.order,
-                    is_active=True
-                ).order_by('order').first()
-
-                if not next_process:
-                    logger.warning(f"No next stage found for interview {interview_id}")
-                    continue
-
-                next_stage = next_process.stage
-
-                stage_after_next = SelectionProcessModel.objects.filter(
-                    job=interview.job,
-                    order__gt=next_process.order,
-                    is_active=True
-                ).exists()
-
-                new_status = 'shortlisted' if not stage_after_next else 'qualified'
-
-                application.current_stage        = next_stage
-                application.current_stage_status = 'started'
-                application.status               = new_status
-                application.save(update_fields=[
-                    'current_stage', 'current_stage_status', 'status', 'updated_at'
-                ])
-
-                ApplicationStageHistory.objects.update_or_create(
-                    application=application,
-                    stage=interview.stage,
-                    defaults={
-                        'status':'qualified',
-                        'feedback':f'HR Interview Score: {result.final_score}/100. {feedback}'.strip('. '),
-                        'completed_at': timezone.now(),
-                    }
-                )
-
-                ApplicationStageHistory.objects.update_or_create(
-                    application=application,
-                    stage=next_stage,
-                    defaults={ 
-                        'status':'started',
-                        'feedback':     None,
-                        'completed_at': None,
-                    }
-                )
-
-                moved_count += 1
-
-            except Exception as e:
-                logger.error(f"Failed to move interview {interview_id}: {str(e)}")
-                continue
+        moved = StageAdvancementRepository().advance_applications(
+            advancements=[
+                {
+                    'application_id': row['application_id'],
+                    'from_stage_id': row['stage_id'],
+                    'score': row['result__final_score'],
+                    'feedback': f"HR Interview Score: {row['result__final_score']}/100. {feedback}".strip('. '),
+                }
+                for row in interviews
+            ],
+            next_stage_status='started',
+            application_status='qualified',
+            final_stage_application_status='shortlisted'
+        )
+        return len(moved)
 
-        return moved_count
\ No newline at end of file
+    def get_interviews_by_ids(self, interview_ids: List[int]) -> List[HRInterview]:
+        return list(
+            HRInterview.objects.filter(id__in=interview_ids).select_related(
+                'application',
+                'application__current_stage',
+                'job',
+                'job__company',
+                'result'
+            )
+        )
@@ -0,0 +1,86 @@
+from typing import List, Dict
+from datetime import datetime, timedelta
+from django.db.models import Q
+
+from application.models import ApplicationModel
+from telephonic_round.models import TelephonicInterview
+from hr_round.models import HRInterview
+from core.interface.interview_calendar_repository_port import InterviewCalendarRepositoryPort
+
+
+class InterviewCalendarRepository(InterviewCalendarRepositoryPort):
+    """
+    Range reads over the (conducted_by, scheduled_at) and scheduled_at
+    indexes of both interview rounds. Only the rows near the requested
+    window are read - never the full interview tables.
+    """
+
+    # Statuses that still occupy a slot on the calendar
+    ACTIVE_STATUSES = {
+        'telephonic': ['scheduled', 'in_progress', 'joined'],
+        'hr': ['scheduled', 'in_progress', 'candidate_joined'],
+    }
+
+    # Upper bound on an interview's length, used to widen the range read
+    # so interviews starting just before the window are still found
+    MAX_DURATION_MINUTES = 240
+
+    def get_busy_intervals(
+        self,
+        interviewer_ids: List[int],
+        candidate_ids: List[int],
+        window_start: datetime,
+        window_end: datetime) -> List[Dict]:
+
+        interviewer_ids = [i for i in set(interviewer_ids or []) if i]
+        candidate_ids = [c for c in set(candidate_ids or []) if c]
+        if not interviewer_ids and not candidate_ids:
+            return []
+
+        # Interviews without an explicit interviewer belong to the job's recruiter
+        participants = Q(application__candidate_id__in=candidate_ids)
+        if interviewer_ids:
+            participants |= Q(conducted_by_id__in=interviewer_ids)
+            participants |= Q(conducted_by__isnull=True, job__recruiter_id__in=interviewer_ids)
+
+        intervals = []
+        for round_name, model in (('telephonic', TelephonicInterview), ('hr', HRInterview)):
+            rows = model.objects.filter(
+                participants,
+                status__in=self.ACTIVE_STATUSES[round_name],
+                scheduled_at__lt=window_end,
+                scheduled_at__gte=window_start - timedelta(minutes=self.MAX_DURATION_MINUTES),
+            ).values_list(
+                'id', 'application_id', 'conducted_by_id', 'job__recruiter_id',
+                'application__candidate_id', 'scheduled_at', 'scheduled_duration_minutes'
+            )
+
+            for interview_id, application_id, conducted_by_id, recruiter_id, candidate_id, start, duration in rows:
+                end = start + timedelta(minutes=duration or 0)
+                if end <= window_start:
+                    continue
+                intervals.append({
+                    'round': round_name,
+                    'interview_id': interview_id,
+                    'application_id': application_id,
+                    'interviewer_id': conducted_by_id or recruiter_id,
+                    'candidate_id': candidate_id,
+                    'start': start,
+                    'end': end,
+                })
+
+        return intervals
+
+    def get_application_participants(self, application_ids: List[int]) -> Dict[int, Dict]:
+        rows = ApplicationModel.objects.filter(
+            id__in=application_ids
+        ).values_list('id', 'candidate_id', 'job_id', 'job__recruiter_id')
+
+        return {
+            app_id: {
+                'candidate_id': candidate_id,
+                'job_id': job_id,
+                'recruiter_id': recruiter_id,
+            }
+            for app_id, candidate_id, job_id, recruiter_id in rows
+        }
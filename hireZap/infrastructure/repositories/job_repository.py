@@ -1,27 +1,33 @@
-from typing import Optional, List
+from typing import Optional, List, Dict
+from datetime import date
+import base64
+import hashlib
 import json
+from django.core.cache import cache
 from core.entities.job import Job
 from core.interface.job_repository_port import JobRepositoryPort
 from job.models import JobModel
-from django.db.models import Count, Exists, OuterRef, Q, Case, When, BooleanField
+from django.db.models import Count, Exists, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
 from selection_process.models import SelectionProcessModel
 
 class JobRepository(JobRepositoryPort):
 
+    FEED_CACHE_TIMEOUT = 120
+    FEED_PAGE_SIZE = 20
+    FEED_MAX_PAGE_SIZE = 50
+    FEED_FILTERS = ('location', 'work_type', 'employment_type')
+
+    # Card fields of the candidate job board; long text stays on the detail page
+    FEED_FIELDS = (
+        'id', 'job_title', 'location', 'work_type', 'employment_type',
+        'compensation_range', 'posting_date', 'cover_image', 'skills_required',
+        'application_deadline', 'created_at', 'company_id',
+        'company__company_name', 'company__logo_url',
+    )
+
     def _get_base_queryset(self):
-        return JobModel.objects.annotate(
-            has_configured_stages=Exists(
-                SelectionProcessModel.objects.filter(
-                    job=OuterRef('pk'),
-                    is_active=True
-                )
-            ),
-            configured_stages_count=Count(
-                'selection_stages',
-                filter=Q(selection_stages__is_active=True),
-                distinct=True
-            )
-        )
+        return JobModel.objects.defer('search_vector')
     
     def _model_to_entity(self,job_model:JobModel) -> Job:
         return Job(
@@ -46,8 +52,8 @@ class JobRepository(JobRepositoryPort):
             status=job_model.status,
             created_at=job_model.created_at,
             updated_at=job_model.updated_at,
-            configured_stages_count=getattr(job_model, 'configured_stages_count', 0),
-            has_configured_stages=getattr(job_model, 'has_configured_stages', False),
+            configured_stages_count=job_model.configured_stages_count,
+            has_configured_stages=job_model.has_configured_stages,
         )
     
     def create_job(self, job: Job) -> Optional[Job]:
@@ -80,8 +86,6 @@ class JobRepository(JobRepositoryPort):
                 applicants_visibility=job.applicants_visibility,
                 status=job.status,
             )
-
-            job_model = self._get_base_queryset().get(id=job_model.id)
             return self._model_to_entity(job_model)
         except Exception as e:
             return None
@@ -102,20 +106,6 @@ class JobRepository(JobRepositoryPort):
         try:
             job_models = self._get_base_queryset().filter(
                 recruiter_id=recruiter_id
-            ).annotate(
-                configured_stages_count = Count(
-                    'selection_stages',
-                    filter=Q(selection_stages__is_active=True),
-                    distinct=True
-                ),
-                has_configured_stages = Case(
-                    When(
-                        selection_stages__is_active=True,
-                        then=True
-                    ),
-                    default = False,
-                    output_field=BooleanField()
-                )
             ).select_related('company').order_by('-created_at')
             return [self._model_to_entity(job) for job in job_models]
         except Exception as e:
@@ -143,9 +133,6 @@ class JobRepository(JobRepositoryPort):
                 if hasattr(job_model, key):
                     setattr(job_model, key, value)
             job_model.save()
-            
-            # Refresh with annotations
-            job_model = self._get_base_queryset().get(id=job_id)
             return self._model_to_entity(job_model)
         except JobModel.DoesNotExist:
             return None
@@ -218,13 +205,98 @@ class JobRepository(JobRepositoryPort):
             job_model = JobModel.objects.get(id=job_id)
             job_model.status = status
             job_model.save()
-            
-            # Refresh with annotations
-            job_model = self._get_base_queryset().get(id=job_id)
             return self._model_to_entity(job_model)
         except JobModel.DoesNotExist:
             return None
         except Exception as e:
             print(f"Error updating job status: {str(e)}")
             return None
-    
+
+    def refresh_stage_counters(self, job_id: int):
+        """ Recount the job's active selection stages in one UPDATE """
+        active_stages = SelectionProcessModel.objects.filter(job=OuterRef('pk'), is_active=True)
+        JobModel.objects.filter(id=job_id).update(
+            configured_stages_count=Coalesce(
+                Subquery(
+                    active_stages.order_by().values('job').annotate(total=Count('id')).values('total')
+                ),
+                Value(0)
+            ),
+            has_configured_stages=Exists(active_stages)
+        )
+
+    @staticmethod
+    def encode_feed_cursor(posting_date: date, job_id: int) -> str:
+        raw = f"{posting_date.isoformat()}:{job_id}".encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+    @staticmethod
+    def decode_feed_cursor(cursor: str):
+        """(posting_date, job_id) of a feed cursor; ValueError when malformed"""
+        try:
+            raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+            posting_date, job_id = raw.split(':')
+            return date.fromisoformat(posting_date), int(job_id)
+        except Exception:
+            raise ValueError("Invalid cursor")
+
+    def feed_cache_key(self, filters: Dict, cursor: Optional[str], limit: int) -> str:
+        params = '|'.join(f"{key}={filters.get(key) or ''}" for key in self.FEED_FILTERS)
+        digest = hashlib.md5(f"{params}|{cursor or ''}|{limit}".encode()).hexdigest()
+        return f'job:feed:{digest}'
+
+    def get_active_job_feed(self, filters: Dict, cursor: Optional[str] = None, limit: int = FEED_PAGE_SIZE) -> Dict:
+        limit = max(1, min(limit, self.FEED_MAX_PAGE_SIZE))
+        filters = {key: filters[key] for key in self.FEED_FILTERS if filters.get(key)}
+
+        cache_key = self.feed_cache_key(filters, cursor, limit)
+        page = cache.get(cache_key)
+        if page is not None:
+            return page
+
+        # Newest first by (posting_date, id): the (status, posting_date) and
+        # (location, status) indexes serve the filter and order, and the
+        # cursor seeks past the last row instead of counting an OFFSET
+        queryset = JobModel.objects.filter(status='active', **filters)
+        if cursor:
+            posting_date, job_id = self.decode_feed_cursor(cursor)
+            queryset = queryset.filter(
+                Q(posting_date__lt=posting_date) |
+                Q(posting_date=posting_date, id__lt=job_id)
+            )
+        rows = list(
+            queryset.order_by('-posting_date', '-id').values(*self.FEED_FIELDS)[:limit + 1]
+        )
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        jobs = [
+            {
+                'id': row['id'],
+                'job_title': row['job_title'],
+                'location': row['location'],
+                'work_type': row['work_type'],
+                'employment_type': row['employment_type'],
+                'compensation_range': row['compensation_range'],
+                'posting_date': row['posting_date'].isoformat(),
+                'cover_image': row['cover_image'],
+                'skills_required': row['skills_required'] or [],
+                'application_deadline': row['application_deadline'].isoformat() if row['application_deadline'] else None,
+                'created_at': row['created_at'].isoformat(),
+                'company_id': row['company_id'],
+                'company_name': row['company__company_name'],
+                'company_logo': row['company__logo_url'],
+            }
+            for row in rows
+        ]
+        page = {
+            'jobs': jobs,
+            'next_cursor': self.encode_feed_cursor(rows[-1]['posting_date'], rows[-1]['id']) if has_more else None,
+            'has_more': has_more,
+        }
+        # Invalidated by job.signals when a job is created, edited or changes status
+        cache.set(cache_key, page, self.FEED_CACHE_TIMEOUT)
+        return page
+
+    def invalidate_job_feed(self):
+        cache.delete_pattern('job:feed:*')
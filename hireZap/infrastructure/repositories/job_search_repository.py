@@ -0,0 +1,92 @@
+from typing import Dict, Optional
+from django.contrib.postgres.search import SearchRank
+from django.db import connection
+from django.db.models import F
+
+from job.models import JobModel
+from companies.models import Company
+from infrastructure.services.search_query_builder import SearchQueryBuilder
+from core.interface.job_search_repository_port import JobSearchRepositoryPort
+
+
+class JobSearchRepository(JobSearchRepositoryPort):
+    """
+    Postgres full-text search over active jobs (GIN index on the generated
+    JobModel.search_vector column). Hits, total and facet counts come from
+    one statement over the matched set.
+    """
+
+    SEARCH_CONFIG = 'english'
+    FACETS = ('location', 'work_type', 'employment_type')
+
+    def search(
+        self,
+        query: str,
+        location: Optional[str] = None,
+        work_type: Optional[str] = None,
+        employment_type: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0) -> Dict:
+
+        search_query = SearchQueryBuilder(self.SEARCH_CONFIG).build(query)
+        filters = {
+            key: value
+            for key, value in (('location', location), ('work_type', work_type), ('employment_type', employment_type))
+            if value
+        }
+
+        matched_sql, matched_params = JobModel.objects.filter(
+            status='active',
+            search_vector=search_query,
+            **filters
+        ).annotate(
+            rank=SearchRank(F('search_vector'), search_query)
+        ).order_by().values('id', 'rank', *self.FACETS).query.sql_with_params()
+
+        sql = f"""
+            WITH matched AS ({matched_sql}),
+            top AS (
+                SELECT id, rank FROM matched
+                ORDER BY rank DESC, id DESC
+                LIMIT %s OFFSET %s
+            ),
+            hits AS (
+                SELECT j.id, j.job_title, j.location, j.work_type, j.employment_type,
+                       j.compensation_range, j.posting_date, j.cover_image, j.skills_required,
+                       j.application_deadline, j.created_at, j.company_id,
+                       c.company_name, c.logo_url AS company_logo, top.rank
+                FROM top
+                JOIN {JobModel._meta.db_table} j ON j.id = top.id
+                JOIN {Company._meta.db_table} c ON c.id = j.company_id
+            ),
+            facets AS (
+                SELECT location, work_type, employment_type, COUNT(*) AS count
+                FROM matched
+                GROUP BY GROUPING SETS ((location), (work_type), (employment_type))
+            )
+            SELECT
+                (SELECT COUNT(*) FROM matched),
+                (SELECT COALESCE(json_agg(hits ORDER BY rank DESC, id DESC), '[]') FROM hits),
+                (SELECT COALESCE(json_agg(facets ORDER BY count DESC), '[]') FROM facets)
+        """
+
+        with connection.cursor() as cursor:
+            cursor.execute(sql, (*matched_params, limit, offset))
+            total, hits, facet_rows = cursor.fetchone()
+
+        facets = {facet: [] for facet in self.FACETS}
+        for row in facet_rows:
+            for facet in self.FACETS:
+                # GROUPING SETS leave the other facet columns NULL
+                if row[facet] is not None:
+                    facets[facet].append({'value': row[facet], 'count': row['count']})
+
+        for hit in hits:
+            hit['rank'] = round(hit['rank'], 4)
+            hit['skills_required'] = hit['skills_required'] or []
+
+        return {
+            'total': total,
+            'results': hits,
+            'facets': facets
+        }
@@ -0,0 +1,96 @@
+from typing import Callable, Dict, List
+from datetime import timedelta
+from django.db import transaction
+from django.utils import timezone
+
+from notifications.models import OutboxMessage
+from core.interface.outbox_repository_port import OutboxRepositoryPort
+import logging
+logger = logging.getLogger(__name__)
+
+
+class OutboxRepository(OutboxRepositoryPort):
+    """
+    Transactional outbox table. Several dispatchers can drain it at once:
+    each locks its batch with SKIP LOCKED and keeps the lock while
+    delivering, so a message is never handed to two of them.
+    """
+
+    MAX_ATTEMPTS = 10
+    BASE_BACKOFF_SECONDS = 5
+    MAX_BACKOFF_SECONDS = 60 * 60
+
+    def add_messages(self, messages: List[Dict]) -> int:
+        rows = [
+            OutboxMessage(
+                kind=message['kind'],
+                destination=message['destination'],
+                payload=message['payload']
+            )
+            for message in messages
+        ]
+        if rows:
+            OutboxMessage.objects.bulk_create(rows, batch_size=500)
+        return len(rows)
+
+    def dispatch_due(
+        self,
+        deliver: Callable[[List[Dict]], Dict[int, str]],
+        limit: int = 200) -> Dict:
+
+        with transaction.atomic():
+            rows = list(
+                OutboxMessage.objects
+                .select_for_update(skip_locked=True)
+                .filter(status='pending', available_at__lte=timezone.now())
+                .order_by('id')[:limit]
+            )
+            if not rows:
+                return {'delivered': 0, 'failed': 0, 'dead': 0}
+
+            messages = [
+                {
+                    'id': row.id,
+                    'kind': row.kind,
+                    'destination': row.destination,
+                    'payload': row.payload,
+                }
+                for row in rows
+            ]
+            try:
+                failures = deliver(messages)
+            except Exception as e:
+                logger.error(f" Outbox delivery failed: {str(e)}")
+                failures = {row.id: str(e) for row in rows}
+
+            delivered_ids = [row.id for row in rows if row.id not in failures]
+            if delivered_ids:
+                OutboxMessage.objects.filter(id__in=delivered_ids).delete()
+
+            failed = [row for row in rows if row.id in failures]
+            dead = self._back_off(failed, failures)
+
+        return {'delivered': len(delivered_ids), 'failed': len(failed), 'dead': dead}
+
+    def purge_dead(self, older_than_days: int = 7) -> int:
+        cutoff = timezone.now() - timedelta(days=older_than_days)
+        deleted, _ = OutboxMessage.objects.filter(status='dead', created_at__lt=cutoff).delete()
+        return deleted
+
+    def _back_off(self, rows: List[OutboxMessage], failures: Dict[int, str]) -> int:
+        now = timezone.now()
+        dead = 0
+        for row in rows:
+            row.attempts += 1
+            row.last_error = failures[row.id][:2000]
+            if row.attempts >= self.MAX_ATTEMPTS:
+                row.status = 'dead'
+                dead += 1
+                logger.error(f" Outbox message {row.id} ({row.kind} -> {row.destination}) is dead: {row.last_error}")
+            else:
+                delay = min(self.BASE_BACKOFF_SECONDS * 2 ** (row.attempts - 1), self.MAX_BACKOFF_SECONDS)
+                row.available_at = now + timedelta(seconds=delay)
+
+        if rows:
+            OutboxMessage.objects.bulk_update(rows, ['attempts', 'last_error', 'status', 'available_at'])
+        return dead
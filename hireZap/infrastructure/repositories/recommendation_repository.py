@@ -0,0 +1,239 @@
+from typing import Dict, Iterable, Iterator, List, Optional
+from django.db import transaction
+from django.db.models import Count, F, Min, Q, Window
+from django.db.models.functions import RowNumber
+from django.utils import timezone
+
+from core.interface.recommendation_repository_port import RecommendationRepositoryPort
+from infrastructure.services.job_recommender import JobRecommender
+from recommendations.models import JobRecommendation
+from candidate.models import CandidateProfile, CandidateSkill, CandidateExperience
+from skills.models import JobSkill
+from job.models import JobModel
+
+
+class RecommendationRepository(RecommendationRepositoryPort):
+    """
+    Stores each candidate's TOP_K jobs. Candidate jobs come from the skill
+    index (most shared skills first) plus jobs in the candidate's location
+    or preferred work type, so scoring never scans the whole job table.
+    """
+
+    TOP_K = 20
+    SKILL_POOL = 500
+    PREFERENCE_POOL = 100
+    CANDIDATE_BATCH = 500
+
+    def __init__(self, recommender: Optional[JobRecommender] = None):
+        self.recommender = recommender or JobRecommender()
+
+    def _candidate_features(self, candidate_ids: Iterable[int]) -> Dict[int, Dict]:
+        candidate_ids = list(candidate_ids)
+        features = {
+            profile['user_id']: {
+                'skill_ids': set(),
+                'experience_years': 0.0,
+                'location': self.recommender.normalize_location(profile['location']),
+                'preferred_work_type': profile['preferred_work_type'],
+            }
+            for profile in CandidateProfile.objects.filter(
+                user_id__in=candidate_ids
+            ).values('user_id', 'location', 'preferred_work_type')
+        }
+
+        for candidate_id, skill_id in CandidateSkill.objects.filter(
+            candidate_id__in=candidate_ids,
+            skill__isnull=False
+        ).values_list('candidate_id', 'skill_id'):
+            features[candidate_id]['skill_ids'].add(skill_id)
+
+        today = timezone.now().date()
+        for candidate_id, start_date, end_date in CandidateExperience.objects.filter(
+            candidate_id__in=candidate_ids
+        ).values_list('candidate_id', 'start_date', 'end_date'):
+            days = ((end_date or today) - start_date).days
+            features[candidate_id]['experience_years'] += max(days, 0) / 365.25
+
+        return features
+
+    def _job_features(self, jobs) -> Dict[int, Dict]:
+        features = {
+            job['id']: {
+                'skill_ids': set(),
+                'min_experience': job['min_experience'],
+                'location': self.recommender.normalize_location(job['location']),
+                'work_type': job['work_type'],
+            }
+            for job in jobs.values('id', 'min_experience', 'location', 'work_type')
+        }
+        for job_id, skill_id in JobSkill.objects.filter(
+            job_id__in=list(features)
+        ).values_list('job_id', 'skill_id'):
+            features[job_id]['skill_ids'].add(skill_id)
+        return features
+
+    def refresh_candidate(self, candidate_id: int) -> int:
+        candidate = self._candidate_features([candidate_id]).get(candidate_id)
+        if candidate is None:
+            JobRecommendation.objects.filter(candidate_id=candidate_id).delete()
+            return 0
+
+        pool = set()
+        if candidate['skill_ids']:
+            pool.update(
+                JobSkill.objects.filter(
+                    skill_id__in=candidate['skill_ids'],
+                    job__status='active'
+                ).values('job_id').annotate(
+                    shared=Count('skill_id')
+                ).order_by('-shared', '-job_id').values_list('job_id', flat=True)[:self.SKILL_POOL]
+            )
+
+        preference = Q(work_type='remote')
+        if candidate['preferred_work_type']:
+            preference |= Q(work_type=candidate['preferred_work_type'])
+        if candidate['location']:
+            preference |= Q(location__iexact=candidate['location'])
+        pool.update(
+            JobModel.objects.filter(preference, status='active').order_by(
+                '-posting_date', '-id'
+            ).values_list('id', flat=True)[:self.PREFERENCE_POOL]
+        )
+
+        scored = []
+        for job_id, job in self._job_features(JobModel.objects.filter(id__in=pool)).items():
+            score, matched = self.recommender.score(candidate, job)
+            scored.append((score, job_id, matched))
+        scored.sort(reverse=True)
+
+        with transaction.atomic():
+            JobRecommendation.objects.filter(candidate_id=candidate_id).delete()
+            JobRecommendation.objects.bulk_create([
+                JobRecommendation(candidate_id=candidate_id, job_id=job_id, score=score, matched_skills=matched)
+                for score, job_id, matched in scored[:self.TOP_K]
+            ])
+        return min(len(scored), self.TOP_K)
+
+    def refresh_job(self, job_id: int) -> int:
+        job = self._job_features(JobModel.objects.filter(id=job_id, status='active')).get(job_id)
+        if job is None:
+            # Paused, closed or deleted jobs leave every list
+            JobRecommendation.objects.filter(job_id=job_id).delete()
+            return 0
+
+        # Candidates sharing a skill, those matching the job's location or
+        # work type, and those already recommended the job (rescored, since
+        # their score may have dropped; the K-th entry trim drops it if so)
+        pool = set(JobRecommendation.objects.filter(job_id=job_id).values_list('candidate_id', flat=True))
+        recommended = set(pool)
+        if job['skill_ids']:
+            pool.update(
+                CandidateSkill.objects.filter(skill_id__in=job['skill_ids']).values_list('candidate_id', flat=True).distinct()
+            )
+        pool.update(self._preference_candidates(job))
+
+        pool = list(pool)
+        updated = 0
+        for start in range(0, len(pool), self.CANDIDATE_BATCH):
+            updated += self._offer_job(job_id, job, pool[start:start + self.CANDIDATE_BATCH], recommended)
+        return updated
+
+    def _preference_candidates(self, job: Dict) -> List[int]:
+        """
+        Candidates the job suits by location or work type alone, limited to
+        those whose list it can still enter (without shared skills it scores
+        at most the non-skill weights) and capped at the PREFERENCE_POOL
+        most recently updated. Other remote-only matches are left to the
+        nightly refresh_all.
+        """
+        preference = Q(preferred_work_type=job['work_type'])
+        if job['location']:
+            preference |= Q(location__iexact=job['location'])
+
+        ceiling = (
+            self.recommender.EXPERIENCE_WEIGHT +
+            self.recommender.LOCATION_WEIGHT +
+            self.recommender.WORK_TYPE_WEIGHT
+        )
+        return list(
+            CandidateProfile.objects.filter(preference).annotate(
+                size=Count('job_recommendations'),
+                lowest=Min('job_recommendations__score')
+            ).filter(
+                Q(size__lt=self.TOP_K) | Q(lowest__lt=ceiling)
+            ).order_by('-updated_at').values_list('user_id', flat=True)[:self.PREFERENCE_POOL]
+        )
+
+    def _offer_job(self, job_id: int, job: Dict, candidate_ids: List[int], recommended: set) -> int:
+        """Put the job in the lists of candidates it beats the K-th entry of"""
+        lists = {
+            row['candidate_id']: row
+            for row in JobRecommendation.objects.filter(
+                candidate_id__in=candidate_ids
+            ).values('candidate_id').annotate(size=Count('id'), lowest=Min('score'))
+        }
+
+        rows = []
+        for candidate_id, candidate in self._candidate_features(candidate_ids).items():
+            score, matched = self.recommender.score(candidate, job)
+            current = lists.get(candidate_id)
+            if candidate_id in recommended or current is None or current['size'] < self.TOP_K or score > current['lowest']:
+                rows.append(JobRecommendation(
+                    candidate_id=candidate_id,
+                    job_id=job_id,
+                    score=score,
+                    matched_skills=matched,
+                    computed_at=timezone.now()
+                ))
+        if not rows:
+            return 0
+
+        with transaction.atomic():
+            JobRecommendation.objects.bulk_create(
+                rows,
+                update_conflicts=True,
+                unique_fields=['candidate', 'job'],
+                update_fields=['score', 'matched_skills', 'computed_at']
+            )
+            # Trim lists grown past TOP_K
+            overflow = JobRecommendation.objects.filter(
+                candidate_id__in=[row.candidate_id for row in rows]
+            ).annotate(
+                position=Window(
+                    RowNumber(),
+                    partition_by=F('candidate_id'),
+                    order_by=[F('score').desc(), F('job_id').desc()]
+                )
+            ).filter(position__gt=self.TOP_K).values_list('id', flat=True)
+            JobRecommendation.objects.filter(id__in=list(overflow)).delete()
+        return len(rows)
+
+    def get_recommendations(self, candidate_id: int, limit: int = 20) -> List[Dict]:
+        recommendations = JobRecommendation.objects.filter(
+            candidate_id=candidate_id,
+            job__status='active'
+        ).select_related('job__company').only(
+            'job_id', 'score', 'matched_skills', 'computed_at',
+            'job__job_title', 'job__location', 'job__work_type', 'job__employment_type',
+            'job__compensation_range', 'job__company__company_name', 'job__company__logo_url'
+        ).order_by('-score', '-job_id')[:limit]
+
+        return [
+            {
+                'job_id': recommendation.job_id,
+                'job_title': recommendation.job.job_title,
+                'location': recommendation.job.location,
+                'work_type': recommendation.job.work_type,
+                'employment_type': recommendation.job.employment_type,
+                'compensation_range': recommendation.job.compensation_range,
+                'company_name': recommendation.job.company.company_name,
+                'company_logo': recommendation.job.company.logo_url,
+                'score': recommendation.score,
+                'matched_skills': recommendation.matched_skills,
+                'computed_at': recommendation.computed_at.isoformat(),
+            }
+            for recommendation in recommendations
+        ]
+
+    def candidate_ids(self) -> Iterator[int]:
+        return CandidateProfile.objects.values_list('user_id', flat=True).iterator(chunk_size=1000)
@@ -126,7 +126,10 @@ class ResumeScreeningRepository(ResumeScreeningRepositoryPort):
                 job.screening_status = 'completed'
                 job.screening_completed_at = timezone.now()
             
-            job.save()
+            job.save(update_fields=[
+                'screened_applications_count', 'screening_status',
+                'screening_completed_at', 'updated_at'
+            ])
             
             # Send WebSocket update
             from infrastructure.services.notification_service import NotificationService
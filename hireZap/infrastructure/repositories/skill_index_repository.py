@@ -0,0 +1,100 @@
+from typing import Dict, List, Optional
+from django.db import transaction
+from django.db.models import Avg, Count
+
+from core.interface.skill_index_repository_port import SkillIndexRepositoryPort
+from infrastructure.services.skill_taxonomy import SkillTaxonomy
+from skills.models import JobSkill
+from candidate.models import CandidateSkill
+
+
+class SkillIndexRepository(SkillIndexRepositoryPort):
+    """
+    Skill -> jobs (JobSkill) and skill -> candidates (CandidateSkill.skill)
+    lookups over canonical skill ids, both served by (skill, owner) indexes.
+    """
+
+    def __init__(self, taxonomy: Optional[SkillTaxonomy] = None):
+        self.taxonomy = taxonomy or SkillTaxonomy()
+
+    @transaction.atomic
+    def index_job(self, job_id: int, skills: List[str]) -> int:
+        skill_ids = set(self.taxonomy.resolve(
+            [skill for skill in skills or [] if isinstance(skill, str)],
+            create=True
+        ).values())
+        indexed = set(JobSkill.objects.filter(job_id=job_id).values_list('skill_id', flat=True))
+
+        if indexed - skill_ids:
+            JobSkill.objects.filter(job_id=job_id, skill_id__in=indexed - skill_ids).delete()
+        if skill_ids - indexed:
+            JobSkill.objects.bulk_create(
+                [JobSkill(job_id=job_id, skill_id=skill_id) for skill_id in skill_ids - indexed],
+                ignore_conflicts=True
+            )
+        return len(skill_ids)
+
+    def get_job_skill_ids(self, job_id: int) -> List[int]:
+        return list(JobSkill.objects.filter(job_id=job_id).values_list('skill_id', flat=True))
+
+    def get_candidate_skill_ids(self, candidate_id: int) -> List[int]:
+        return list(
+            CandidateSkill.objects.filter(
+                candidate_id=candidate_id,
+                skill__isnull=False
+            ).values_list('skill_id', flat=True)
+        )
+
+    def jobs_for_candidate(self, candidate_id: int, limit: int = 20) -> List[Dict]:
+        skill_ids = self.get_candidate_skill_ids(candidate_id)
+        if not skill_ids:
+            return []
+
+        rows = JobSkill.objects.filter(
+            skill_id__in=skill_ids,
+            job__status='active'
+        ).values(
+            'job_id', 'job__job_title', 'job__location', 'job__work_type',
+            'job__employment_type', 'job__company__company_name'
+        ).annotate(
+            matched_skills=Count('skill_id')
+        ).order_by('-matched_skills', '-job_id')[:limit]
+
+        return [
+            {
+                'job_id': row['job_id'],
+                'job_title': row['job__job_title'],
+                'location': row['job__location'],
+                'work_type': row['job__work_type'],
+                'employment_type': row['job__employment_type'],
+                'company_name': row['job__company__company_name'],
+                'matched_skills': row['matched_skills'],
+            }
+            for row in rows
+        ]
+
+    def candidates_for_job(self, job_id: int, limit: int = 20) -> List[Dict]:
+        skill_ids = self.get_job_skill_ids(job_id)
+        if not skill_ids:
+            return []
+
+        rows = CandidateSkill.objects.filter(
+            skill_id__in=skill_ids
+        ).values(
+            'candidate_id', 'candidate__user__full_name', 'candidate__location'
+        ).annotate(
+            matched_skills=Count('skill_id', distinct=True),
+            avg_proficiency=Avg('proficiency')
+        ).order_by('-matched_skills', '-avg_proficiency', 'candidate_id')[:limit]
+
+        return [
+            {
+                'candidate_id': row['candidate_id'],
+                'full_name': row['candidate__user__full_name'],
+                'location': row['candidate__location'],
+                'matched_skills': row['matched_skills'],
+                'required_skills': len(skill_ids),
+                'avg_proficiency': round(row['avg_proficiency'] or 0, 2),
+            }
+            for row in rows
+        ]
@@ -0,0 +1,119 @@
+from typing import List, Dict, Optional
+from collections import defaultdict
+from django.db import transaction
+from django.utils import timezone
+
+from application.models import ApplicationModel, ApplicationStageHistory
+from selection_process.models import SelectionProcessModel
+from core.interface.stage_advancement_repository_port import StageAdvancementRepositoryPort
+import logging
+logger = logging.getLogger(__name__)
+
+
+class StageAdvancementRepository(StageAdvancementRepositoryPort):
+    """
+    Set-based stage advancement shared by the interview rounds.
+    Independent of batch size: one locked read of the applications, one
+    read of the jobs' stage order, one bulk_update and one history upsert.
+    """
+
+    BATCH_SIZE = 500
+
+    @transaction.atomic
+    def advance_applications(
+        self,
+        advancements: List[Dict],
+        next_stage_status: str = 'started',
+        application_status: str = 'qualified',
+        final_stage_application_status: Optional[str] = None) -> Dict[int, object]:
+
+        by_application = {a['application_id']: a for a in advancements}
+        if not by_application:
+            return {}
+
+        applications = list(
+            ApplicationModel.objects.select_for_update().filter(id__in=by_application.keys())
+        )
+
+        # Stage order of every job involved, loaded once
+        job_stages = defaultdict(list)
+        for process in SelectionProcessModel.objects.filter(
+            job_id__in={app.job_id for app in applications},
+            is_active=True
+        ).select_related('stage').order_by('job_id', 'order'):
+            job_stages[process.job_id].append(process.stage)
+
+        now = timezone.now()
+        moved = {}
+        to_update = []
+        history_rows = []
+
+        for application in applications:
+            advancement = by_application[application.id]
+            from_stage_id = advancement.get('from_stage_id') or application.current_stage_id
+
+            # Skip applications that already moved on (stale or repeated request)
+            if not from_stage_id or application.current_stage_id != from_stage_id:
+                logger.warning(f" Application {application.id} is not at stage {from_stage_id}, skipping")
+                continue
+
+            stages = job_stages.get(application.job_id, [])
+            index = next((i for i, stage in enumerate(stages) if stage.id == from_stage_id), None)
+
+            if index is None:
+                logger.warning(f" Stage {from_stage_id} not active for job {application.job_id}")
+                continue
+
+            if index + 1 >= len(stages):
+                logger.warning(f" Application {application.id} is already at the final stage")
+                continue
+
+            next_stage = stages[index + 1]
+            is_final = index + 2 == len(stages)
+
+            application.current_stage = next_stage
+            application.current_stage_status = next_stage_status
+            application.status = (
+                final_stage_application_status
+                if is_final and final_stage_application_status
+                else application_status
+            )
+            # bulk_update does not touch auto_now fields
+            application.updated_at = now
+            to_update.append(application)
+
+            # Close the stage being left
+            history_rows.append(ApplicationStageHistory(
+                application_id=application.id,
+                stage_id=from_stage_id,
+                status='qualified',
+                feedback=advancement.get('feedback') or None,
+                score=advancement.get('score'),
+                completed_at=now
+            ))
+            # Open (or reopen) the next stage
+            history_rows.append(ApplicationStageHistory(
+                application_id=application.id,
+                stage_id=next_stage.id,
+                status='started',
+                feedback=None,
+                score=None,
+                completed_at=None
+            ))
+            moved[application.id] = next_stage
+
+        if to_update:
+            ApplicationModel.objects.bulk_update(
+                to_update,
+                ['current_stage', 'current_stage_status', 'status', 'updated_at'],
+                batch_size=self.BATCH_SIZE
+            )
+            ApplicationStageHistory.objects.bulk_create(
+                history_rows,
+                batch_size=self.BATCH_SIZE,
+                update_conflicts=True,
+                unique_fields=['application', 'stage'],
+                update_fields=['status', 'feedback', 'score', 'completed_at']
+            )
+
+        return moved
@@ -1,6 +1,8 @@
 from typing import List, Dict, Optional
 from core.interface.telephonic_round_repository_port import TelephonicRoundRepositoryPort
-from django.db.models import Q, Prefetch, F
+from django.db.models import Q, Prefetch, F, Count, Avg
+from django.core.cache import cache
+from django.db import transaction
 from telephonic_round.models import(
     TelephonicInterview,
     TelephonicRoundSettings,
@@ -16,6 +18,8 @@ from django.utils import timezone
 
 class TelephonicRoundRepository(TelephonicRoundRepositoryPort):
 
+    STATS_CACHE_TIMEOUT = 300
+
     #settings
     def get_settings_by_job(self, job_id:int) -> Optional[TelephonicRoundSettings]:
         try:
@@ -208,10 +212,90 @@ class TelephonicRoundRepository(TelephonicRoundRepositoryPort):
                 )
             )
 
-        return TelephonicInterview.objects.bulk_create(
+        created = TelephonicInterview.objects.bulk_create(
             interviews,
             ignore_conflicts=True
         )
+        # bulk_create does not send post_save
+        for job_id in {app.job_id for app in applications}:
+            self.invalidate_job_stats(job_id)
+        return created
+        
+    def get_interview_statuses_by_application(self, application_ids: List[int]) -> Dict[int, str]:
+        return dict(
+            TelephonicInterview.objects.filter(
+                application_id__in=application_ids
+            ).values_list('application_id', 'status')
+        )
+    
+    @transaction.atomic
+    def bulk_schedule_interviews(
+        self,
+        schedules: List[Dict],
+        notification_sent: bool = False,
+        email_sent: bool = False) -> Dict[int, int]:
+        """
+        Create or update the interviews of many applications in one upsert.
+        Sent-flags are written in the same statement.
+        Returns {application_id: interview_id}; unknown applications are left out.
+        """
+        applications = {
+            app['id']: app
+            for app in ApplicationModel.objects.filter(
+                id__in=[schedule['application_id'] for schedule in schedules]
+            ).values('id', 'job_id', 'current_stage_id')
+        }
+        
+        interviews = []
+        for schedule in schedules:
+            application = applications.get(schedule['application_id'])
+            if not application:
+                continue
+            interviews.append(
+                TelephonicInterview(
+                    application_id=application['id'],
+                    job_id=application['job_id'],
+                    stage_id=application['current_stage_id'],
+                    scheduled_at=schedule['scheduled_at'],
+                    scheduled_duration_minutes=schedule['duration'],
+                    timezone=schedule['timezone'],
+                    scheduling_notes=schedule.get('notes'),
+                    status='scheduled',
+                    notification_sent=notification_sent,
+                    email_sent=email_sent,
+                    reminder_sent=False
+                )
+            )
+        
+        if not interviews:
+            return {}
+        
+        TelephonicInterview.objects.bulk_create(
+            interviews,
+            update_conflicts=True,
+            unique_fields=['application'],
+            update_fields=[
+                'scheduled_at',
+                'scheduled_duration_minutes',
+                'timezone',
+                'scheduling_notes',
+                'status',
+                'notification_sent',
+                'email_sent',
+                'reminder_sent',
+                'updated_at'
+            ]
+        )
+        
+        # bulk_create does not send post_save
+        for job_id in {application['job_id'] for application in applications.values()}:
+            self.invalidate_job_stats(job_id)
+        
+        return dict(
+            TelephonicInterview.objects.filter(
+                application_id__in=[interview.application_id for interview in interviews]
+            ).values_list('application_id', 'id')
+        )
         
     #call session
 
@@ -271,16 +355,110 @@ class TelephonicRoundRepository(TelephonicRoundRepositoryPort):
         full_text: str,
         segments: List[Dict],
         detected_language: str = 'en',
-        confidence: Optional[float] = None) -> InterviewTranscription:
+        confidence: Optional[float] = None,
+        model_used: Optional[str] = None,
+        processing_time_seconds: Optional[float] = None,
+        audio_sha256: Optional[str] = None) -> InterviewTranscription:
+        
+        defaults = {
+            'full_text': full_text,
+            'segments': segments,
+            'detected_language': detected_language,
+            'confidence': confidence,
+            'processing_status': 'completed',
+            'progress_percent': 100,
+            'processing_time_seconds': processing_time_seconds,
+            'audio_sha256': audio_sha256,
+            'error_message': None,
+        }
+        if model_used:
+            defaults['model_used'] = model_used
         
-        return InterviewTranscription.objects.create(
+        transcription, created = InterviewTranscription.objects.update_or_create(
             interview_id=interview_id,
-            full_text=full_text,
-            segments=segments,
-            detected_language=detected_language,
-            confidence=confidence,
+            defaults=defaults
+        )
+        return transcription
+    
+    def get_completed_transcription_by_hash(self, audio_sha256: str) -> Optional[InterviewTranscription]:
+        if not audio_sha256:
+            return None
+        return InterviewTranscription.objects.filter(
+            audio_sha256=audio_sha256,
             processing_status='completed'
+        ).order_by('-updated_at').first()
+    
+    def get_transcription(self, interview_id: int) -> Optional[InterviewTranscription]:
+        try:
+            return InterviewTranscription.objects.get(interview_id=interview_id)
+        except InterviewTranscription.DoesNotExist:
+            return None
+    
+    def start_transcription(
+        self,
+        interview_id: int,
+        model_used: str,
+        audio_sha256: Optional[str] = None) -> InterviewTranscription:
+        """Create (or reopen) a transcription that will be filled in batches"""
+        transcription, created = InterviewTranscription.objects.get_or_create(
+            interview_id=interview_id,
+            defaults={
+                'full_text': '',
+                'segments': [],
+                'processing_status': 'processing',
+                'model_used': model_used,
+                'audio_sha256': audio_sha256
+            }
         )
+        if not created:
+            # A different recording invalidates the stored partial segments
+            if audio_sha256 and transcription.audio_sha256 != audio_sha256:
+                transcription.full_text = ''
+                transcription.segments = []
+                transcription.progress_percent = 0
+                transcription.processing_time_seconds = None
+                transcription.audio_sha256 = audio_sha256
+                transcription.model_used = model_used
+            transcription.processing_status = 'processing'
+            transcription.error_message = None
+            transcription.save()
+        return transcription
+    
+    def append_transcription_segments(
+        self,
+        interview_id: int,
+        segments: List[Dict],
+        progress_percent: int) -> InterviewTranscription:
+        
+        transcription = InterviewTranscription.objects.get(interview_id=interview_id)
+        transcription.segments = (transcription.segments or []) + segments
+        batch_text = " ".join(s['text'] for s in segments if s.get('text'))
+        transcription.full_text = f"{transcription.full_text} {batch_text}".strip()
+        transcription.progress_percent = progress_percent
+        transcription.save(update_fields=['segments', 'full_text', 'progress_percent', 'updated_at'])
+        return transcription
+    
+    def complete_transcription(
+        self,
+        interview_id: int,
+        detected_language: str,
+        confidence: Optional[float] = None,
+        model_used: Optional[str] = None,
+        processing_time_seconds: Optional[float] = None) -> InterviewTranscription:
+        
+        transcription = InterviewTranscription.objects.get(interview_id=interview_id)
+        transcription.detected_language = detected_language
+        transcription.confidence = confidence
+        transcription.processing_status = 'completed'
+        transcription.progress_percent = 100
+        # Resumed runs add to the time already spent
+        transcription.processing_time_seconds = (
+            (transcription.processing_time_seconds or 0) + (processing_time_seconds or 0)
+        )
+        if model_used:
+            transcription.model_used = model_used
+        transcription.save()
+        return transcription
     
     def update_transcription_status(
         self,
@@ -347,148 +525,95 @@ class TelephonicRoundRepository(TelephonicRoundRepositoryPort):
         except InterviewPerformanceResult.DoesNotExist:
             return None
         
+    def get_reanalyzable_interview_ids(self, job_id: int) -> List[int]:
+        """Completed interviews of a job that have a stored transcript"""
+        return list(
+            TelephonicInterview.objects.filter(
+                job_id=job_id,
+                status='completed',
+                transcription__processing_status='completed'
+            ).values_list('id', flat=True)
+        )
+    
+    @staticmethod
+    def stats_cache_key(job_id: int) -> str:
+        return f'telephonic:stats:{job_id}'
+    
     def get_job_interview_stats(self, job_id: int) -> Dict:
-        interviews = TelephonicInterview.objects.filter(job_id=job_id)
+        cache_key = self.stats_cache_key(job_id)
+        stats = cache.get(cache_key)
+        if stats is not None:
+            return stats
         
-        total = interviews.count()
-        not_scheduled = interviews.filter(status='not_scheduled').count()
-        scheduled = interviews.filter(status='scheduled').count()
-        completed = interviews.filter(status='completed').count()
-        
-        # Get qualified count from performance results
-        qualified = InterviewPerformanceResult.objects.filter(
-            interview__job_id=job_id,
-            decision='qualified'
-        ).count()
-        
-        # Average score
-        from django.db.models import Avg
-        avg_score = InterviewPerformanceResult.objects.filter(
-            interview__job_id=job_id
-        ).aggregate(avg=Avg('overall_score'))['avg'] or 0
+        # One conditional-aggregation query; performance_result is one-to-one
+        # so the LEFT JOIN does not duplicate interview rows
+        totals = TelephonicInterview.objects.filter(job_id=job_id).aggregate(
+            total=Count('id'),
+            not_scheduled=Count('id', filter=Q(status='not_scheduled')),
+            scheduled=Count('id', filter=Q(status='scheduled')),
+            completed=Count('id', filter=Q(status='completed')),
+            qualified=Count('id', filter=Q(performance_result__decision='qualified')),
+            avg_score=Avg('performance_result__overall_score'),
+        )
         
-        return {
-            'total_candidates': total,
-            'not_scheduled': not_scheduled,
-            'scheduled': scheduled,
-            'completed': completed,
-            'qualified': qualified,
-            'average_score': round(avg_score, 2)
+        stats = {
+            'total_candidates': totals['total'],
+            'not_scheduled': totals['not_scheduled'],
+            'scheduled': totals['scheduled'],
+            'completed': totals['completed'],
+            'qualified': totals['qualified'],
+            'average_score': round(totals['avg_score'] or 0, 2)
         }
+        # Invalidated by telephonic_round.signals on every interview/result change
+        cache.set(cache_key, stats, self.STATS_CACHE_TIMEOUT)
+        return stats
+    
+    def invalidate_job_stats(self, job_id: int):
+        cache.delete(self.stats_cache_key(job_id))
     
     def move_to_next_stage(self,interview_ids: List[int],feedback: str = '') -> int:
-        from application.models import ApplicationStageHistory
-        from selection_process.models import SelectionProcessModel
+        from infrastructure.repositories.stage_advancement_repository import StageAdvancementRepository
         
-        moved_count = 0
+        application_ids = TelephonicInterview.objects.filter(
+            id__in=interview_ids
+        ).values_list('application_id', flat=True)
         
-        for interview_id in interview_ids:
-            interview = self.get_interview_by_id(interview_id)
-            if not interview:
-                continue
-            
-            application = interview.application
-            current_stage = application.current_stage
-
-            if not current_stage:
-                print(f" No current stage for application {application.id}")
-                continue
-            
-            # Get next stage
-            all_stage_processes = list(
-                SelectionProcessModel.objects.filter(
-                    job_id=interview.job_id,
-                    is_active=True
-                ).order_by('order').select_related('stage')
-            )
-            
-            current_index = next(
-                (i for i, sp in enumerate(all_stage_processes) 
-                if sp.stage.id == current_stage.id),
-                None
-            )
-            
-            if current_index is None:
-                print(f" Current stage {current_stage.name} not found in job stages")
-                continue
-            
-            # ✅ Get next stage by list index
-            if current_index + 1 >= len(all_stage_processes):
-                print(f" Already at final stage")
-                continue
-            
-            next_stage_process = all_stage_processes[current_index + 1]
-            next_stage = next_stage_process.stage
-            
-            print(f" Moving from {current_stage.name} → {next_stage.name}")
-            
-            # Close current stage history
-            closed = ApplicationStageHistory.objects.filter(
-                application=application,
-                stage=current_stage,
-            ).exclude(status='qualified').update(
-                status='qualified',
-                completed_at=timezone.now(),
-                feedback=feedback or 'Passed telephonic round'
-            )
-            
-            if closed == 0:
-                # No history record existed — create a closed one
-                ApplicationStageHistory.objects.get_or_create(
-                    application=application,
-                    stage=current_stage,
-                    defaults={
-                        'status': 'qualified',
-                        'completed_at': timezone.now(),
-                        'feedback': feedback or 'Passed telephonic round',
-                    }
-                )
-            
-            # Move application to next stage
-            application.current_stage = next_stage
-            application.current_stage_status = 'pending'  
-            application.status = 'qualified'
-            application.save(update_fields=[
-                'current_stage', 'current_stage_status', 'status', 'updated_at'
-            ])
-            
-            # Create next stage history
-            history_obj, created = ApplicationStageHistory.objects.get_or_create(
-                application=application,
-                stage=next_stage,
-                defaults={
-                    'status': 'pending',
-                    'feedback': None,
-                    'completed_at': None,
+        moved = StageAdvancementRepository().advance_applications(
+            advancements=[
+                {
+                    'application_id': application_id,
+                    'feedback': feedback or 'Passed telephonic round'
                 }
+                for application_id in application_ids
+            ],
+            next_stage_status='pending',
+            application_status='qualified'
+        )
+        return len(moved)
+    
+    def get_interviews_by_ids(self, interview_ids: List[int]) -> List[TelephonicInterview]:
+        return list(
+            TelephonicInterview.objects.filter(id__in=interview_ids).select_related(
+                'application',
+                'application__current_stage',
+                'job',
+                'performance_result'
             )
-            if not created:
-                history_obj.status = 'started'
-                history_obj.feedback = None
-                history_obj.completed_at = None
-                history_obj.save(update_fields=['status', 'feedback', 'completed_at'])
-            
-            moved_count += 1
-        
-        return moved_count
+        )
     
-    def get_upcoming_interviews_for_reminder(self, hours_before: int = 24) -> List[TelephonicInterview]:
-        """Get interviews that need reminders"""
-        from datetime import timedelta
-        now = timezone.now()
-        target_time = now + timedelta(hours=hours_before)
-        
+    def get_interviews_due_for_reminder(self, interview_ids: List[int]) -> List[TelephonicInterview]:
+        """Interviews of a reminder batch that are still upcoming and not yet reminded"""
         return list(
             TelephonicInterview.objects.filter(
+                id__in=interview_ids,
                 status='scheduled',
-                scheduled_at__lte=target_time,
-                scheduled_at__gte=now,
+                scheduled_at__gte=timezone.now(),
                 reminder_sent=False
-            ).select_related('application')
+            ).select_related('application', 'job')
         )
     
-    def mark_reminder_sent(self, interview_id: int):
-        """Mark reminder as sent"""
-        TelephonicInterview.objects.filter(id=interview_id).update(
+    def mark_reminders_sent(self, interview_ids: List[int]):
+        """Mark reminders as sent with one UPDATE"""
+        TelephonicInterview.objects.filter(id__in=interview_ids).update(
             reminder_sent=True
         )
\ No newline at end of file
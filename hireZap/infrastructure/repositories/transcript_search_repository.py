@@ -0,0 +1,101 @@
+from typing import List, Dict, Optional
+from django.contrib.postgres.search import SearchRank, SearchVector, SearchHeadline
+from django.db.models import F
+
+from telephonic_round.models import TranscriptSegment
+from infrastructure.services.search_query_builder import SearchQueryBuilder
+from core.interface.transcript_search_repository_port import TranscriptSearchRepositoryPort
+
+
+class TranscriptSearchRepository(TranscriptSearchRepositoryPort):
+    """
+    Postgres full-text search over transcript segments (GIN index on a
+    tsvector column filled when the segments are indexed).
+    """
+
+    SEARCH_CONFIG = 'english'
+
+    def index_segments(
+        self,
+        round_type: str,
+        interview_id: int,
+        job_id: int,
+        segments: List[Dict]) -> int:
+
+        rows = [
+            TranscriptSegment(
+                round_type=round_type,
+                interview_id=interview_id,
+                job_id=job_id,
+                start_ms=int(round(segment['start'] * 1000)),
+                end_ms=int(round(segment['end'] * 1000)),
+                text=segment['text'],
+                speaker=segment.get('speaker')
+            )
+            for segment in segments if segment.get('text')
+        ]
+        if not rows:
+            return 0
+
+        TranscriptSegment.objects.bulk_create(rows, batch_size=500)
+
+        # Fill the tsvector of the new rows in one statement
+        TranscriptSegment.objects.filter(
+            round_type=round_type,
+            interview_id=interview_id,
+            search_vector__isnull=True
+        ).update(search_vector=SearchVector('text', config=self.SEARCH_CONFIG))
+
+        return len(rows)
+
+    def clear_segments(self, round_type: str, interview_id: int):
+        TranscriptSegment.objects.filter(round_type=round_type, interview_id=interview_id).delete()
+
+    def search(
+        self,
+        query: str,
+        recruiter_id: int,
+        round_type: Optional[str] = None,
+        job_id: Optional[int] = None,
+        interview_id: Optional[int] = None,
+        limit: int = 20) -> List[Dict]:
+
+        search_query = SearchQueryBuilder(self.SEARCH_CONFIG).build(query)
+
+        segments = TranscriptSegment.objects.filter(
+            job__recruiter_id=recruiter_id,
+            search_vector=search_query
+        )
+        if round_type:
+            segments = segments.filter(round_type=round_type)
+        if job_id:
+            segments = segments.filter(job_id=job_id)
+        if interview_id:
+            segments = segments.filter(interview_id=interview_id)
+
+        segments = segments.annotate(
+            rank=SearchRank(F('search_vector'), search_query),
+            headline=SearchHeadline(
+                'text',
+                search_query,
+                config=self.SEARCH_CONFIG,
+                start_sel='<mark>',
+                stop_sel='</mark>'
+            )
+        ).order_by('-rank', 'interview_id', 'start_ms').values(
+            'round_type', 'interview_id', 'job_id', 'start_ms', 'end_ms', 'text', 'headline', 'rank'
+        )[:limit]
+
+        return [
+            {
+                'round': segment['round_type'],
+                'interview_id': segment['interview_id'],
+                'job_id': segment['job_id'],
+                'start_ms': segment['start_ms'],
+                'end_ms': segment['end_ms'],
+                'text': segment['text'],
+                'headline': segment['headline'],
+                'rank': round(segment['rank'], 4)
+            }
+            for segment in segments
+        ]
@@ -3,7 +3,10 @@ from django.conf import settings
 from infrastructure.services.storage_factory import StorageFactory
 from infrastructure.services.token04 import generate_token04
 from PIL import Image
+import requests
 import time
+import io
+import os
 import hmac
 import hashlib
 import base64
@@ -75,6 +78,103 @@ class VideoProcessingService:
     #             'error': str(e)
     #         }
     
+    DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+    THUMBNAIL_SIZE = (640, 360)
+    THUMBNAIL_OFFSET_SECONDS = 5
+    
+    def ingest_recording(self, source_url: str, interview_id: int, filename: str) -> Dict:
+        """
+        Stream a provider recording into R2 without buffering the whole file.
+        Returns the R2 url/key plus size and SHA-256 checksum.
+        """
+        storage = StorageFactory.create_storage('r2')
+        
+        with requests.get(source_url, stream=True, timeout=(10, 60)) as response:
+            response.raise_for_status()
+            content_type = response.headers.get('Content-Type') or self._get_video_content_type(filename)
+            
+            result = storage.upload_stream(
+                response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE),
+                folder='hr-interviews/recordings',
+                filename=f"interview_{interview_id}_{filename}",
+                content_type=content_type,
+                make_public=False  # Private recordings
+            )
+        
+        logger.info(f" Ingested recording of interview {interview_id}: {result['size']} bytes")
+        return {
+            'video_url': result['url'],
+            'video_key': result['key'],
+            'file_size': result['size'],
+            'checksum': result['checksum'],
+            'video_format': os.path.splitext(filename)[1].lstrip('.').lower() or 'webm'
+        }
+    
+    def probe_recording(self, video_url: str, interview_id: int) -> Dict:
+        """
+        Duration, resolution and a thumbnail of a stored recording.
+        Only keyframes are decoded and decoding stops at the first one after
+        the seek point, so the video is never decoded (or downloaded) in full.
+        """
+        try:
+            import av
+        except ImportError:
+            logger.warning(" PyAV not installed, skipping recording metadata")
+            return {'success': False, 'error': 'PyAV not installed'}
+        
+        try:
+            with av.open(video_url, timeout=30) as container:
+                stream = container.streams.video[0]
+                stream.codec_context.skip_frame = 'NONKEY'
+                
+                duration = None
+                if container.duration:
+                    duration = container.duration / av.time_base
+                elif stream.duration and stream.time_base:
+                    duration = float(stream.duration * stream.time_base)
+                
+                offset = min(self.THUMBNAIL_OFFSET_SECONDS, duration / 2) if duration else 0
+                if offset and stream.time_base:
+                    try:
+                        container.seek(int(offset / stream.time_base), stream=stream, backward=True)
+                    except av.FFmpegError:
+                        # No seek index (e.g. live WebM) - use the first keyframe
+                        container.seek(0)
+                
+                frame = next(container.decode(stream), None)
+                image = frame.to_image() if frame is not None else None
+                resolution = f"{stream.codec_context.width}x{stream.codec_context.height}"
+            
+            thumbnail = {}
+            if image is not None:
+                image.thumbnail(self.THUMBNAIL_SIZE)
+                buffer = io.BytesIO()
+                image.save(buffer, format='JPEG', quality=80)
+                buffer.seek(0)
+                
+                thumbnail = self.storage.upload_file(
+                    file=buffer,
+                    folder='hr-interviews/thumbnails',
+                    filename=f"interview_{interview_id}.jpg",
+                    content_type='image/jpeg',
+                    make_public=False
+                )
+            
+            return {
+                'success': True,
+                'duration_seconds': int(duration) if duration else None,
+                'resolution': resolution,
+                'thumbnail_url': thumbnail.get('url'),
+                'thumbnail_key': thumbnail.get('key')
+            }
+            
+        except Exception as e:
+            logger.error(f" Recording probe error: {str(e)}")
+            return {
+                'success': False,
+                'error': str(e)
+            }
+    
     def delete_recording(self, video_key: str, thumbnail_key: str = None) -> bool:
         """Delete recording and thumbnail from storage"""
         try:
@@ -92,17 +192,17 @@ class VideoProcessingService:
             logger.error(f" Delete recording error: {str(e)}")
             return False
     
-    # def _get_video_content_type(self, filename: str) -> str:
-    #     """Get content type based on file extension"""
-    #     ext = os.path.splitext(filename)[1].lower()
+    def _get_video_content_type(self, filename: str) -> str:
+        """Get content type based on file extension"""
+        ext = os.path.splitext(filename)[1].lower()
         
-    #     content_types = {
-    #         '.webm': 'video/webm',
-    #         '.mp4': 'video/mp4',
-    #         '.mkv': 'video/x-matroska',
-    #     }
+        content_types = {
+            '.webm': 'video/webm',
+            '.mp4': 'video/mp4',
+            '.mkv': 'video/x-matroska',
+        }
         
-    #     return content_types.get(ext, 'video/webm')
+        return content_types.get(ext, 'video/webm')
 
 
 # class ChatService:
@@ -222,6 +322,38 @@ class MeetingService:
         
         logger.info(f"Generated token for {user_id} in {room_id} (length: {len(token_info.token)})")
         return token_info.token
+
+    TOKEN_CACHE_PREFIX = 'zegocloud:tokens'
+    # Cached tokens are replaced this long before they expire
+    TOKEN_REFRESH_MARGIN = 300
+
+    @staticmethod
+    def get_zegocloud_token(user_id: str, room_id: str, expire_time: int = 7200) -> str:
+        """
+        Cached generate_zegocloud_token. Tokens of a room are kept together
+        under one cache key, per user, so ending the session drops them all.
+        """
+        from django.core.cache import cache
+
+        cache_key = f"{MeetingService.TOKEN_CACHE_PREFIX}:{room_id}"
+        user_id = str(user_id)
+        now = time.time()
+
+        tokens = cache.get(cache_key) or {}
+        cached = tokens.get(user_id)
+        if cached and cached['expires_at'] - MeetingService.TOKEN_REFRESH_MARGIN > now:
+            return cached['token']
+
+        token = MeetingService.generate_zegocloud_token(user_id, room_id, expire_time)
+        tokens[user_id] = {'token': token, 'expires_at': now + expire_time}
+        cache.set(cache_key, tokens, timeout=expire_time)
+        return token
+
+    @staticmethod
+    def invalidate_zegocloud_tokens(room_id: str):
+        """Drop the cached tokens of a room once its session has ended"""
+        from django.core.cache import cache
+        cache.delete(f"{MeetingService.TOKEN_CACHE_PREFIX}:{room_id}")
         
     @staticmethod
     def validate_meeting_access(
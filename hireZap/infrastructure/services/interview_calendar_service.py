@@ -0,0 +1,189 @@
+from bisect import bisect_left
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+
+class IntervalIndex:
+    """
+    Busy intervals of one person, sorted by start.
+    A running max of the end times lets overlap checks and the
+    next-free-slot jump run as binary searches instead of scans.
+    """
+
+    def __init__(self):
+        self._starts = []
+        self._items = []
+        self._max_end = []
+
+    def add(self, start: datetime, end: datetime, ref: Optional[Dict] = None):
+        position = bisect_left(self._starts, start)
+        self._starts.insert(position, start)
+        self._items.insert(position, (start, end, ref))
+        self._max_end.insert(position, end)
+        self._rebuild_max_end(position)
+
+    def _rebuild_max_end(self, position: int):
+        running = self._max_end[position - 1] if position > 0 else None
+        for i in range(position, len(self._items)):
+            end = self._items[i][1]
+            running = end if running is None or end > running else running
+            self._max_end[i] = running
+
+    def overlaps(self, start: datetime, end: datetime) -> bool:
+        position = bisect_left(self._starts, end)
+        return position > 0 and self._max_end[position - 1] > start
+
+    def conflicts(self, start: datetime, end: datetime) -> List[Dict]:
+        """Refs of the intervals overlapping [start, end)"""
+        found = []
+        i = bisect_left(self._starts, end) - 1
+        # max_end only shrinks going left, so stop once it is behind start
+        while i >= 0 and self._max_end[i] > start:
+            if self._items[i][1] > start:
+                found.append(self._items[i][2])
+            i -= 1
+        return found
+
+    def next_free(self, start: datetime, duration: timedelta, limit: datetime) -> Optional[datetime]:
+        """Earliest t >= start with [t, t + duration) free and ending by limit"""
+        t = start
+        while t + duration <= limit:
+            position = bisect_left(self._starts, t + duration)
+            if position == 0 or self._max_end[position - 1] <= t:
+                return t
+            # Every slot before that end overlaps the same busy interval
+            t = self._max_end[position - 1]
+        return None
+
+
+class InterviewCalendar:
+    """
+    Interval indexes keyed by interviewer and by candidate, built once per
+    request from a single range query and updated in memory as slots are
+    reserved, so a whole batch is checked against itself as well.
+    """
+
+    def __init__(self, busy_intervals: List[Dict] = None, exclude: set = None):
+        self.interviewers = defaultdict(IntervalIndex)
+        self.candidates = defaultdict(IntervalIndex)
+
+        for interval in busy_intervals or []:
+            # The interview being (re)scheduled must not block itself
+            if exclude and (interval['round'], interval['application_id']) in exclude:
+                continue
+            self.reserve(
+                interval['interviewer_id'],
+                interval['candidate_id'],
+                interval['start'],
+                interval['end'],
+                interval
+            )
+
+    def reserve(self, interviewer_id, candidate_id, start: datetime, end: datetime, ref: Dict = None):
+        if interviewer_id:
+            self.interviewers[interviewer_id].add(start, end, ref)
+        if candidate_id:
+            self.candidates[candidate_id].add(start, end, ref)
+
+    def conflicts(self, interviewer_id, candidate_id, start: datetime, end: datetime) -> List[Dict]:
+        found = []
+        if interviewer_id in self.interviewers:
+            for ref in self.interviewers[interviewer_id].conflicts(start, end):
+                found.append(self._describe(ref, 'interviewer'))
+        if candidate_id in self.candidates:
+            for ref in self.candidates[candidate_id].conflicts(start, end):
+                found.append(self._describe(ref, 'candidate'))
+        return found
+
+    def free_slots(
+        self,
+        interviewer_id,
+        windows: List[Tuple[datetime, datetime]],
+        duration_minutes: int,
+        buffer_minutes: int = 0,
+        limit: int = 50) -> List[Dict]:
+        """Back-to-back free slots for an interviewer inside the windows"""
+        slots = []
+        index = self.interviewers.get(interviewer_id) or IntervalIndex()
+        duration = timedelta(minutes=duration_minutes)
+        buffer = timedelta(minutes=buffer_minutes)
+
+        for window_start, window_end in sorted(windows):
+            t = window_start
+            while len(slots) < limit:
+                # Buffer is kept on both sides of the slot
+                found = index.next_free(t - buffer, duration + 2 * buffer, window_end + buffer)
+                if found is None:
+                    break
+                start = found + buffer
+                slots.append({'start': start, 'end': start + duration})
+                t = start + duration + buffer
+        return slots
+
+    def allocate(
+        self,
+        interviewer_id,
+        candidates: List[Tuple[int, int]],
+        windows: List[Tuple[datetime, datetime]],
+        duration_minutes: int,
+        buffer_minutes: int = 0) -> Tuple[List[Dict], List[int]]:
+        """
+        Greedily pack (application_id, candidate_id) pairs into the
+        interviewer's windows, earliest slot first. Each slot must be free
+        for the interviewer (with buffer) and for the candidate.
+        Returns (allocations, unallocated application ids).
+        """
+        allocations = []
+        unallocated = []
+        duration = timedelta(minutes=duration_minutes)
+        buffer = timedelta(minutes=buffer_minutes)
+        windows = sorted(windows)
+        interviewer_index = self.interviewers[interviewer_id]
+
+        for application_id, candidate_id in candidates:
+            candidate_index = self.candidates.get(candidate_id)
+            start = None
+
+            for window_start, window_end in windows:
+                t = window_start
+                while t + duration <= window_end:
+                    found = interviewer_index.next_free(t - buffer, duration + 2 * buffer, window_end + buffer)
+                    if found is None:
+                        break
+                    t = found + buffer
+                    if candidate_index is None:
+                        start = t
+                        break
+                    # Alternate between both calendars until they agree
+                    candidate_free = candidate_index.next_free(t, duration, window_end)
+                    if candidate_free is None:
+                        break
+                    if candidate_free == t:
+                        start = t
+                        break
+                    t = candidate_free
+                if start is not None:
+                    break
+
+            if start is None:
+                unallocated.append(application_id)
+                continue
+
+            end = start + duration
+            ref = {'round': 'allocated', 'application_id': application_id, 'start': start, 'end': end}
+            self.reserve(interviewer_id, candidate_id, start, end, ref)
+            allocations.append({'application_id': application_id, 'start': start, 'end': end})
+
+        return allocations, unallocated
+
+    def _describe(self, ref: Dict, conflict_with: str) -> Dict:
+        ref = ref or {}
+        return {
+            'conflict_with': conflict_with,
+            'round': ref.get('round'),
+            'interview_id': ref.get('interview_id'),
+            'application_id': ref.get('application_id'),
+            'start': ref['start'].isoformat() if ref.get('start') else None,
+            'end': ref['end'].isoformat() if ref.get('end') else None,
+        }
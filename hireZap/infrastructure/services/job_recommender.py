@@ -0,0 +1,47 @@
+from typing import Dict, Optional, Tuple
+
+
+class JobRecommender:
+    """
+    Scores how well an active job suits a candidate (0-100): shared
+    canonical skills, experience against the job's min_experience, and
+    location / work-type preference.
+    """
+
+    SKILL_WEIGHT = 60
+    EXPERIENCE_WEIGHT = 25
+    LOCATION_WEIGHT = 10
+    WORK_TYPE_WEIGHT = 5
+
+    @staticmethod
+    def normalize_location(location: Optional[str]) -> Optional[str]:
+        return ' '.join(location.lower().split()) if location else None
+
+    def score(self, candidate: Dict, job: Dict) -> Tuple[float, int]:
+        """
+        (score, matched skill count).
+        candidate: {'skill_ids', 'experience_years', 'location', 'preferred_work_type'}
+        job: {'skill_ids', 'min_experience', 'location', 'work_type'}
+        """
+        matched = len(candidate['skill_ids'] & job['skill_ids'])
+        skills = matched / len(job['skill_ids']) if job['skill_ids'] else 0
+
+        min_experience = job['min_experience'] or 0
+        if min_experience <= 0:
+            experience = 1
+        else:
+            experience = min(candidate['experience_years'] / min_experience, 1)
+
+        # Remote jobs suit every location
+        located = job['work_type'] == 'remote' or (
+            candidate['location'] is not None and candidate['location'] == job['location']
+        )
+        preferred = candidate['preferred_work_type'] is not None and candidate['preferred_work_type'] == job['work_type']
+
+        score = (
+            self.SKILL_WEIGHT * skills +
+            self.EXPERIENCE_WEIGHT * experience +
+            self.LOCATION_WEIGHT * located +
+            self.WORK_TYPE_WEIGHT * preferred
+        )
+        return round(score, 2), matched
@@ -0,0 +1,45 @@
+from typing import Dict
+import json
+
+
+class MeetingPresenceService:
+    """
+    Members of a meeting room and the channel each one is connected on.
+    Lets the meeting consumer address a peer directly instead of
+    broadcasting to the whole room group.
+    """
+
+    KEY_PREFIX = 'meeting_peers'
+    PEER_TTL = 60 * 60 * 4
+
+    def __init__(self):
+        from infrastructure.redis_client import redis_client
+        self.redis = redis_client
+
+    def _room_key(self, room_id: str) -> str:
+        return f"{self.KEY_PREFIX}:{room_id}"
+
+    def join(self, room_id: str, user_id: str, user_type: str, channel_name: str) -> Dict[str, Dict]:
+        """Register a peer; returns the other peers already in the room"""
+        key = self._room_key(room_id)
+        pipe = self.redis.pipeline()
+        pipe.hgetall(key)
+        pipe.hset(key, user_id, json.dumps({'user_type': user_type, 'channel_name': channel_name}))
+        pipe.expire(key, self.PEER_TTL)
+        existing = pipe.execute()[0]
+
+        return {
+            peer_id: json.loads(peer)
+            for peer_id, peer in existing.items()
+            if peer_id != str(user_id)
+        }
+
+    def leave(self, room_id: str, user_id: str, channel_name: str):
+        """Drop a peer unless it has already reconnected on another channel"""
+        key = self._room_key(room_id)
+        current = self.redis.hget(key, user_id)
+        if current and json.loads(current)['channel_name'] == channel_name:
+            self.redis.hdel(key, user_id)
+
+    def touch(self, room_id: str):
+        self.redis.expire(self._room_key(room_id), self.PEER_TTL)
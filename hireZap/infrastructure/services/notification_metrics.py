@@ -0,0 +1,79 @@
+from collections import defaultdict
+from typing import Dict
+import time
+
+
+class NotificationMetrics:
+    """
+    Per-type WebSocket notification metrics: frames sent, bytes sent and
+    events dropped by coalescing. Consumers count in process (no Redis
+    round-trip per frame) and periodically add their counters to
+    per-minute Redis hashes, which summary() reads back.
+    """
+
+    KEY_PREFIX = 'notification_metrics'
+    FLUSH_INTERVAL = 10
+    KEY_TTL = 60 * 60 * 24
+
+    # Shared by every consumer of the process
+    _counters = defaultdict(int)
+    _last_flush = time.monotonic()
+
+    def __init__(self):
+        from infrastructure.redis_client import redis_client
+        self.redis = redis_client
+
+    @classmethod
+    def record_sent(cls, notification_type: str, size: int):
+        cls._counters[(notification_type, 'sent')] += 1
+        cls._counters[(notification_type, 'bytes')] += size
+
+    @classmethod
+    def record_coalesced(cls, notification_type: str):
+        cls._counters[(notification_type, 'coalesced')] += 1
+
+    @classmethod
+    def take_due(cls) -> Dict:
+        """The counters collected since the last flush, once FLUSH_INTERVAL passed"""
+        now = time.monotonic()
+        if now - cls._last_flush < cls.FLUSH_INTERVAL or not cls._counters:
+            return {}
+        counters = dict(cls._counters)
+        cls._counters.clear()
+        cls._last_flush = now
+        return counters
+
+    def _minute_key(self, minute: int) -> str:
+        return f"{self.KEY_PREFIX}:{minute}"
+
+    def write(self, counters: Dict):
+        if not counters:
+            return
+        key = self._minute_key(int(time.time()) // 60)
+        pipe = self.redis.pipeline(transaction=False)
+        for (notification_type, metric), value in counters.items():
+            pipe.hincrby(key, f"{notification_type}:{metric}", value)
+        pipe.expire(key, self.KEY_TTL)
+        pipe.execute()
+
+    def summary(self, minutes: int = 15) -> Dict[str, Dict]:
+        """Per type: sent, bytes, avg_bytes, sent_per_minute and coalesced over the last minutes"""
+        current = int(time.time()) // 60
+        pipe = self.redis.pipeline(transaction=False)
+        for minute in range(current - minutes + 1, current + 1):
+            pipe.hgetall(self._minute_key(minute))
+
+        totals = defaultdict(lambda: {'sent': 0, 'bytes': 0, 'coalesced': 0})
+        for counters in pipe.execute():
+            for name, value in counters.items():
+                notification_type, _, metric = name.rpartition(':')
+                totals[notification_type][metric] += int(value)
+
+        return {
+            notification_type: {
+                **metrics,
+                'avg_bytes': round(metrics['bytes'] / metrics['sent']) if metrics['sent'] else 0,
+                'sent_per_minute': round(metrics['sent'] / minutes, 2),
+            }
+            for notification_type, metrics in sorted(totals.items())
+        }
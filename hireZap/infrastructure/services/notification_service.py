@@ -1,35 +1,180 @@
-from typing import Dict
+from typing import Dict, Iterable, List, Optional, Tuple
+from contextlib import contextmanager
 from channels.layers import get_channel_layer
 from asgiref.sync import async_to_sync
+from celery import current_app
+import asyncio
 
 from core.interface.notification_service_port import NotificationServicePort
+from core.interface.outbox_repository_port import OutboxRepositoryPort
+from core.interface.notification_stream_port import NotificationStreamPort
 import logging
 logger = logging.getLogger(__name__)
 
 class NotificationService(NotificationServicePort):
-    
+    """
+    Notifications and email tasks are written to the transactional outbox
+    together with the state change they announce; the outbox dispatcher
+    (dispatch_outbox) delivers them once committed, at least once.
+    Delivered notifications are also kept in the user's notification
+    stream for replay on reconnect.
+    """
+
+    # group_send calls in flight at once (each holds a pooled Redis connection)
+    MAX_CONCURRENT_SENDS = 50
+
+    def __init__(
+        self,
+        outbox_repository: OutboxRepositoryPort = None,
+        notification_stream: NotificationStreamPort = None):
+
+        if outbox_repository is None:
+            from infrastructure.repositories.outbox_repository import OutboxRepository
+            outbox_repository = OutboxRepository()
+        if notification_stream is None:
+            from infrastructure.services.notification_stream import NotificationStream
+            notification_stream = NotificationStream()
+        self.outbox = outbox_repository
+        self.stream = notification_stream
+        self._buffer = None
+        self._buffer_depth = 0
+
     def send_websocket_notification(self, user_id: int, notification_type: str, data: Dict):
-        """Send WebSocket notification to user"""
+        """Queue WebSocket notification to user through the outbox"""
+        self._record({
+            'kind': 'websocket',
+            'destination': f'user_{user_id}',
+            'payload': {'type': notification_type, **data}
+        })
+
+    def defer_task(self, task, *args, **kwargs):
+        """Queue a Celery task (task object or registered name) through the outbox"""
+        self._record({
+            'kind': 'task',
+            'destination': getattr(task, 'name', task),
+            'payload': {'args': list(args), 'kwargs': kwargs}
+        })
+
+    def _record(self, message: Dict):
+        if self._buffer is not None:
+            self._buffer.append(message)
+            return
+        self.outbox.add_messages([message])
+
+    @contextmanager
+    def buffered(self):
+        """
+        Collect outbox messages recorded inside the block and write them with
+        one insert on exit (still inside the surrounding transaction).
+        Nested blocks flush with the outermost.
+        """
+        if self._buffer_depth == 0:
+            self._buffer = []
+        self._buffer_depth += 1
         try:
-            channel_layer = get_channel_layer()
-            async_to_sync(channel_layer.group_send)(
-                f'user_{user_id}',
-                {
-                    'type': notification_type,
-                    **data
-                }
+            yield self
+        finally:
+            self._buffer_depth -= 1
+            if self._buffer_depth == 0:
+                pending, self._buffer = self._buffer, None
+                if pending:
+                    self.outbox.add_messages(pending)
+
+    def send_many(self, notifications: Iterable[Tuple[int, str, Dict]]) -> List[Optional[Exception]]:
+        """
+        Send many (user_id, notification_type, data) notifications right away
+        with a single event-loop hop, bypassing the outbox.
+        Returns the exception of each failed notification, else None, in order.
+        """
+        messages = [
+            (f'user_{user_id}', {'type': notification_type, **data})
+            for user_id, notification_type, data in notifications
+        ]
+        if not messages:
+            return []
+
+        try:
+            return async_to_sync(self._group_send_many)(self._record_history(messages))
+        except Exception as e:
+            logger.error(f"WebSocket notification batch failed: {str(e)}")
+            return [e] * len(messages)
+
+    def _record_history(self, messages: List[Tuple[str, Dict]]) -> List[Tuple[str, Dict]]:
+        """Append user notifications to their stream; the stream id travels in the event"""
+        try:
+            stream_ids = self.stream.append_many(
+                [(group[len('user_'):], message) for group, message in messages]
             )
         except Exception as e:
-            logger.error(f"WebSocket notification failed: {str(e)}")
-    
+            logger.error(f"Notification stream append failed: {str(e)}")
+            return messages
+
+        return [
+            (group, {**message, 'stream_id': stream_id} if stream_id else message)
+            for (group, message), stream_id in zip(messages, stream_ids)
+        ]
+
+    async def _group_send_many(self, messages) -> List:
+        """group_send every (group, message) concurrently; the exception of each failed one, else None"""
+        channel_layer = get_channel_layer()
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SENDS)
+
+        async def send(group, message):
+            async with semaphore:
+                await channel_layer.group_send(group, message)
+
+        results = await asyncio.gather(
+            *(send(group, message) for group, message in messages),
+            return_exceptions=True
+        )
+        failed = [result for result in results if isinstance(result, Exception)]
+        if failed:
+            logger.error(f"WebSocket notification failed for {len(failed)} of {len(messages)}: {failed[0]}")
+        return [result if isinstance(result, Exception) else None for result in results]
+
+    def dispatch_outbox(self, limit: int = 200) -> Dict:
+        """Deliver one batch of due outbox messages"""
+        return self.outbox.dispatch_due(self._deliver, limit=limit)
+
+    def _deliver(self, messages: List[Dict]) -> Dict[int, str]:
+        failures = {}
+
+        notifications = [message for message in messages if message['kind'] == 'websocket']
+        if notifications:
+            errors = self.send_many(
+                (
+                    message['destination'][len('user_'):],
+                    message['payload']['type'],
+                    {key: value for key, value in message['payload'].items() if key != 'type'}
+                )
+                for message in notifications
+            )
+            for message, error in zip(notifications, errors):
+                if error is not None:
+                    failures[message['id']] = str(error)
+
+        for message in messages:
+            if message['kind'] != 'task':
+                continue
+            try:
+                current_app.send_task(
+                    message['destination'],
+                    args=message['payload'].get('args', []),
+                    kwargs=message['payload'].get('kwargs', {})
+                )
+            except Exception as e:
+                failures[message['id']] = str(e)
+
+        return failures
+
     def send_screening_result_email(self, application_id: int, decision: str, score: int):
         """Send screening result email (triggers Celery task)"""
         from resume_screening.tasks import send_screening_result_email_task
-        send_screening_result_email_task.delay(application_id, decision, score)
-        
-    
+        self.defer_task(send_screening_result_email_task, application_id, decision, score)
+
+
     def send_stage_progress_email(self, application_id: int, current_stage: str, next_stage: str):
         """Send stage progression email (triggers Celery task)"""
         from resume_screening.tasks import send_stage_progress_email_task
-        send_stage_progress_email_task.delay(application_id, current_stage, next_stage)
-        
\ No newline at end of file
+        self.defer_task(send_stage_progress_email_task, application_id, current_stage, next_stage)
+
@@ -0,0 +1,105 @@
+from typing import Dict, List, Optional, Tuple
+import json
+
+from core.interface.notification_stream_port import NotificationStreamPort
+
+
+class NotificationStream(NotificationStreamPort):
+    """
+    Per-user notification history on capped Redis streams. Every delivered
+    notification is appended first, and its stream id travels with the
+    WebSocket frame, so a client reconnecting with its last-seen id gets
+    whatever it missed. A read cursor per user backs the unread count.
+
+    Progress updates would quickly push everything else out of a capped
+    stream, so only the latest one per job is kept, in a hash, and sent
+    with every replay.
+    """
+
+    KEY_PREFIX = 'notifications'
+    MAX_LEN = 200
+    KEY_TTL = 60 * 60 * 24 * 30
+
+    # Superseded by the next update; keyed by (type, job)
+    TRANSIENT_TYPES = ('screening_progress', 'screening_progress_update')
+
+    def __init__(self):
+        from infrastructure.redis_client import redis_client
+        self.redis = redis_client
+
+    def _stream_key(self, user_id) -> str:
+        return f"{self.KEY_PREFIX}:stream:{user_id}"
+
+    def _latest_key(self, user_id) -> str:
+        return f"{self.KEY_PREFIX}:latest:{user_id}"
+
+    def _cursor_key(self, user_id) -> str:
+        return f"{self.KEY_PREFIX}:read:{user_id}"
+
+    def append_many(self, notifications: List[Tuple[int, Dict]]) -> List[Optional[str]]:
+        pipe = self.redis.pipeline(transaction=False)
+        for user_id, event in notifications:
+            if event.get('type') in self.TRANSIENT_TYPES:
+                pipe.hset(self._latest_key(user_id), f"{event['type']}:{event.get('job_id')}", json.dumps(event))
+                pipe.expire(self._latest_key(user_id), self.KEY_TTL)
+            else:
+                pipe.xadd(self._stream_key(user_id), {'event': json.dumps(event)}, maxlen=self.MAX_LEN, approximate=True)
+                pipe.expire(self._stream_key(user_id), self.KEY_TTL)
+        results = pipe.execute()
+
+        # Two replies per notification; the first is the stream id for stored ones
+        ids = []
+        for (user_id, event), reply in zip(notifications, results[::2]):
+            ids.append(None if event.get('type') in self.TRANSIENT_TYPES else reply)
+        return ids
+
+    def replay(self, user_id, after_id: Optional[str] = None, limit: int = MAX_LEN) -> List[Tuple[Optional[str], Dict]]:
+        pipe = self.redis.pipeline(transaction=False)
+        if after_id:
+            pipe.xrange(self._stream_key(user_id), min=f'({after_id}', count=limit)
+        else:
+            pipe.xrevrange(self._stream_key(user_id), count=limit)
+        pipe.hvals(self._latest_key(user_id))
+        entries, latest = pipe.execute()
+
+        if not after_id:
+            entries = list(reversed(entries))
+
+        events = [(entry_id, json.loads(fields['event'])) for entry_id, fields in entries]
+        events.extend((None, json.loads(event)) for event in latest)
+        return events
+
+    def unread_count(self, user_id) -> Dict:
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.get(self._cursor_key(user_id))
+        pipe.xrevrange(self._stream_key(user_id), count=1)
+        cursor, last = pipe.execute()
+
+        last_id = last[0][0] if last else None
+        if not last_id:
+            return {'unread_count': 0, 'last_id': None, 'last_read_id': cursor}
+
+        # The stream is capped, so counting past the cursor stays cheap
+        min_id = f'({cursor}' if cursor else '-'
+        unread = len(self.redis.xrange(self._stream_key(user_id), min=min_id, count=self.MAX_LEN * 2))
+        return {'unread_count': unread, 'last_id': last_id, 'last_read_id': cursor}
+
+    def mark_read(self, user_id, last_id: Optional[str] = None) -> Optional[str]:
+        if not last_id:
+            last = self.redis.xrevrange(self._stream_key(user_id), count=1)
+            if not last:
+                return None
+            last_id = last[0][0]
+
+        # Never move the cursor backwards (e.g. a stale tab)
+        cursor = self.redis.get(self._cursor_key(user_id))
+        if cursor and self.stream_id_key(cursor) >= self.stream_id_key(last_id):
+            return cursor
+        self.redis.set(self._cursor_key(user_id), last_id, ex=self.KEY_TTL)
+        return last_id
+
+    @staticmethod
+    def stream_id_key(stream_id: str) -> Tuple[int, int]:
+        """Sort key of a stream id ('<ms>-<seq>')"""
+        ms, _, seq = stream_id.partition('-')
+        return int(ms), int(seq or 0)
@@ -2,12 +2,16 @@ import boto3
 from botocore.client import Config
 from django.conf import settings
 from core.interface.storage_repository_port import StorageRepositoryPort
-from typing import BinaryIO, Dict
+from typing import BinaryIO, Dict, Iterable
+import hashlib
 import uuid
 import os
 import logging
 logger = logging.getLogger(__name__)
 
+# S3/R2 parts must be at least 5 MB (except the last one)
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
+
 class R2Storage(StorageRepositoryPort):
     def __init__(self):
         self.account_id = settings.R2_ACCOUNT_ID
@@ -69,6 +73,90 @@ class R2Storage(StorageRepositoryPort):
             logger.error(f" R2 Upload Error: {str(e)}")
             raise Exception(f"Failed to upload to R2: {str(e)}")
     
+    def upload_stream(
+        self,
+        chunks: Iterable[bytes],
+        folder: str,
+        filename: str,
+        content_type: str,
+        make_public: bool = True,
+        part_size: int = MULTIPART_PART_SIZE) -> Dict:
+        """
+        Multipart upload from an iterator of byte chunks. At most one part
+        is held in memory; size and SHA-256 are computed on the way.
+        """
+        file_ext = os.path.splitext(filename)[1]
+        unique_id = uuid.uuid4().hex[:8]
+        file_key = f"{folder}/{unique_id}{file_ext}"
+        
+        extra_args = {'ContentType': content_type}
+        if make_public:
+            extra_args['ACL'] = 'public-read'
+        
+        upload = self.client.create_multipart_upload(
+            Bucket=self.bucket_name,
+            Key=file_key,
+            **extra_args
+        )
+        upload_id = upload['UploadId']
+        
+        parts = []
+        digest = hashlib.sha256()
+        size = 0
+        buffer = bytearray()
+        
+        def upload_part(body):
+            part_number = len(parts) + 1
+            response = self.client.upload_part(
+                Bucket=self.bucket_name,
+                Key=file_key,
+                PartNumber=part_number,
+                UploadId=upload_id,
+                Body=bytes(body)
+            )
+            parts.append({'ETag': response['ETag'], 'PartNumber': part_number})
+        
+        try:
+            for chunk in chunks:
+                if not chunk:
+                    continue
+                digest.update(chunk)
+                size += len(chunk)
+                buffer.extend(chunk)
+                if len(buffer) >= part_size:
+                    upload_part(buffer)
+                    buffer = bytearray()
+            
+            if buffer or not parts:
+                if not size:
+                    raise ValueError("Empty upload stream")
+                upload_part(buffer)
+            
+            self.client.complete_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=file_key,
+                UploadId=upload_id,
+                MultipartUpload={'Parts': parts}
+            )
+            
+        except Exception as e:
+            logger.error(f" R2 Multipart Upload Error: {str(e)}")
+            self.client.abort_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=file_key,
+                UploadId=upload_id
+            )
+            raise Exception(f"Failed to upload to R2: {str(e)}")
+        
+        return {
+            'url': f"{self.public_url}/{file_key}",
+            'key': file_key,
+            'bucket': self.bucket_name,
+            'size': size,
+            'checksum': digest.hexdigest(),
+            'success': True
+        }
+    
     def delete_file(self, file_key: str) -> bool:
         try:
             self.client.delete_object(
@@ -0,0 +1,139 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import List
+from celery import current_app
+from django.utils import timezone
+import logging
+logger = logging.getLogger(__name__)
+
+
+class InterviewReminderScheduler:
+    """
+    ETA-based interview reminders.
+
+    Reminders are grouped into one-minute buckets in Redis and each bucket
+    gets a single ETA task that sends all of its reminders as one batch.
+    Buckets further out than QUEUE_HORIZON are only recorded; the periodic
+    queue task hands them to Celery as they come close, which keeps ETAs
+    shorter than the Redis broker's visibility timeout.
+    """
+
+    KEY_PREFIX = 'interview_reminders'
+    BUCKET_SECONDS = 60
+    QUEUE_HORIZON = timedelta(minutes=30)
+    KEY_TTL = 60 * 60 * 24 * 90
+
+    # Task sending one bucket of reminders, per interview round
+    TASKS = {
+        'telephonic': 'telephonic_round.send_due_interview_reminders',
+        'hr': 'hr_interview.send_due_hr_interview_reminders',
+    }
+
+    def __init__(self):
+        from infrastructure.redis_client import redis_client
+        self.redis = redis_client
+
+    def _bucket_key(self, round_name: str, bucket: int) -> str:
+        return f"{self.KEY_PREFIX}:{round_name}:bucket:{bucket}"
+
+    def _task_key(self, round_name: str, bucket: int) -> str:
+        return f"{self.KEY_PREFIX}:{round_name}:task:{bucket}"
+
+    def _index_key(self, round_name: str) -> str:
+        return f"{self.KEY_PREFIX}:{round_name}:index"
+
+    def _due_key(self, round_name: str) -> str:
+        return f"{self.KEY_PREFIX}:{round_name}:due"
+
+    def _bucket_for(self, remind_at: datetime) -> int:
+        return int(remind_at.timestamp()) // self.BUCKET_SECONDS * self.BUCKET_SECONDS
+
+    def schedule(self, round_name: str, interview_id: int, remind_at: datetime):
+        """Schedule (or move) the reminder of one interview"""
+        now = timezone.now()
+        bucket = self._bucket_for(max(remind_at, now))
+
+        self._remove(round_name, interview_id, keep_bucket=bucket)
+
+        pipe = self.redis.pipeline()
+        pipe.sadd(self._bucket_key(round_name, bucket), interview_id)
+        pipe.expire(self._bucket_key(round_name, bucket), self.KEY_TTL)
+        pipe.zadd(self._due_key(round_name), {bucket: bucket})
+        pipe.hset(self._index_key(round_name), interview_id, bucket)
+        pipe.execute()
+
+        if bucket <= (now + self.QUEUE_HORIZON).timestamp():
+            self._queue_bucket(round_name, bucket)
+
+    def cancel(self, round_name: str, interview_id: int):
+        """Drop the reminder of one interview; revokes the bucket task once empty"""
+        self._remove(round_name, interview_id)
+
+    def queue_upcoming(self, round_name: str) -> int:
+        """Queue ETA tasks for buckets due within the horizon (and overdue ones)"""
+        horizon = (timezone.now() + self.QUEUE_HORIZON).timestamp()
+        buckets = self.redis.zrangebyscore(self._due_key(round_name), '-inf', horizon)
+        queued = 0
+        for bucket in buckets:
+            if self._queue_bucket(round_name, int(bucket)):
+                queued += 1
+        return queued
+
+    def pop_due(self, round_name: str, bucket: int) -> List[int]:
+        """Take every interview id of a bucket; a redelivered task gets nothing"""
+        bucket_key = self._bucket_key(round_name, bucket)
+
+        pipe = self.redis.pipeline()
+        pipe.smembers(bucket_key)
+        pipe.delete(bucket_key)
+        pipe.zrem(self._due_key(round_name), bucket)
+        pipe.delete(self._task_key(round_name, bucket))
+        members = pipe.execute()[0]
+
+        interview_ids = [int(member) for member in members]
+        if interview_ids:
+            self.redis.hdel(self._index_key(round_name), *interview_ids)
+        return interview_ids
+
+    def _queue_bucket(self, round_name: str, bucket: int) -> bool:
+        task_key = self._task_key(round_name, bucket)
+        eta = datetime.fromtimestamp(bucket, tz=dt_timezone.utc)
+
+        # One task per bucket; the marker expires if the task is ever lost
+        ttl = max(int(bucket - timezone.now().timestamp()), 0) + int(self.QUEUE_HORIZON.total_seconds())
+        if not self.redis.set(task_key, 'queued', nx=True, ex=ttl):
+            return False
+
+        result = current_app.send_task(self.TASKS[round_name], args=[bucket], eta=eta)
+        self.redis.set(task_key, result.id, ex=ttl)
+        logger.info(f" Queued {round_name} reminder bucket {bucket} (task {result.id})")
+        return True
+
+    def _remove(self, round_name: str, interview_id: int, keep_bucket: int = None):
+        index_key = self._index_key(round_name)
+        current = self.redis.hget(index_key, interview_id)
+        if current is None:
+            return
+
+        current = int(current)
+        if current == keep_bucket:
+            return
+
+        bucket_key = self._bucket_key(round_name, current)
+        pipe = self.redis.pipeline()
+        pipe.srem(bucket_key, interview_id)
+        pipe.hdel(index_key, interview_id)
+        pipe.scard(bucket_key)
+        remaining = pipe.execute()[2]
+
+        if remaining:
+            return
+
+        # Bucket is empty - drop it and revoke its queued task
+        task_id = self.redis.get(self._task_key(round_name, current))
+        pipe = self.redis.pipeline()
+        pipe.zrem(self._due_key(round_name), current)
+        pipe.delete(bucket_key, self._task_key(round_name, current))
+        pipe.execute()
+
+        if task_id and task_id != 'queued':
+            current_app.control.revoke(task_id)
@@ -2,10 +2,14 @@ import PyPDF2
 import io
 import requests
 import re
-from typing import Dict, List
+from typing import List, Optional
+from infrastructure.services.skill_taxonomy import SkillTaxonomy
 
 class ResumeParser:
     """Extract structured data from resume"""
+    def __init__(self, skill_taxonomy: Optional[SkillTaxonomy] = None):
+        self.skill_taxonomy = skill_taxonomy or SkillTaxonomy()
+
     def download_resume(self, resume_url: str) -> bytes:
         """Download resume from cloudinary"""
         try:
@@ -65,13 +69,20 @@ class ResumeParser:
         return "Not specified"
 
     def find_skills(self, text: str, skill_list: List[str]) -> List[str]:
-        """Find which skills from the list are in resume"""
+        """
+        Find which skills from the list are in resume. A skill also counts
+        when the resume names it by a text-safe alias (ReactJS for React).
+        """
         text_lower = text.lower()
+        skill_ids = self.skill_taxonomy.resolve(skill_list)
+        mentioned = self.skill_taxonomy.skills_in_text(text) if skill_ids else set()
         found_skills = []
         
         for skill in skill_list:
+            if skill_ids.get(skill) in mentioned:
+                found_skills.append(skill)
             # Check for whole word match
-            if re.search(r'\b' + re.escape(skill.lower()) + r'\b', text_lower):
+            elif re.search(r'\b' + re.escape(skill.lower()) + r'\b', text_lower):
                 found_skills.append(skill)
         
         return found_skills
@@ -0,0 +1,29 @@
+from django.contrib.postgres.search import SearchQuery
+import re
+
+
+class SearchQueryBuilder:
+    """
+    Turns a user's search box input into a Postgres full-text query.
+    Explicit expressions ("react native", -intern, a or b) use websearch
+    syntax; natural phrasing matches any of its words, ranked.
+    """
+
+    # Markers that make a query an explicit web-search expression
+    WEBSEARCH_MARKERS = ('"', ' or ', ' OR ', ' -')
+
+    def __init__(self, config: str = 'english'):
+        self.config = config
+
+    def build(self, query: str) -> SearchQuery:
+        if query.startswith('-') or any(marker in query for marker in self.WEBSEARCH_MARKERS):
+            return SearchQuery(query, config=self.config, search_type='websearch')
+
+        terms = re.findall(r'\w+', query)
+        if not terms:
+            return SearchQuery(query, config=self.config, search_type='plain')
+
+        search_query = SearchQuery(terms[0], config=self.config)
+        for term in terms[1:]:
+            search_query |= SearchQuery(term, config=self.config)
+        return search_query
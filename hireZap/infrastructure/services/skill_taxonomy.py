@@ -0,0 +1,105 @@
+from typing import Dict, Iterable, List, Optional, Set
+import re
+from django.core.cache import cache
+
+# Words of a skill name; keeps the symbols of c++, c#, .net and node.js
+TOKEN_PATTERN = re.compile(r'\.?[a-z0-9][a-z0-9+#.]*')
+
+
+class SkillTaxonomy:
+    """
+    Canonical skills and their aliases. Every skill name (job requirement,
+    candidate skill) is normalized and resolved to a skill id through one
+    alias map; resume text is only matched against the keys and the
+    aliases safe to look for in prose. Both maps are cached and rebuilt
+    when skills or aliases change.
+    """
+
+    CACHE_KEY = 'skills:taxonomy:v2'
+    CACHE_TIMEOUT = 60 * 60
+
+    # Longest alias (in words) looked for in resume text
+    MAX_ALIAS_WORDS = 4
+
+    @staticmethod
+    def tokens(text: str) -> List[str]:
+        return [token.rstrip('.') for token in TOKEN_PATTERN.findall(text.lower())]
+
+    @classmethod
+    def normalize(cls, name: str) -> str:
+        """'  React.JS ' -> 'react.js', 'Machine  Learning' -> 'machine learning'"""
+        return ' '.join(cls.tokens(name or ''))
+
+    def _load(self) -> Dict:
+        taxonomy = cache.get(self.CACHE_KEY)
+        if taxonomy is not None:
+            return taxonomy
+
+        from skills.models import Skill, SkillAlias
+
+        aliases = dict(Skill.objects.values_list('key', 'id'))
+        text_aliases = dict(aliases)
+        for alias, skill_id, match_in_text in SkillAlias.objects.values_list('alias', 'skill_id', 'match_in_text'):
+            aliases[alias] = skill_id
+            if match_in_text:
+                text_aliases[alias] = skill_id
+        taxonomy = {
+            'aliases': aliases,
+            'text_aliases': text_aliases,
+            'max_words': min(
+                max((len(alias.split(' ')) for alias in text_aliases), default=1),
+                self.MAX_ALIAS_WORDS
+            ),
+        }
+        # Invalidated by skills.signals when skills or aliases change
+        cache.set(self.CACHE_KEY, taxonomy, self.CACHE_TIMEOUT)
+        return taxonomy
+
+    def invalidate(self):
+        cache.delete(self.CACHE_KEY)
+
+    def resolve(self, names: Iterable[str], create: bool = False) -> Dict[str, int]:
+        """
+        Skill id of each name that resolves (directly or by alias).
+        With create, unknown names become new canonical skills.
+        """
+        aliases = self._load()['aliases']
+        resolved = {}
+        unknown = {}
+        for name in names:
+            key = self.normalize(name)
+            if not key:
+                continue
+            if key in aliases:
+                resolved[name] = aliases[key]
+            elif create:
+                unknown.setdefault(key, []).append(name)
+
+        if unknown:
+            from skills.models import Skill
+            for key, key_names in unknown.items():
+                skill, _ = Skill.objects.get_or_create(
+                    key=key[:100],
+                    defaults={'name': key_names[0].strip()[:100]}
+                )
+                for name in key_names:
+                    resolved[name] = skill.id
+
+        return resolved
+
+    def resolve_one(self, name: str, create: bool = False) -> Optional[int]:
+        return self.resolve([name], create=create).get(name)
+
+    def skills_in_text(self, text: str) -> Set[int]:
+        """Ids of every skill mentioned in the text, by key or a text-safe alias"""
+        taxonomy = self._load()
+        aliases = taxonomy['text_aliases']
+        tokens = self.tokens(text)
+
+        found = set()
+        for size in range(1, taxonomy['max_words'] + 1):
+            for start in range(len(tokens) - size + 1):
+                skill_id = aliases.get(' '.join(tokens[start:start + size]))
+                if skill_id is not None:
+                    found.add(skill_id)
+        return found
@@ -1,73 +1,157 @@
 import requests
 import json
-from typing import Dict, List, BinaryIO
+from typing import Dict, List, BinaryIO, Optional
 from django.conf import settings
 from google import genai
 from groq import Groq
 from google.genai import types
-from faster_whisper import WhisperModel
+from faster_whisper import WhisperModel, decode_audio
 import tempfile
 import os
+import math
+import hashlib
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
 import logging
 logger = logging.getLogger(__name__)
 
 class TranscriptionService:
-    
-    def __init__(self):
-        # Use 'base' for good balance of speed and accuracy
-        # Change to 'small' or 'medium' for better accuracy
-        # Use 'tiny' if you have limited RAM/CPU
-        self.model_size = getattr(settings, 'WHISPER_MODEL_SIZE', 'base')
-        
+
+    SAMPLING_RATE = 16000
+
+    # Loaded models are shared across instances so a worker only pays the
+    # load cost once per (model_size, device, compute_type)
+    _models = {}
+
+    def __init__(self, profile: str = None):
         # Device: 'cpu' or 'cuda' (if you have NVIDIA GPU)
         # compute_type: 'int8' for CPU, 'float16' for GPU
         self.device = getattr(settings, 'WHISPER_DEVICE', 'cpu')
-        self.compute_type = 'int8' if self.device == 'cpu' else 'float16'
-        
-        # Load model (downloads on first use, then cached)
-        self.model = WhisperModel(
-            self.model_size,
-            device=self.device,
-            compute_type=self.compute_type,
-            download_root=None  # Uses default cache directory
+        self.profiles = getattr(settings, 'WHISPER_PROFILES', {
+            'balanced': {
+                'model_size': getattr(settings, 'WHISPER_MODEL_SIZE', 'base'),
+                'beam_size': 5,
+                'compute_type': None
+            }
+        })
+        self.default_profile = profile or getattr(settings, 'WHISPER_DEFAULT_PROFILE', 'balanced')
+        self.second_pass_profile = getattr(settings, 'WHISPER_SECOND_PASS_PROFILE', 'accurate')
+
+    def get_profile(self, profile: str = None) -> Dict:
+        name = profile or self.default_profile
+        if name not in self.profiles:
+            logger.warning(f" Unknown transcription profile '{name}', using '{self.default_profile}'")
+            name = self.default_profile
+        config = dict(self.profiles[name])
+        config['name'] = name
+        config['compute_type'] = config.get('compute_type') or (
+            'int8' if self.device == 'cpu' else 'float16'
         )
-        
-        logger.info(f" Whisper model loaded successfully!")
-    
+        return config
+
+    def get_model(self, profile: str = None) -> WhisperModel:
+        config = self.get_profile(profile)
+        key = (config['model_size'], self.device, config['compute_type'])
+
+        if key not in self._models:
+            # Load model (downloads on first use, then cached)
+            self._models[key] = WhisperModel(
+                config['model_size'],
+                device=self.device,
+                compute_type=config['compute_type'],
+                download_root=None  # Uses default cache directory
+            )
+            logger.info(f" Whisper model '{config['model_size']}' loaded successfully!")
+
+        return self._models[key]
+
+    @staticmethod
+    def build_model_label(profile: Dict, second_pass: Dict = None) -> str:
+        """Value stored in InterviewTranscription.model_used"""
+        label = f"{profile['name']}:{profile['model_size']}"
+        if second_pass:
+            label += f"+{second_pass['model_size']}"
+        return label
+
+    @staticmethod
+    def segment_confidence(segment) -> float:
+        # avg_logprob is the mean token log probability of the segment
+        return round(min(1.0, math.exp(segment.avg_logprob)), 3)
+
+    def load_audio(self, audio_path: str):
+        """Decode audio once to a 16kHz mono array (reused for resume and second pass)"""
+        return decode_audio(audio_path, sampling_rate=self.SAMPLING_RATE)
+
+    def stream_segments(
+        self,
+        audio,
+        language: str = "en",
+        profile: str = None,
+        start_offset: float = 0.0):
+        """
+        Lazily transcribe decoded audio.
+        Returns (info, generator) - segments are yielded as faster-whisper
+        decodes them, with timestamps on the original recording timeline
+        even when resuming from start_offset.
+        """
+        config = self.get_profile(profile)
+        clip = audio[int(start_offset * self.SAMPLING_RATE):] if start_offset else audio
+
+        segments, info = self.get_model(config['name']).transcribe(
+            clip,
+            language=language if language != "auto" else None,
+            beam_size=config['beam_size'],  # 1 = greedy decoding
+            vad_filter=True,  # Voice Activity Detection (removes silence)
+            vad_parameters=dict(
+                min_silence_duration_ms=500  # Minimum silence to split
+            )
+        )
+
+        def generate():
+            for segment in segments:
+                yield {
+                    'start': round(segment.start + start_offset, 2),
+                    'end': round(segment.end + start_offset, 2),
+                    'text': segment.text.strip(),
+                    'confidence': self.segment_confidence(segment)
+                }
+
+        return info, generate()
+
     def transcribe_audio(
         self,
         audio_file: BinaryIO,
-        language: str = "en") -> Dict:
+        language: str = "en",
+        profile: str = None,
+        two_pass: bool = False,
+        confidence_threshold: float = 0.6) -> Dict:
         temp_path = None
         
         try:
             # Save uploaded file to temporary location
             temp_path = self._save_temp_file(audio_file)
             
-            logger.info(f" Starting transcription: {temp_path}")
+            config = self.get_profile(profile)
+            logger.info(f" Starting transcription ({config['name']}): {temp_path}")
+            start_time = time.time()
             
-            # Transcribe with faster-whisper
-            segments, info = self.model.transcribe(
-                temp_path,
-                language=language if language != "auto" else None,
-                beam_size=5,  # Higher = more accurate but slower
-                vad_filter=True,  # Voice Activity Detection (removes silence)
-                vad_parameters=dict(
-                    min_silence_duration_ms=500  # Minimum silence to split
-                )
-            )
+            audio = self.load_audio(temp_path)
+            info, segments = self.stream_segments(audio, language=language, profile=config['name'])
+            processed_segments = list(segments)
             
-            # Process segments
-            full_text = ""
-            processed_segments = []
+            second_pass = None
+            if two_pass:
+                second_pass = self.retranscribe_low_confidence(
+                    audio,
+                    processed_segments,
+                    language=info.language,
+                    first_pass=config,
+                    confidence_threshold=confidence_threshold
+                )
             
-            for segment in segments:
-                full_text += segment.text + " "
-                processed_segments.append({
-                    'start': segment.start,
-                    'end': segment.end,
-                    'text': segment.text.strip()
-                })
+            full_text = " ".join(s['text'] for s in processed_segments if s['text'])
+            processing_time = time.time() - start_time
             
             logger.info(f" Transcription completed: {len(full_text)} characters")
             logger.info(f" Language: {info.language} (probability: {info.language_probability:.2f})")
@@ -75,11 +159,15 @@ class TranscriptionService:
             
             return {
                 'success': True,
-                'text': full_text.strip(),
+                'text': full_text,
                 'segments': processed_segments,
                 'language': info.language,
                 'duration': info.duration,
-                'confidence': info.language_probability
+                'confidence': info.language_probability,
+                'profile': config['name'],
+                'model_used': self.build_model_label(config, second_pass),
+                'processing_time': round(processing_time, 2),
+                'real_time_factor': round(processing_time / info.duration, 3) if info.duration else None
             }
             
         except Exception as e:
@@ -96,7 +184,58 @@ class TranscriptionService:
                     os.unlink(temp_path)
                 except:
                     pass
-    
+
+    def retranscribe_low_confidence(
+        self,
+        audio,
+        segments: List[Dict],
+        language: str,
+        first_pass: Dict,
+        confidence_threshold: float) -> Optional[Dict]:
+        """
+        Re-transcribe only the segments below the confidence threshold with
+        the second pass profile. Segments are replaced in place.
+        Returns the second pass profile if it was used.
+        """
+        low_confidence = [
+            s for s in segments if s['confidence'] < confidence_threshold
+        ]
+        second_pass = self.get_profile(self.second_pass_profile)
+
+        if not low_confidence or second_pass['model_size'] == first_pass['model_size']:
+            return None
+
+        logger.info(
+            f" Second pass ({second_pass['name']}) on {len(low_confidence)}/{len(segments)} segments"
+        )
+        model = self.get_model(second_pass['name'])
+
+        for segment in low_confidence:
+            clip = audio[int(segment['start'] * self.SAMPLING_RATE):int(segment['end'] * self.SAMPLING_RATE)]
+            if not len(clip):
+                continue
+
+            retry_segments, _ = model.transcribe(
+                clip,
+                language=language,
+                beam_size=second_pass['beam_size'],
+                condition_on_previous_text=False
+            )
+            retry_segments = list(retry_segments)
+            if not retry_segments:
+                continue
+
+            text = " ".join(s.text.strip() for s in retry_segments).strip()
+            confidence = min(self.segment_confidence(s) for s in retry_segments)
+
+            # Keep the first pass text if the larger model did not do better
+            if text and confidence > segment['confidence']:
+                segment['text'] = text
+                segment['confidence'] = confidence
+                segment['second_pass'] = True
+
+        return second_pass
+
     def _save_temp_file(self, audio_file: BinaryIO) -> str:
         # Create temp file with original extension
         suffix = os.path.splitext(audio_file.name)[1] if hasattr(audio_file, 'name') else '.wav'
@@ -113,48 +252,50 @@ class TranscriptionService:
 
 
 class InterviewScorerService:
+
+    MODEL = "llama-3.1-8b-instant"
+    # Transcripts up to this size are scored in a single call
+    SINGLE_CALL_MAX_CHARS = 8000
+    # Chunking for long transcripts (map step)
+    CHUNK_SECONDS = 300
+    CHUNK_MAX_CHARS = 6000
+    # Bump when the evidence prompt changes so cached chunks are not reused
+    EVIDENCE_PROMPT_VERSION = 1
    
     def __init__(self):
         # Initialize the new Gemini client
         self.client = Groq(api_key=settings.GROQ_API_KEY)
+        self.max_workers = getattr(settings, 'INTERVIEW_SCORER_MAX_WORKERS', 4)
+        
+        from infrastructure.redis_client import redis_client
+        self.redis = redis_client
+        self.evidence_ttl = 30 * 24 * 60 * 60  # 30 days
     
     def analyze_interview(
         self,
         transcription: str,
         job_requirements: Dict,
-        settings: Dict) -> Dict:
+        settings: Dict,
+        segments: Optional[List[Dict]] = None) -> Dict:
         try:
-            # Build prompt for Gemini
-            prompt = self._build_analysis_prompt(
-                transcription,
-                job_requirements,
-                settings
-            )
+            if len(transcription) > self.SINGLE_CALL_MAX_CHARS:
+                # Long interview: extract evidence per chunk (map), then
+                # score from the combined evidence (reduce)
+                chunks = self._split_transcript(transcription, segments)
+                logger.info(f" Chunked scoring: {len(chunks)} chunks, {len(transcription)} characters")
+                
+                evidence = self._extract_evidence(chunks, job_requirements)
+                prompt = self._build_reduce_prompt(evidence, job_requirements, settings)
+            else:
+                # Build prompt for Gemini
+                prompt = self._build_analysis_prompt(
+                    transcription,
+                    job_requirements,
+                    settings
+                )
             
             # Get AI analysis using new API
-            response = self.client.chat.completions.create(
-                model="llama-3.1-8b-instant",
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.7,
-                max_tokens=2000,
-            )
-            
-            # Get response text
-            analysis_text = response.choices[0].message.content.strip()
-            
-            # Parse JSON response
-            # Remove markdown code blocks if present
-            if '```json' in analysis_text:
-                analysis_text = analysis_text.split('```json')[1].split('```')[0]
-            elif '```' in analysis_text:
-                analysis_text = analysis_text.split('```')[1].split('```')[0]
-            
-            analysis = json.loads(analysis_text.strip())
+            analysis = self._complete_json(prompt, temperature=0.7, max_tokens=2000)
             
             # Calculate weighted overall score
             scores = analysis['scores']
@@ -197,14 +338,204 @@ class InterviewScorerService:
                 'error': str(e)
             }
     
+    def _complete_json(self, prompt: str, temperature: float, max_tokens: int) -> Dict:
+        response = self.client.chat.completions.create(
+            model=self.MODEL,
+            messages=[
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        
+        # Get response text
+        analysis_text = response.choices[0].message.content.strip()
+        
+        # Parse JSON response
+        # Remove markdown code blocks if present
+        if '```json' in analysis_text:
+            analysis_text = analysis_text.split('```json')[1].split('```')[0]
+        elif '```' in analysis_text:
+            analysis_text = analysis_text.split('```')[1].split('```')[0]
+        
+        return json.loads(analysis_text.strip())
+    
+    def _split_transcript(self, transcription: str, segments: Optional[List[Dict]] = None) -> List[str]:
+        """
+        Split by time using Whisper segments when available (segment
+        boundaries are natural pauses), otherwise by sentence boundaries.
+        """
+        chunks = []
+        
+        if segments:
+            current, current_len, window_start = [], 0, None
+            for segment in segments:
+                text = (segment.get('text') or '').strip()
+                if not text:
+                    continue
+                if window_start is None:
+                    window_start = segment.get('start', 0)
+                
+                too_long = segment.get('end', 0) - window_start > self.CHUNK_SECONDS
+                too_big = current_len + len(text) > self.CHUNK_MAX_CHARS
+                if current and (too_long or too_big):
+                    chunks.append(" ".join(current))
+                    current, current_len, window_start = [], 0, segment.get('start', 0)
+                
+                speaker = segment.get('speaker')
+                current.append(f"{speaker}: {text}" if speaker else text)
+                current_len += len(text) + 1
+            
+            if current:
+                chunks.append(" ".join(current))
+            return chunks
+        
+        current = ""
+        for sentence in re.split(r'(?<=[.!?])\s+', transcription):
+            if current and len(current) + len(sentence) + 1 > self.CHUNK_MAX_CHARS:
+                chunks.append(current)
+                current = ""
+            current = f"{current} {sentence}".strip()
+        if current:
+            chunks.append(current)
+        return chunks
+    
+    def _evidence_cache_key(self, chunk: str, job_requirements: Dict) -> str:
+        # Weights are not part of the key - they only affect the reduce step
+        digest = hashlib.sha256(
+            json.dumps({
+                'v': self.EVIDENCE_PROMPT_VERSION,
+                'model': self.MODEL,
+                'chunk': chunk,
+                'job': job_requirements
+            }, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        return f"interview_evidence:{digest}"
+    
+    def _extract_evidence(self, chunks: List[str], job_requirements: Dict) -> List[Dict]:
+        """Map step - one call per uncached chunk, run concurrently"""
+        results = [None] * len(chunks)
+        pending = []
+        
+        for index, chunk in enumerate(chunks):
+            key = self._evidence_cache_key(chunk, job_requirements)
+            try:
+                cached = self.redis.get(key)
+            except Exception as e:
+                logger.warning(f" Evidence cache unavailable: {str(e)}")
+                cached = None
+            
+            if cached:
+                results[index] = json.loads(cached)
+            else:
+                pending.append((index, chunk, key))
+        
+        logger.info(f" Evidence: {len(chunks) - len(pending)} cached, {len(pending)} to extract")
+        
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(pending))) as executor:
+                futures = {
+                    executor.submit(
+                        self._complete_json,
+                        self._build_evidence_prompt(chunk, job_requirements, index + 1, len(chunks)),
+                        0.2,
+                        800
+                    ): (index, key)
+                    for index, chunk, key in pending
+                }
+                for future in as_completed(futures):
+                    index, key = futures[future]
+                    evidence = future.result()
+                    results[index] = evidence
+                    try:
+                        self.redis.setex(key, self.evidence_ttl, json.dumps(evidence))
+                    except Exception as e:
+                        logger.warning(f" Evidence cache write failed: {str(e)}")
+        
+        return results
+    
+    def _build_evidence_prompt(self, chunk: str, job_requirements: Dict, part: int, total: int) -> str:
+        """Prompt for extracting evidence from one transcript chunk"""
+        
+        return f"""
+You are an expert technical interviewer reviewing part {part} of {total} of a telephonic interview transcript.
+
+JOB DETAILS:
+- Position: {job_requirements.get('job_title', 'Not specified')}
+- Required Skills: {', '.join(job_requirements.get('required_skills', []))}
+- Experience Required: {job_requirements.get('minimum_experience', 'Not specified')} years
+
+TRANSCRIPT PART {part}/{total}:
+{chunk}
+
+TASK:
+Do not score. Extract short, factual observations about the candidate from this part only, in JSON format:
+
+{{
+  "communication": ["<observation>"],
+  "technical_knowledge": ["<observation>"],
+  "problem_solving": ["<observation>"],
+  "enthusiasm": ["<observation>"],
+  "clarity": ["<observation>"],
+  "professionalism": ["<observation>"],
+  "topics_discussed": ["<topic>"],
+  "questions_asked": <number of questions the candidate asked in this part>
+}}
+
+Use empty lists when there is no evidence. Only return valid JSON, no markdown formatting.
+"""
+    
+    def _build_reduce_prompt(self, evidence: List[Dict], job_requirements: Dict, settings: Dict) -> str:
+        """Final scoring prompt built from the per-chunk evidence"""
+        dimensions = [
+            'communication', 'technical_knowledge', 'problem_solving',
+            'enthusiasm', 'clarity', 'professionalism'
+        ]
+        lines = []
+        topics = []
+        questions_asked = 0
+        
+        for part, chunk_evidence in enumerate(evidence, start=1):
+            lines.append(f"Part {part}:")
+            for dimension in dimensions:
+                for observation in chunk_evidence.get(dimension, []) or []:
+                    lines.append(f"  - [{dimension}] {observation}")
+            topics.extend(chunk_evidence.get('topics_discussed', []) or [])
+            try:
+                questions_asked += int(chunk_evidence.get('questions_asked', 0) or 0)
+            except (TypeError, ValueError):
+                pass
+        
+        evidence_text = "\n".join(lines)
+        # Deduplicate topics keeping order
+        topics = list(dict.fromkeys(topics))
+        
+        return self._build_analysis_prompt(
+            evidence_text,
+            job_requirements,
+            settings,
+            transcript_section=(
+                f"EVIDENCE EXTRACTED FROM THE FULL INTERVIEW (in order):\n{evidence_text}\n\n"
+                f"TOPICS DISCUSSED: {', '.join(topics) or 'Not identified'}\n"
+                f"QUESTIONS ASKED BY CANDIDATE: {questions_asked}"
+            )
+        )
+    
     def _build_analysis_prompt(
         self,
         transcription: str,
         job_requirements: Dict,
-        settings: Dict
+        settings: Dict,
+        transcript_section: Optional[str] = None
     ) -> str:
         """Build prompt for AI analysis"""
         
+        if transcript_section is None:
+            transcript_section = f"INTERVIEW TRANSCRIPT:\n{transcription[:self.SINGLE_CALL_MAX_CHARS]}"
+        
         prompt = f"""
 You are an expert technical interviewer analyzing a telephonic interview transcript.
 
@@ -214,8 +545,7 @@ JOB DETAILS:
 - Experience Required: {job_requirements.get('minimum_experience', 'Not specified')} years
 - Key Responsibilities: {job_requirements.get('responsibilities', 'Not specified')}
 
-INTERVIEW TRANSCRIPT:
-{transcription[:8000]}
+{transcript_section}
 
 SCORING CRITERIA:
 Analyze the candidate's performance on these dimensions (0-100 scale):
@@ -316,6 +646,15 @@ class AudioProcessorService:
                 'error': str(e)
             }
     
+    @staticmethod
+    def compute_sha256(file_path: str) -> str:
+        """Content hash used to reuse transcripts of identical recordings"""
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+    
     @staticmethod
     def get_audio_duration(file_path: str) -> float:
         try:
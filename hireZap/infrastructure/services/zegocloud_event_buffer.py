@@ -0,0 +1,126 @@
+from typing import Dict, List, Tuple
+from redis.exceptions import ResponseError
+import json
+import logging
+logger = logging.getLogger(__name__)
+
+
+class ZegoCloudEventBuffer:
+    """
+    Write-behind buffer for ZegoCloud webhook events on a Redis stream.
+    The webhook only appends; consumers read through a consumer group,
+    process a batch and acknowledge the entries it handled. Entries left
+    unacknowledged (failed, or held by a crashed consumer) are claimed
+    again after CLAIM_IDLE_MS; after MAX_DELIVERIES they move to the
+    dead-letter stream.
+    """
+
+    STREAM_KEY = 'zegocloud:webhook_events'
+    DEAD_LETTER_KEY = 'zegocloud:webhook_events:dead'
+    GROUP = 'zegocloud-consumers'
+    MAX_LEN = 100000
+    CLAIM_IDLE_MS = 60000
+    MAX_DELIVERIES = 5
+
+    def __init__(self):
+        from infrastructure.redis_client import redis_client
+        self.redis = redis_client
+        self._group_ready = False
+
+    def append(self, event: Dict) -> str:
+        return self.redis.xadd(
+            self.STREAM_KEY,
+            {'payload': json.dumps(event)},
+            maxlen=self.MAX_LEN,
+            approximate=True
+        )
+
+    def ensure_group(self):
+        if self._group_ready:
+            return
+        try:
+            self.redis.xgroup_create(self.STREAM_KEY, self.GROUP, id='0', mkstream=True)
+        except ResponseError as e:
+            if 'BUSYGROUP' not in str(e):
+                raise
+        self._group_ready = True
+
+    def read(self, consumer: str, count: int = 200, block_ms: int = None) -> List[Tuple[str, Dict]]:
+        """Next batch for this consumer, stale entries of other consumers first"""
+        self.ensure_group()
+
+        claimed = self.redis.xautoclaim(
+            self.STREAM_KEY,
+            self.GROUP,
+            consumer,
+            min_idle_time=self.CLAIM_IDLE_MS,
+            start_id='0-0',
+            count=count
+        )
+        entries = claimed[1] if claimed else []
+
+        if not entries:
+            response = self.redis.xreadgroup(
+                self.GROUP,
+                consumer,
+                {self.STREAM_KEY: '>'},
+                count=count,
+                block=block_ms
+            )
+            entries = response[0][1] if response else []
+
+        events = []
+        for entry_id, fields in entries:
+            # Trimmed entries come back without fields
+            if not fields:
+                self.ack([entry_id])
+                continue
+            try:
+                events.append((entry_id, json.loads(fields['payload'])))
+            except (KeyError, ValueError):
+                logger.error(f" Dropping malformed ZegoCloud event {entry_id}")
+                self.ack([entry_id])
+        return events
+
+    def ack(self, entry_ids: List[str]):
+        if not entry_ids:
+            return
+        pipe = self.redis.pipeline()
+        pipe.xack(self.STREAM_KEY, self.GROUP, *entry_ids)
+        pipe.xdel(self.STREAM_KEY, *entry_ids)
+        pipe.execute()
+
+    def retry_later(self, failures: List[Tuple[str, Dict, str]]) -> int:
+        """
+        Leave failed (entry_id, event, error) entries pending for redelivery;
+        those delivered MAX_DELIVERIES times go to the dead-letter stream.
+        Returns how many were dead-lettered.
+        """
+        if not failures:
+            return 0
+
+        pipe = self.redis.pipeline()
+        for entry_id, _, _ in failures:
+            pipe.xpending_range(self.STREAM_KEY, self.GROUP, min=entry_id, max=entry_id, count=1)
+        pending = pipe.execute()
+
+        exhausted = [
+            (entry_id, event, error)
+            for (entry_id, event, error), info in zip(failures, pending)
+            if info and info[0]['times_delivered'] >= self.MAX_DELIVERIES
+        ]
+        if not exhausted:
+            return 0
+
+        pipe = self.redis.pipeline()
+        for entry_id, event, error in exhausted:
+            pipe.xadd(
+                self.DEAD_LETTER_KEY,
+                {'payload': json.dumps(event), 'error': error, 'entry_id': entry_id},
+                maxlen=self.MAX_LEN,
+                approximate=True
+            )
+        pipe.execute()
+        self.ack([entry_id for entry_id, _, _ in exhausted])
+        logger.error(f" Dead-lettered {len(exhausted)} ZegoCloud events after {self.MAX_DELIVERIES} deliveries")
+        return len(exhausted)
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.5 on 2026-10-19 01:15
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('companies', '0002_remove_company_companies_c_verific_2cd7c4_idx_and_more'),
+        ('job', '0007_jobmodel_min_experience'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobmodel',
+            name='search_vector',
+            field=models.GeneratedField(db_persist=True, expression=django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.SearchVector('job_title', config='english', weight='A'), '||', django.contrib.postgres.search.SearchVector('skills_required', config='english', weight='B'), django.contrib.postgres.search.SearchConfig('english')), '||', django.contrib.postgres.search.SearchVector('role_summary', config='english', weight='C'), django.contrib.postgres.search.SearchConfig('english')), '||', django.contrib.postgres.search.SearchVector('requirements', config='english', weight='D'), django.contrib.postgres.search.SearchConfig('english')), output_field=django.contrib.postgres.search.SearchVectorField()),
+        ),
+        migrations.AddIndex(
+            model_name='jobmodel',
+            index=django.contrib.postgres.indexes.GinIndex(condition=models.Q(('status', 'active')), fields=['search_vector'], name='job_search_vector_gin'),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.5 on 2026-10-19 01:18
+
+from django.db import migrations, models
+from django.db.models import Count, Exists, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_stage_counters(apps, schema_editor):
+    JobModel = apps.get_model('job', 'JobModel')
+    SelectionProcessModel = apps.get_model('selection_process', 'SelectionProcessModel')
+    active_stages = SelectionProcessModel.objects.filter(job=OuterRef('pk'), is_active=True)
+    JobModel.objects.update(
+        configured_stages_count=Coalesce(
+            Subquery(active_stages.order_by().values('job').annotate(total=Count('id')).values('total')),
+            Value(0)
+        ),
+        has_configured_stages=Exists(active_stages)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job', '0008_jobmodel_search_vector'),
+        ('selection_process', '0004_alter_selectionprocessmodel_job_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobmodel',
+            name='configured_stages_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='jobmodel',
+            name='has_configured_stages',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.RunPython(backfill_stage_counters, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,7 @@
 from django.db import models
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 
 User = get_user_model()
 
@@ -58,6 +60,10 @@ class JobModel(models.Model):
         default='not_started'
     )
 
+    # Active selection stages, maintained by selection_process.signals
+    configured_stages_count = models.PositiveIntegerField(default=0)
+    has_configured_stages = models.BooleanField(default=False)
+
     total_applications_count = models.IntegerField(default=0)
     screened_applications_count = models.IntegerField(default=0)
 
@@ -67,6 +73,19 @@ class JobModel(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Maintained by Postgres on every write; title ranks above skills, then
+    # summary, then requirements
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector('job_title', weight='A', config='english') +
+            SearchVector('skills_required', weight='B', config='english') +
+            SearchVector('role_summary', weight='C', config='english') +
+            SearchVector('requirements', weight='D', config='english')
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
     class Meta:
         db_table = 'jobs'
         ordering = ['-created_at']
@@ -75,6 +94,8 @@ class JobModel(models.Model):
             models.Index(fields=['company', 'status']),
             models.Index(fields=['status', 'posting_date']),
             models.Index(fields=['location','status']),
+            # Only active jobs are searchable
+            GinIndex(fields=['search_vector'], name='job_search_vector_gin', condition=models.Q(status='active')),
         ]
 
     def __str__(self):
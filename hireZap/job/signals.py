@@ -0,0 +1,24 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import JobModel
+from infrastructure.repositories.job_repository import JobRepository
+
+# Saves touching only other fields (e.g. screening progress) keep the feed cached
+FEED_FIELDS = {
+    'job_title', 'location', 'work_type', 'employment_type', 'compensation_range',
+    'posting_date', 'cover_image', 'skills_required', 'application_deadline',
+    'status', 'company',
+}
+
+
+@receiver(post_save, sender=JobModel)
+def invalidate_feed_on_job_save(sender, instance, created, update_fields=None, **kwargs):
+    """ New jobs, edits and status changes alter the active job feed """
+    if not created and update_fields is not None and not FEED_FIELDS.intersection(update_fields):
+        return
+    JobRepository().invalidate_job_feed()
+
+
+@receiver(post_delete, sender=JobModel)
+def invalidate_feed_on_job_delete(sender, instance, **kwargs):
+    JobRepository().invalidate_job_feed()
@@ -2,6 +2,8 @@ from django.urls import path
 from job.views import (
     CreateJobView,
     FetchActiveJobs,
+    FetchActiveJobFeed,
+    SearchJobs,
     GetJobsByRecruiter,
     GetAllJobs,
     GetInactiveJobs,
@@ -11,6 +13,8 @@ from job.views import (
 urlpatterns = [
     path('create-job/',CreateJobView.as_view(),name='create-job'),
     path('fetch/active-jobs/',FetchActiveJobs.as_view(),name='fetch-active-jobs'),
+    path('fetch/active-jobs/feed/',FetchActiveJobFeed.as_view(),name='fetch-active-job-feed'),
+    path('search/',SearchJobs.as_view(),name='search-jobs'),
     path('created-jobs/',GetJobsByRecruiter.as_view(),name='recruiter-created-jobs'),
     path('fetch/all-jobs/',GetAllJobs.as_view(),name='fetch-all-jobs'),
     path('fetch/inactive-jobs/',GetInactiveJobs.as_view(),name='fetch-inactive-jobs'),
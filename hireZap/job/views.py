@@ -6,12 +6,15 @@ from job.serializers import CreateJobSerializer
 
 from core.use_cases.job.create_job import CreateJobUseCase
 from core.use_cases.job.fetch_active_jobs import FetchActiveJobsUsecase
+from core.use_cases.job.fetch_active_job_feed import FetchActiveJobFeedUsecase
+from core.use_cases.job.search_jobs import SearchJobsUsecase
 from core.use_cases.job.get_jobs_by_recruiter import GetJobsByRecruiterUsecase
 from core.use_cases.job.get_all_jobs import GetAllJobsUsecase
 from core.use_cases.job.get_all_inactive_jobs import GetInactiveJobsUsecase
 from core.use_cases.job.get_all_paused_jobs import GetPausedJobsUsecase
 from core.use_cases.job.get_job_by_id import GetJobBYIdUsecase
 from infrastructure.repositories.job_repository import JobRepository
+from infrastructure.repositories.job_search_repository import JobSearchRepository
 
 import logging
 logger = logging.getLogger(__name__)
@@ -19,6 +22,8 @@ logger = logging.getLogger(__name__)
 job_repo = JobRepository()
 create_job_useCase = CreateJobUseCase(job_repo)
 fetch_active_jobs_usecase = FetchActiveJobsUsecase(job_repo)
+fetch_active_job_feed_usecase = FetchActiveJobFeedUsecase(job_repo)
+search_jobs_usecase = SearchJobsUsecase(JobSearchRepository())
 get_recrutir_jobs_usecase = GetJobsByRecruiterUsecase(job_repo)
 get_all_jobs_usecase = GetAllJobsUsecase(job_repo)
 get_inactive_jobs_usecase = GetInactiveJobsUsecase(job_repo)
@@ -119,8 +124,87 @@ class FetchActiveJobs(APIView):
                 {'error': 'Internal server error'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
-        
-        
+
+
+class FetchActiveJobFeed(APIView):
+    """ Candidate job board: ?location=&work_type=&employment_type=&cursor=&limit= """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        try:
+            try:
+                limit = int(request.query_params.get('limit', 20))
+            except ValueError:
+                return Response(
+                    {'error': 'limit must be a number'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            filters = {
+                key: request.query_params.get(key)
+                for key in ('location', 'work_type', 'employment_type')
+            }
+            res = fetch_active_job_feed_usecase.execute(
+                filters,
+                cursor=request.query_params.get('cursor'),
+                limit=limit
+            )
+            if not res['success']:
+                return Response(
+                    {'error': res['error']},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            return Response(
+                {
+                    'jobs': res['jobs'],
+                    'next_cursor': res['next_cursor'],
+                    'has_more': res['has_more']
+                },
+                status=status.HTTP_200_OK
+            )
+        except Exception as e:
+            logger.error(f" Error fetching job feed: {str(e)}")
+            return Response(
+                {'error': 'Internal server error'},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class SearchJobs(APIView):
+    """ Ranked job search: ?q=python&location=&work_type=&employment_type=&limit=&offset= """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        try:
+            params = request.query_params
+            res = search_jobs_usecase.execute(
+                query=params.get('q'),
+                location=params.get('location'),
+                work_type=params.get('work_type'),
+                employment_type=params.get('employment_type'),
+                limit=int(params.get('limit', 20)),
+                offset=int(params.get('offset', 0))
+            )
+            if not res['success']:
+                return Response(
+                    {'error': res['error']},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            return Response(res, status=status.HTTP_200_OK)
+        except ValueError:
+            return Response(
+                {'error': 'limit and offset must be integers'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        except Exception as e:
+            logger.error(f" Error searching jobs: {str(e)}")
+            return Response(
+                {'error': 'Internal server error'},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
 class GetAllJobs(APIView):
     permission_classes = [IsAuthenticated]
 
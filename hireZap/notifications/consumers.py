@@ -1,10 +1,42 @@
 import json
+import asyncio
+from urllib.parse import parse_qs
 from channels.generic.websocket import AsyncWebsocketConsumer
 from channels.db import database_sync_to_async
+from infrastructure.services.notification_stream import NotificationStream
+from infrastructure.services.notification_metrics import NotificationMetrics
+from notifications.frames import FRAME_SPECS, build_frame, encode_frame
+from accounts.websocket_auth import scope_user_id
 
 class NotificationConsumer(AsyncWebsocketConsumer):
+    """
+    Per-user notifications of the authenticated (access cookie) user.
+    Events are turned into frames through the FRAME_SPECS registry.
+    Stored notifications carry their stream id; connecting with
+    ?last_id=<stream id> replays whatever was missed.
+    """
+
+    # Coalesced types (progress) send only their latest event per window
+    COALESCE_WINDOW = 0.25
+
     async def connect(self):
-        self.user_id = self.scope['url_route']['kwargs']['user_id']
+        self.room_group_name = None
+        self.stream_cursor = None  # newest stream id sent on this socket
+        self._coalesced = {}
+        self._coalesce_task = None
+        # Held while pending progress and the frame after it are sent, so
+        # the delayed flush can't interleave with a completion frame
+        self._send_lock = asyncio.Lock()
+
+        # The socket belongs to the token's user; a user id in the URL
+        # (older clients) has to match it
+        self.user_id = scope_user_id(self.scope, self.scope['url_route']['kwargs'].get('user_id'))
+        if self.user_id is None:
+            # Close codes only reach the client on an accepted socket;
+            # closing during the handshake is a bare 403
+            await self.accept()
+            await self.close(code=4401)
+            return
         self.room_group_name = f'user_{self.user_id}'
 
         # Join room group
@@ -16,7 +48,17 @@ class NotificationConsumer(AsyncWebsocketConsumer):
         await self.accept()
         print(f" WebSocket connected: User {self.user_id}")
 
+        # Live messages queue up until connect returns, so nothing slips
+        # between joining the group and the replay
+        query = parse_qs(self.scope.get('query_string', b'').decode())
+        await self.replay(query.get('last_id', [None])[0])
+
     async def disconnect(self, close_code):
+        if self._coalesce_task:
+            self._coalesce_task.cancel()
+        if self.room_group_name is None:
+            return
+
         # Leave room group
         await self.channel_layer.group_discard(
             self.room_group_name,
@@ -30,282 +72,108 @@ class NotificationConsumer(AsyncWebsocketConsumer):
         message_type = data.get('type')
         
         if message_type == 'ping':
-            await self.send(text_data=json.dumps({
-                'type': 'pong'
-            }))
-    # =========================================================================
-    # COMPANY NOTIFICATIONS
-    # =========================================================================
-    # Custom event handlers
-    async def company_verified(self, event):
-        """Send company verification notification"""
-        await self.send(text_data=json.dumps({
-            'type': 'company_verified',
-            'company': event['company'],
-            'message': 'Your company has been verified!'
-        }))
+            await self.send_frame({'type': 'pong'})
+        elif message_type == 'replay':
+            await self.replay(data.get('last_id'))
 
-    async def company_rejected(self, event):
-        """Send company rejection notification"""
-        await self.send(text_data=json.dumps({
-            'type': 'company_rejected',
-            'company': event['company'],
-            'reason': event['reason'],
-            'message': 'Your company verification was rejected'
-        }))
-    # =========================================================================
-    # JOB APPLICATION NOTIFICATIONS
-    # =========================================================================
-    async def job_application(self, event):
-        """Send new job application notification"""
-        await self.send(text_data=json.dumps({
-            'type': 'job_application',
-            'application': event['application'],
-            'message': f"New application for {event['job_title']}"
-        }))
-    # =========================================================================
-    # RESUME SCREENING NOTIFICATIONS
-    # =========================================================================
-    async def screening_progress(self, event):
-        """Send screening progress update"""
-        await self.send(text_data=json.dumps({
-            'type': 'screening_progress',
-            'job_id': event['job_id'],
-            'progress': event['progress']
-        }))
+    async def replay(self, last_id):
+        """Send the notifications stored after last_id (the latest ones without it)"""
+        try:
+            events = await self.get_notification_history(last_id)
+        except ValueError:
+            events = await self.get_notification_history(None)
 
-    async def resume_screening_completed(self, event):
-        """Send screening completion notification"""
-        await self.send(text_data=json.dumps({
-            'type': 'resume_screening_completed',
-            'application_id': event['application_id'],
-            'job_title': event['job_title'],
-            'decision': event['decision'],
-            'score': event['score']
-        }))
+        for stream_id, event in events:
+            try:
+                await self.send_notification({**event, 'stream_id': stream_id} if stream_id else event)
+            except KeyError:
+                # Outdated shape of this notification type
+                continue
 
-    async def screening_progress_update(self, event):
-        """Send progress update to recruiter"""
-        await self.send(text_data=json.dumps({
-            'type': 'screening_progress_update',
-            'job_id': event['job_id'],
-            'screened_count': event['screened_count'],
-            'total_count': event['total_count']
-        }))
+        await self.flush_coalesced()
+        await self.send_frame({
+            'type': 'replay_complete',
+            'last_id': self.stream_cursor
+        })
 
-    async def bulk_screening_started(self, event):
-        """Notify bulk screening started"""
-        await self.send(text_data=json.dumps({
-            'type': 'bulk_screening_started',
-            'job_id': event['job_id'],
-            'job_title': event['job_title'],
-            'total_applications': event['total_applications']
-        }))
+    async def dispatch(self, message):
+        # websocket.* messages go to the regular handlers, every channel
+        # layer event is a notification
+        if '.' in message['type']:
+            await super().dispatch(message)
+        else:
+            await self.send_notification(message)
 
-    async def bulk_screening_completed(self, event):
-        """Notify bulk screening completed"""
-        await self.send(text_data=json.dumps({
-            'type': 'bulk_screening_completed',
-            'job_id': event['job_id'],
-            'job_title': event['job_title'],
-            'total_screened': event['total_screened']
-        }))
-    # =========================================================================
-    # TELEPHONIC INTERVIEW NOTIFICATIONS
-    # =========================================================================
-    
-    async def interview_scheduled(self, event):
-        """Interview scheduled notification (telephonic or HR)"""
-        await self.send(text_data=json.dumps({
-            'type': 'interview_scheduled',
-            'message': 'Interview has been scheduled',
-            'data': event.get('data', {})
-        }))
-    
-    async def interview_rescheduled(self, event):
-        """Interview rescheduled notification"""
-        await self.send(text_data=json.dumps({
-            'type': 'interview_rescheduled',
-            'message': 'Interview has been rescheduled',
-            'data': event.get('data', {})
-        }))
-    
-    async def interview_cancelled(self, event):
-        """Interview cancelled notification"""
-        await self.send(text_data=json.dumps({
-            'type': 'interview_cancelled',
-            'message': 'Interview has been cancelled',
-            'data': event.get('data', {})
-        }))
-    
-    async def interview_started(self, event):
-        """Interview started notification"""
-        await self.send(text_data=json.dumps({
-            'type': 'interview_started',
-            'message': 'Interview has started',
-            'data': event.get('data', {})
-        }))
-    
-    async def interview_completed(self, event):
-        """Interview completed notification"""
-        await self.send(text_data=json.dumps({
-            'type': 'interview_completed',
-            'message': 'Interview has been completed',
-            'data': event.get('data', {})
-        }))
+    async def send_notification(self, event):
+        stream_id = event.get('stream_id')
+        if stream_id:
+            # Already sent on this socket (replayed and then delivered live)
+            if self.stream_cursor and (
+                NotificationStream.stream_id_key(stream_id) <= NotificationStream.stream_id_key(self.stream_cursor)
+            ):
+                return
+            self.stream_cursor = stream_id
 
-    async def interview_reminder(self, event):
-        """Interview reminder notification (24h before)"""
-        await self.send(text_data=json.dumps({
-            'type': 'interview_reminder',
-            'message': 'Interview reminder',
-            'data': event.get('data', {})
-        }))
-    
-    async def interview_result(self, event):
-        """Interview result notification"""
-        await self.send(text_data=json.dumps({
-            'type': 'interview_result',
-            'message': 'Interview result is ready',
-            'data': event.get('data', {})
-        }))
+        spec = FRAME_SPECS.get(event['type'])
+        frame = build_frame(event, spec)
 
-    async def call_started(self, event):
-        """Call started notification (telephonic)"""
-        await self.send(text_data=json.dumps({
-            'type': 'call_started',
-            'message': event.get('message', 'Call has started'),
-            'data': event.get('data', {})
-        }))
-        
-    async def candidate_joined(self, event):
-        """Candidate joined notification"""
-        await self.send(text_data=json.dumps({
-            'type': 'candidate_joined',
-            'message': event.get('message', 'Candidate has joined'),
-            'data': event.get('data', {})
-        }))
+        if spec and spec.coalesce_by:
+            key = (event['type'], event.get(spec.coalesce_by))
+            if key in self._coalesced:
+                NotificationMetrics.record_coalesced(event['type'])
+            self._coalesced[key] = frame
+            if self._coalesce_task is None:
+                self._coalesce_task = asyncio.create_task(self._flush_coalesced_later())
+            return
 
-    async def call_ended(self, event):
-        """Call ended notification"""
-        await self.send(text_data=json.dumps({
-            'type': 'call_ended',
-            'message': event.get('message', 'Call has ended'),
-            'data': event.get('data', {})
-        }))
-    
-    async def interview_analyzed(self, event):
-        """Interview analysis completed notification"""
-        await self.send(text_data=json.dumps({
-            'type': 'interview_analyzed',
-            'message': 'Interview analysis completed',
-            'data': event.get('data', {})
-        }))
+        # Pending progress goes out first so frames stay in order
+        async with self._send_lock:
+            await self._send_coalesced()
+            await self.send_frame(frame)
 
-    # =========================================================================
-    # HR INTERVIEW NOTIFICATIONS
-    # =========================================================================
-    async def hr_interview(self, event):
-        """HR interview notification - generic handler"""
-        await self.send(text_data=json.dumps({
-            'type': event.get('notification_type', 'hr_interview'),
-            'message': event.get('message', 'HR Interview update'),
-            'data': event.get('data', {})
-        }))
-    
-    async def hr_interview_scheduled(self, event):
-        """HR interview scheduled notification"""
-        await self.send(text_data=json.dumps({
-            'type': 'hr_interview_scheduled',
-            'message': event.get('message', 'HR interview has been scheduled'),
-            'data': event.get('data', {})
-        }))
-    
-    async def hr_meeting_started(self, event):
-        """HR meeting started notification"""
-        await self.send(text_data=json.dumps({
-            'type': 'hr_meeting_started',
-            'message': event.get('message', 'HR interview has started'),
-            'data': event.get('data', {})
-        }))
-    
-    async def hr_interview_ready(self, event):
-        """HR interview ready to join notification"""
-        await self.send(text_data=json.dumps({
-            'type': 'hr_interview_ready',
-            'message': event.get('message', 'You can now join the HR interview'),
-            'data': event.get('data', {})
-        }))
+    async def _flush_coalesced_later(self):
+        await asyncio.sleep(self.COALESCE_WINDOW)
+        self._coalesce_task = None
+        await self.flush_coalesced()
 
-    async def interview_ended(self, event):
-        """HR interview ended notification"""
-        await self.send(text_data=json.dumps({
-            'type': 'interview_ended',
-            'message': event.get('message', 'Interview has ended'),
-            'data': event.get('data', {})
-        }))
-    
-    async def recording_uploaded(self, event):
-        """Recording uploaded notification"""
-        await self.send(text_data=json.dumps({
-            'type': 'recording_uploaded',
-            'message': event.get('message', 'Recording uploaded successfully'),
-            'data': event.get('data', {})
-        }))
-    
-    async def notes_finalized(self, event):
-        """Notes finalized notification"""
-        await self.send(text_data=json.dumps({
-            'type': 'notes_finalized',
-            'message': event.get('message', 'Interview notes finalized'),
-            'data': event.get('data', {})
-        }))
-    
-    async def interview_result_finalized(self, event):
-        """Interview result finalized notification"""
-        await self.send(text_data=json.dumps({
-            'type': 'interview_result_finalized',
-            'message': event.get('message', 'Interview result finalized'),
-            'data': event.get('data', {})
-        }))
-    
-    async def stage_progression(self, event):
-        """Stage progression notification"""
-        await self.send(text_data=json.dumps({
-            'type': 'stage_progression',
-            'message': event.get('message', 'You have progressed to the next stage'),
-            'data': event.get('data', {})
-        }))
-    # =========================================================================
-    # OFFER NOTIFICATIONS
-    # =========================================================================
+    async def flush_coalesced(self):
+        async with self._send_lock:
+            await self._send_coalesced()
+
+    async def _send_coalesced(self):
+        # Caller holds _send_lock; a pending delayed flush finds nothing left
+        frames, self._coalesced = list(self._coalesced.values()), {}
+        for frame in frames:
+            await self.send_frame(frame)
+
+    async def send_frame(self, frame):
+        text_data = encode_frame(frame)
+        await self.send(text_data=text_data)
+
+        NotificationMetrics.record_sent(frame['type'], len(text_data))
+        counters = NotificationMetrics.take_due()
+        if counters:
+            asyncio.create_task(self.write_metrics(counters))
+
+    @database_sync_to_async
+    def write_metrics(self, counters):
+        NotificationMetrics().write(counters)
+
+    @database_sync_to_async
+    def get_notification_history(self, last_id):
+        if last_id:
+            NotificationStream.stream_id_key(last_id)  # ValueError if malformed
+        return NotificationStream().replay(self.user_id, after_id=last_id)
 
-    async def offer_received(self, event):
-        await self.send(text_data=json.dumps({
-            'type'           : 'offer_received',
-            'message'        : event.get('message', 'You have received a job offer!'),
-            'application_id' : event.get('application_id'),
-            'job_title'      : event.get('job_title'),
-            'company_name'   : event.get('company_name'),
-            'position_title' : event.get('position_title'),
-            'offer_id'       : event.get('offer_id'),
-        }))
-    
-    async def offer_responded(self, event):
-        """Recruiter is notified when candidate accepts/declines"""
-        await self.send(text_data=json.dumps({
-            'type'           : 'offer_responded',
-            'message'        : event.get('message'),
-            'offer_id'       : event.get('offer_id'),
-            'application_id' : event.get('application_id'),
-            'candidate_name' : event.get('candidate_name'),
-            'position_title' : event.get('position_title'),
-            'action'         : event.get('action'),
-        }))
 
 class CompanyConsumer(AsyncWebsocketConsumer):
     async def connect(self):
-        self.recruiter_id = self.scope['url_route']['kwargs']['recruiter_id']
+        self.room_group_name = None
+        self.recruiter_id = scope_user_id(self.scope, self.scope['url_route']['kwargs']['recruiter_id'])
+        if self.recruiter_id is None:
+            await self.accept()
+            await self.close(code=4401)
+            return
         self.room_group_name = f'recruiter_{self.recruiter_id}'
 
         await self.channel_layer.group_add(
@@ -316,6 +184,8 @@ class CompanyConsumer(AsyncWebsocketConsumer):
         await self.accept()
 
     async def disconnect(self, close_code):
+        if self.room_group_name is None:
+            return
         await self.channel_layer.group_discard(
             self.room_group_name,
             self.channel_name
@@ -334,14 +204,22 @@ class CompanyConsumer(AsyncWebsocketConsumer):
 
 class HRInterviewMeetingConsumer(AsyncWebsocketConsumer):
 
+    # ICE candidates are forwarded in small batches instead of one message each
+    ICE_BATCH_SIZE = 10
+    ICE_BATCH_WINDOW = 0.05  # seconds
+
     async def connect(self):
         self.room_id = self.scope['url_route']['kwargs']['room_id']
         self.user_id = self.scope['url_route']['kwargs']['user_id']
         self.user_type = self.scope['url_route']['kwargs']['user_type']  # 'recruiter' or 'candidate'
         
         self.room_group_name = f'meeting_{self.room_id}'
+        self.peers = {}
+        self.ice_buffer = []
+        self.ice_buffer_target = None
+        self.ice_flush_task = None
         
-        # Join room group
+        # Room group is kept for room-wide events (recording, meeting ended)
         await self.channel_layer.group_add(
             self.room_group_name,
             self.channel_name
@@ -350,26 +228,44 @@ class HRInterviewMeetingConsumer(AsyncWebsocketConsumer):
         await self.accept()
         print(f" Meeting WebSocket connected: {self.user_type} {self.user_id} in room {self.room_id}")
         
-        # Notify others that user joined
-        await self.channel_layer.group_send(
-            self.room_group_name,
-            {
-                'type': 'user_joined',
-                'user_id': self.user_id,
-                'user_type': self.user_type
-            }
-        )
+        self.peers = await self.join_room()
+        
+        # Tell the peers already in the room, each on its own channel
+        for peer in self.peers.values():
+            await self.channel_layer.send(
+                peer['channel_name'],
+                {
+                    'type': 'user_joined',
+                    'user_id': self.user_id,
+                    'user_type': self.user_type,
+                    'channel_name': self.channel_name
+                }
+            )
+        
+        await self.send(text_data=json.dumps({
+            'type': 'room_peers',
+            'peers': [
+                {'user_id': peer_id, 'user_type': peer['user_type']}
+                for peer_id, peer in self.peers.items()
+            ]
+        }))
     
     async def disconnect(self, close_code):
+        await self.flush_ice_candidates()
+        
+        await self.leave_room()
+        
         # Notify others that user left
-        await self.channel_layer.group_send(
-            self.room_group_name,
-            {
-                'type': 'user_left',
-                'user_id': self.user_id,
-                'user_type': self.user_type
-            }
-        )
+        for peer in self.peers.values():
+            await self.channel_layer.send(
+                peer['channel_name'],
+                {
+                    'type': 'user_left',
+                    'user_id': self.user_id,
+                    'user_type': self.user_type,
+                    'channel_name': self.channel_name
+                }
+            )
         
         # Leave room group
         await self.channel_layer.group_discard(
@@ -387,43 +283,35 @@ class HRInterviewMeetingConsumer(AsyncWebsocketConsumer):
             
             # Handle different message types
             if message_type == 'ping':
-                await self.send(text_data=json.dumps({'type': 'pong'}))
+                # Health check - answered locally, only refreshes presence
+                await self.touch_room()
+                await self.send(text_data=json.dumps({
+                    'type': 'pong',
+                    'peers': len(self.peers)
+                }))
             
             elif message_type == 'webrtc_offer':
                 # Forward WebRTC offer to other participant
-                await self.channel_layer.group_send(
-                    self.room_group_name,
-                    {
-                        'type': 'webrtc_offer',
-                        'offer': data['offer'],
-                        'from_user': self.user_id,
-                        'from_type': self.user_type
-                    }
-                )
+                await self.send_to_peers(data.get('to_user'), {
+                    'type': 'webrtc_offer',
+                    'offer': data['offer'],
+                    'from_user': self.user_id,
+                    'from_type': self.user_type
+                })
             
             elif message_type == 'webrtc_answer':
                 # Forward WebRTC answer
-                await self.channel_layer.group_send(
-                    self.room_group_name,
-                    {
-                        'type': 'webrtc_answer',
-                        'answer': data['answer'],
-                        'from_user': self.user_id,
-                        'from_type': self.user_type
-                    }
-                )
+                await self.send_to_peers(data.get('to_user'), {
+                    'type': 'webrtc_answer',
+                    'answer': data['answer'],
+                    'from_user': self.user_id,
+                    'from_type': self.user_type
+                })
             
-            elif message_type == 'webrtc_ice_candidate':
-                # Forward ICE candidate
-                await self.channel_layer.group_send(
-                    self.room_group_name,
-                    {
-                        'type': 'webrtc_ice_candidate',
-                        'candidate': data['candidate'],
-                        'from_user': self.user_id,
-                        'from_type': self.user_type
-                    }
-                )
+            elif message_type in ('webrtc_ice_candidate', 'webrtc_ice_candidates'):
+                # Forward ICE candidates in batches
+                candidates = data.get('candidates') or [data['candidate']]
+                await self.queue_ice_candidates(data.get('to_user'), candidates)
             
             elif message_type == 'start_recording':
                 # Recording started
@@ -470,54 +358,104 @@ class HRInterviewMeetingConsumer(AsyncWebsocketConsumer):
                 'error': str(e)
             }))
     
+    # Peer addressing
+    
+    async def send_to_peers(self, to_user, message):
+        """Send to one peer (to_user) or, when not given, to every other peer"""
+        if to_user is not None:
+            peer = self.peers.get(str(to_user))
+            targets = [peer] if peer else []
+        else:
+            targets = list(self.peers.values())
+        
+        for peer in targets:
+            await self.channel_layer.send(peer['channel_name'], message)
+    
+    async def queue_ice_candidates(self, to_user, candidates):
+        # A different target flushes what is pending for the previous one
+        if self.ice_buffer and self.ice_buffer_target != to_user:
+            await self.flush_ice_candidates()
+        
+        self.ice_buffer_target = to_user
+        self.ice_buffer.extend(candidates)
+        
+        if len(self.ice_buffer) >= self.ICE_BATCH_SIZE:
+            await self.flush_ice_candidates()
+        elif self.ice_flush_task is None:
+            self.ice_flush_task = asyncio.ensure_future(self._flush_ice_later())
+    
+    async def _flush_ice_later(self):
+        await asyncio.sleep(self.ICE_BATCH_WINDOW)
+        self.ice_flush_task = None
+        await self.flush_ice_candidates()
+    
+    async def flush_ice_candidates(self):
+        if self.ice_flush_task is not None:
+            self.ice_flush_task.cancel()
+            self.ice_flush_task = None
+        
+        if not self.ice_buffer:
+            return
+        
+        candidates, self.ice_buffer = self.ice_buffer, []
+        await self.send_to_peers(self.ice_buffer_target, {
+            'type': 'webrtc_ice_candidates',
+            'candidates': candidates,
+            'from_user': self.user_id,
+            'from_type': self.user_type
+        })
+    
     # Event handlers
     
     async def user_joined(self, event):
         """Send user joined notification"""
-        # Don't send to self
-        if event['user_id'] != self.user_id:
-            await self.send(text_data=json.dumps({
-                'type': 'user_joined',
-                'user_id': event['user_id'],
-                'user_type': event['user_type']
-            }))
+        self.peers[event['user_id']] = {
+            'user_type': event['user_type'],
+            'channel_name': event['channel_name']
+        }
+        await self.send(text_data=json.dumps({
+            'type': 'user_joined',
+            'user_id': event['user_id'],
+            'user_type': event['user_type']
+        }))
     
     async def user_left(self, event):
         """Send user left notification"""
-        if event['user_id'] != self.user_id:
-            await self.send(text_data=json.dumps({
-                'type': 'user_left',
-                'user_id': event['user_id'],
-                'user_type': event['user_type']
-            }))
+        # Ignore a stale connection leaving after the peer already reconnected
+        peer = self.peers.get(event['user_id'])
+        if peer and peer['channel_name'] != event['channel_name']:
+            return
+        self.peers.pop(event['user_id'], None)
+        await self.send(text_data=json.dumps({
+            'type': 'user_left',
+            'user_id': event['user_id'],
+            'user_type': event['user_type']
+        }))
     
     async def webrtc_offer(self, event):
         """Forward WebRTC offer"""
-        # Don't send to sender
-        if event['from_user'] != self.user_id:
-            await self.send(text_data=json.dumps({
-                'type': 'webrtc_offer',
-                'offer': event['offer'],
-                'from_user': event['from_user'],
-                'from_type': event['from_type']
-            }))
+        await self.send(text_data=json.dumps({
+            'type': 'webrtc_offer',
+            'offer': event['offer'],
+            'from_user': event['from_user'],
+            'from_type': event['from_type']
+        }))
     
     async def webrtc_answer(self, event):
         """Forward WebRTC answer"""
-        if event['from_user'] != self.user_id:
-            await self.send(text_data=json.dumps({
-                'type': 'webrtc_answer',
-                'answer': event['answer'],
-                'from_user': event['from_user'],
-                'from_type': event['from_type']
-            }))
+        await self.send(text_data=json.dumps({
+            'type': 'webrtc_answer',
+            'answer': event['answer'],
+            'from_user': event['from_user'],
+            'from_type': event['from_type']
+        }))
     
-    async def webrtc_ice_candidate(self, event):
-        """Forward ICE candidate"""
-        if event['from_user'] != self.user_id:
+    async def webrtc_ice_candidates(self, event):
+        """Forward a batch of ICE candidates, one frame per candidate"""
+        for candidate in event['candidates']:
             await self.send(text_data=json.dumps({
                 'type': 'webrtc_ice_candidate',
-                'candidate': event['candidate'],
+                'candidate': candidate,
                 'from_user': event['from_user'],
                 'from_type': event['from_type']
             }))
@@ -556,6 +494,22 @@ class HRInterviewMeetingConsumer(AsyncWebsocketConsumer):
     
     # Database operations
     
+    @database_sync_to_async
+    def join_room(self):
+        """Register this peer in the room; returns the other peers"""
+        from infrastructure.services.meeting_presence_service import MeetingPresenceService
+        return MeetingPresenceService().join(self.room_id, self.user_id, self.user_type, self.channel_name)
+    
+    @database_sync_to_async
+    def leave_room(self):
+        from infrastructure.services.meeting_presence_service import MeetingPresenceService
+        MeetingPresenceService().leave(self.room_id, self.user_id, self.channel_name)
+    
+    @database_sync_to_async
+    def touch_room(self):
+        from infrastructure.services.meeting_presence_service import MeetingPresenceService
+        MeetingPresenceService().touch(self.room_id)
+    
     @database_sync_to_async
     def start_recording(self, session_id):
         """Start recording in database"""
@@ -0,0 +1,132 @@
+"""
+notifications/frames.py
+
+How each channels notification event becomes a WebSocket frame. The
+NotificationConsumer looks the event type up here instead of having one
+handler method per type.
+"""
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@dataclass(frozen=True)
+class FrameSpec:
+    # Event keys copied into the frame (None when missing)
+    fields: Tuple[str, ...] = ()
+    # Values for fields the event may leave out
+    defaults: Dict = field(default_factory=dict)
+    # Frame message, formatted with the event; an event 'message' wins
+    # unless the message is fixed
+    message: Optional[str] = None
+    fixed_message: bool = False
+    # Event key naming the frame type (defaults to the event type)
+    type_field: Optional[str] = None
+    # Within the coalescing window only the latest event per value of this
+    # key is sent
+    coalesce_by: Optional[str] = None
+
+
+def _data_frame(message: str, fixed: bool = False) -> FrameSpec:
+    return FrameSpec(fields=('data',), defaults={'data': {}}, message=message, fixed_message=fixed)
+
+
+FRAME_SPECS: Dict[str, FrameSpec] = {
+    # Company
+    'company_verified': FrameSpec(fields=('company',), message='Your company has been verified!', fixed_message=True),
+    'company_rejected': FrameSpec(fields=('company', 'reason'), message='Your company verification was rejected', fixed_message=True),
+
+    # Job applications
+    'job_application': FrameSpec(fields=('application',), message='New application for {job_title}', fixed_message=True),
+
+    # Resume screening
+    'screening_progress': FrameSpec(fields=('job_id', 'progress'), coalesce_by='job_id'),
+    'screening_progress_update': FrameSpec(fields=('job_id', 'screened_count', 'total_count'), coalesce_by='job_id'),
+    'resume_screening_completed': FrameSpec(fields=('application_id', 'job_title', 'decision', 'score')),
+    'bulk_screening_started': FrameSpec(fields=('job_id', 'job_title', 'total_applications')),
+    'bulk_screening_completed': FrameSpec(fields=('job_id', 'job_title', 'total_screened')),
+
+    # Telephonic interviews
+    'interview_scheduled': _data_frame('Interview has been scheduled', fixed=True),
+    'interview_rescheduled': _data_frame('Interview has been rescheduled', fixed=True),
+    'interview_cancelled': _data_frame('Interview has been cancelled', fixed=True),
+    'interview_started': _data_frame('Interview has started', fixed=True),
+    'interview_completed': _data_frame('Interview has been completed', fixed=True),
+    'interview_reminder': _data_frame('Interview reminder', fixed=True),
+    'interview_result': _data_frame('Interview result is ready', fixed=True),
+    'interview_analyzed': _data_frame('Interview analysis completed', fixed=True),
+    'interview_status_updated': FrameSpec(
+        fields=('interview_id', 'job_title', 'decision'),
+        message='Your interview status has been updated'
+    ),
+    'score_overridden': FrameSpec(
+        fields=('interview_id', 'candidate_name', 'original_score', 'new_score', 'original_decision', 'new_decision'),
+        message='Interview score has been manually overridden'
+    ),
+    'call_started': _data_frame('Call has started'),
+    'candidate_joined': _data_frame('Candidate has joined'),
+    'call_ended': _data_frame('Call has ended'),
+    'transcription_progress': FrameSpec(
+        fields=('interview_id', 'progress', 'status', 'segments'),
+        defaults={'status': 'processing', 'segments': []}
+    ),
+
+    # HR interviews
+    'hr_interview': FrameSpec(fields=('data',), defaults={'data': {}}, message='HR Interview update', type_field='notification_type'),
+    'hr_interview_scheduled': _data_frame('HR interview has been scheduled'),
+    'hr_interview_rescheduled': _data_frame('HR interview has been rescheduled'),
+    'hr_interview_cancelled': _data_frame('HR interview has been cancelled'),
+    'hr_meeting_started': _data_frame('HR interview has started'),
+    'hr_interview_ready': _data_frame('You can now join the HR interview'),
+    'interview_ended': _data_frame('Interview has ended'),
+    'candidate_left': FrameSpec(
+        fields=('interview_id', 'session_id', 'can_rejoin'),
+        message='Candidate has left the meeting'
+    ),
+    'recording_uploaded': _data_frame('Recording uploaded successfully'),
+    'notes_finalized': _data_frame('Interview notes finalized'),
+    'interview_result_finalized': _data_frame('Interview result finalized'),
+    'stage_progression': _data_frame('You have progressed to the next stage'),
+
+    # Offers
+    'offer_received': FrameSpec(
+        fields=('application_id', 'job_title', 'company_name', 'position_title', 'offer_id'),
+        message='You have received a job offer!'
+    ),
+    'offer_responded': FrameSpec(
+        fields=('message', 'offer_id', 'application_id', 'candidate_name', 'position_title', 'action')
+    ),
+}
+
+
+def build_frame(event: Dict, spec: Optional[FrameSpec]) -> Dict:
+    if spec is None:
+        # Unregistered type: forward the event as it is
+        return dict(event)
+
+    frame = {'type': event.get(spec.type_field, event['type']) if spec.type_field else event['type']}
+
+    if spec.message is not None:
+        if spec.fixed_message or 'message' not in event:
+            frame['message'] = spec.message.format(**event) if '{' in spec.message else spec.message
+        else:
+            frame['message'] = event['message']
+
+    for key in spec.fields:
+        frame[key] = event.get(key, spec.defaults.get(key))
+
+    if event.get('stream_id'):
+        frame['stream_id'] = event['stream_id']
+    return frame
+
+
+def encode_frame(frame: Dict) -> str:
+    """Serialize a frame; orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(frame, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(frame, separators=(',', ':'))
@@ -0,0 +1,31 @@
+"""
+notifications/management/commands/dispatch_outbox.py
+
+Long-running dispatcher for the notification outbox. Delivers committed
+WebSocket notifications and Celery tasks in batches; several can run at
+once since each batch is locked with SKIP LOCKED.
+
+Usage:
+    python manage.py dispatch_outbox
+    python manage.py dispatch_outbox --batch-size 500 --poll-interval 0.2
+"""
+from django.core.management.base import BaseCommand
+from notifications.tasks import drain_outbox
+
+
+class Command(BaseCommand):
+    help = 'Deliver outbox notifications and tasks in batches'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=200)
+        parser.add_argument('--poll-interval', type=float, default=0.5, help='Seconds to wait when nothing is due')
+
+    def handle(self, *args, **options):
+        self.stdout.write('Dispatching outbox')
+        try:
+            drain_outbox(
+                batch_size=options['batch_size'],
+                poll_interval=options['poll_interval']
+            )
+        except KeyboardInterrupt:
+            self.stdout.write('Stopped')
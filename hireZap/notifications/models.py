@@ -1,3 +1,56 @@
 from django.db import models
+from django.db.models import Q
+from django.utils import timezone
 
-# Create your models here.
+
+class OutboxMessage(models.Model):
+    """
+    Side effect (WebSocket notification or Celery task) recorded in the same
+    transaction as the state change it announces. The outbox dispatcher
+    delivers and deletes it; rows that keep failing end up as 'dead'.
+    """
+
+    KIND_WEBSOCKET = 'websocket'
+    KIND_TASK = 'task'
+
+    kind = models.CharField(
+        max_length=20,
+        choices=[
+            (KIND_WEBSOCKET, 'WebSocket notification'),
+            (KIND_TASK, 'Celery task'),
+        ]
+    )
+
+    # Channels group for notifications, registered task name for tasks
+    destination = models.CharField(max_length=255)
+
+    # Channels message, or {'args': [...], 'kwargs': {...}} for tasks
+    payload = models.JSONField(default=dict)
+
+    status = models.CharField(
+        max_length=20,
+        choices=[
+            ('pending', 'Pending'),
+            ('dead', 'Dead'),
+        ],
+        default='pending'
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    available_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True, null=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'notification_outbox'
+        ordering = ['id']
+        indexes = [
+            models.Index(
+                fields=['available_at', 'id'],
+                condition=Q(status='pending'),
+                name='outbox_pending_idx'
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} -> {self.destination} ({self.status})"
@@ -0,0 +1,49 @@
+from celery import shared_task
+from infrastructure.services.notification_service import NotificationService
+import time
+import logging
+logger = logging.getLogger(__name__)
+
+
+def drain_outbox(batch_size: int = 200, max_batches: int = None, poll_interval: float = None) -> dict:
+    """
+    Deliver due outbox messages batch by batch. With a poll interval it keeps
+    polling once the outbox is empty (dispatcher process); without one it
+    returns as soon as nothing is due.
+    """
+    notification_service = NotificationService()
+
+    batches = delivered = failed = dead = 0
+    while max_batches is None or batches < max_batches:
+        result = notification_service.dispatch_outbox(limit=batch_size)
+        if not (result['delivered'] or result['failed']):
+            if poll_interval is None:
+                break
+            time.sleep(poll_interval)
+            continue
+
+        batches += 1
+        delivered += result['delivered']
+        failed += result['failed']
+        dead += result['dead']
+
+    return {'success': True, 'batches': batches, 'delivered': delivered, 'failed': failed, 'dead': dead}
+
+
+@shared_task(name='notifications.dispatch_outbox')
+def dispatch_outbox_task():
+    """Safety net draining the outbox when no dispatcher process is running"""
+    try:
+        return drain_outbox(max_batches=50)
+    except Exception as e:
+        logger.error(f" Error dispatching outbox: {e}")
+        return {'success': False, 'error': str(e)}
+
+
+@shared_task(name='notifications.purge_dead_outbox')
+def purge_dead_outbox_task(older_than_days: int = 7):
+    """Drop dead outbox messages once they are old enough"""
+    from infrastructure.repositories.outbox_repository import OutboxRepository
+    deleted = OutboxRepository().purge_dead(older_than_days)
+    logger.info(f" Purged {deleted} dead outbox messages")
+    return {'success': True, 'deleted': deleted}
@@ -0,0 +1,12 @@
+from django.urls import path
+from .views import (
+    UnreadNotificationsAPIView,
+    MarkNotificationsReadAPIView,
+    NotificationMetricsAPIView,
+)
+
+urlpatterns = [
+    path('unread/', UnreadNotificationsAPIView.as_view(), name='unread-notifications'),
+    path('mark-read/', MarkNotificationsReadAPIView.as_view(), name='mark-notifications-read'),
+    path('metrics/', NotificationMetricsAPIView.as_view(), name='notification-metrics'),
+]
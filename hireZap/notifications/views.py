@@ -1,3 +1,86 @@
-from django.shortcuts import render
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated, IsAdminUser
 
-# Create your views here.
+from infrastructure.services.notification_stream import NotificationStream
+from infrastructure.services.notification_metrics import NotificationMetrics
+from core.use_cases.notifications.notification_history_usecase import (
+    GetUnreadNotificationsUseCase,
+    MarkNotificationsReadUseCase
+)
+from core.use_cases.notifications.notification_metrics_usecase import GetNotificationMetricsUseCase
+
+
+class UnreadNotificationsAPIView(APIView):
+    """Unread count from the notification stream: ?include=notifications&limit="""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        try:
+            params = request.query_params
+
+            use_case = GetUnreadNotificationsUseCase(NotificationStream())
+            result = use_case.execute(
+                user_id=request.user.id,
+                include_notifications=params.get('include') == 'notifications',
+                limit=int(params.get('limit', 50))
+            )
+            return Response(result)
+
+        except ValueError:
+            return Response({
+                'success': False,
+                'error': 'limit must be an integer'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return Response({
+                'success': False,
+                'error': str(e)
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class MarkNotificationsReadAPIView(APIView):
+    """Mark notifications read up to {'last_id'} (all of them without it)"""
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        try:
+            use_case = MarkNotificationsReadUseCase(NotificationStream())
+            result = use_case.execute(
+                user_id=request.user.id,
+                last_id=request.data.get('last_id')
+            )
+
+            if result['success']:
+                return Response(result)
+            else:
+                return Response(result, status=status.HTTP_400_BAD_REQUEST)
+
+        except Exception as e:
+            return Response({
+                'success': False,
+                'error': str(e)
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class NotificationMetricsAPIView(APIView):
+    """Per-type WebSocket notification metrics: ?minutes=15"""
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        try:
+            use_case = GetNotificationMetricsUseCase(NotificationMetrics())
+            result = use_case.execute(minutes=int(request.query_params.get('minutes', 15)))
+            return Response(result)
+
+        except ValueError:
+            return Response({
+                'success': False,
+                'error': 'minutes must be an integer'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return Response({
+                'success': False,
+                'error': str(e)
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
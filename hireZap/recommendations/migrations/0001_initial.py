@@ -0,0 +1,34 @@
+# Generated by Django 5.2.5 on 2026-10-19 01:24
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('candidate', '0006_candidateprofile_preferred_work_type'),
+        ('job', '0009_jobmodel_stage_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobRecommendation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField()),
+                ('matched_skills', models.PositiveIntegerField(default=0)),
+                ('computed_at', models.DateTimeField(auto_now=True)),
+                ('candidate', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='job_recommendations', to='candidate.candidateprofile')),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='recommendations', to='job.jobmodel')),
+            ],
+            options={
+                'db_table': 'job_recommendations',
+                'ordering': ['-score'],
+                'indexes': [models.Index(fields=['candidate', '-score'], name='job_recomme_candida_23f251_idx')],
+                'unique_together': {('candidate', 'job')},
+            },
+        ),
+    ]
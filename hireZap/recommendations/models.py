@@ -0,0 +1,28 @@
+from django.db import models
+from job.models import JobModel
+from candidate.models import CandidateProfile
+
+
+class JobRecommendation(models.Model):
+    """
+    One of a candidate's top-K jobs, precomputed by the recommender
+    (periodically and when jobs or profiles change)
+    """
+    candidate = models.ForeignKey(
+        CandidateProfile,
+        on_delete=models.CASCADE,
+        related_name='job_recommendations',
+        db_index=False
+    )
+    job = models.ForeignKey(JobModel, on_delete=models.CASCADE, related_name='recommendations')
+    score = models.FloatField()
+    matched_skills = models.PositiveIntegerField(default=0)
+    computed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'job_recommendations'
+        unique_together = ['candidate', 'job']
+        ordering = ['-score']
+        indexes = [
+            models.Index(fields=['candidate', '-score']),
+        ]
@@ -0,0 +1,29 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from job.models import JobModel
+from candidate.models import CandidateProfile, CandidateSkill, CandidateExperience
+from .tasks import schedule_refresh
+
+# Job fields the recommender scores on
+SCORED_JOB_FIELDS = {'skills_required', 'min_experience', 'location', 'work_type', 'status'}
+
+
+@receiver(post_save, sender=JobModel)
+def refresh_on_job_save(sender, instance, created, update_fields=None, **kwargs):
+    """ Posted, edited, paused or closed jobs enter or leave candidates' lists """
+    if not created and update_fields is not None and not SCORED_JOB_FIELDS.intersection(update_fields):
+        return
+    schedule_refresh('job', instance.id)
+
+
+@receiver(post_save, sender=CandidateProfile)
+def refresh_on_profile_save(sender, instance, created, **kwargs):
+    """ Location and preferred work type; a new profile has nothing to score yet """
+    if not created:
+        schedule_refresh('candidate', instance.user_id)
+
+
+@receiver([post_save, post_delete], sender=CandidateSkill)
+@receiver([post_save, post_delete], sender=CandidateExperience)
+def refresh_on_candidate_change(sender, instance, **kwargs):
+    schedule_refresh('candidate', instance.candidate_id)
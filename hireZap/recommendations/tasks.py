@@ -0,0 +1,59 @@
+from celery import shared_task
+from django.core.cache import cache
+from infrastructure.repositories.recommendation_repository import RecommendationRepository
+import logging
+logger = logging.getLogger(__name__)
+
+# Changes within this window share one refresh
+REFRESH_DEBOUNCE = 30
+PENDING_KEY = 'recommendations:pending:{kind}:{id}'
+
+
+def schedule_refresh(kind: str, object_id: int):
+    """
+    Queue a refresh of a candidate's list or of one job through the outbox,
+    unless one is already pending
+    """
+    if not cache.add(PENDING_KEY.format(kind=kind, id=object_id), 1, REFRESH_DEBOUNCE):
+        return
+    from infrastructure.services.notification_service import NotificationService
+    task = refresh_candidate_recommendations_task if kind == 'candidate' else refresh_job_recommendations_task
+    NotificationService().defer_task(task, object_id)
+
+
+@shared_task(name='recommendations.refresh_candidate')
+def refresh_candidate_recommendations_task(candidate_id):
+    cache.delete(PENDING_KEY.format(kind='candidate', id=candidate_id))
+    try:
+        stored = RecommendationRepository().refresh_candidate(candidate_id)
+        return {'success': True, 'candidate_id': candidate_id, 'recommendations': stored}
+    except Exception as e:
+        logger.error(f" Error refreshing recommendations of candidate {candidate_id}: {e}")
+        return {'success': False, 'error': str(e)}
+
+
+@shared_task(name='recommendations.refresh_job')
+def refresh_job_recommendations_task(job_id):
+    cache.delete(PENDING_KEY.format(kind='job', id=job_id))
+    try:
+        updated = RecommendationRepository().refresh_job(job_id)
+        return {'success': True, 'job_id': job_id, 'candidates_updated': updated}
+    except Exception as e:
+        logger.error(f" Error refreshing recommendations of job {job_id}: {e}")
+        return {'success': False, 'error': str(e)}
+
+
+@shared_task(name='recommendations.refresh_all')
+def refresh_all_recommendations_task():
+    """Periodic full recompute (new aliases, ageing experience, missed events)"""
+    repository = RecommendationRepository()
+    refreshed = failed = 0
+    for candidate_id in repository.candidate_ids():
+        try:
+            repository.refresh_candidate(candidate_id)
+            refreshed += 1
+        except Exception as e:
+            failed += 1
+            logger.error(f" Error refreshing recommendations of candidate {candidate_id}: {e}")
+    logger.info(f" Refreshed recommendations of {refreshed} candidates ({failed} failed)")
+    return {'success': True, 'refreshed': refreshed, 'failed': failed}
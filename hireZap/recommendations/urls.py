@@ -0,0 +1,6 @@
+from django.urls import path
+from .views import JobRecommendationsAPIView
+
+urlpatterns = [
+    path('jobs/', JobRecommendationsAPIView.as_view(), name='job-recommendations'),
+]
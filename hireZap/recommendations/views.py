@@ -0,0 +1,44 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+
+from core.use_cases.recommendations.get_job_recommendations_usecase import GetJobRecommendationsUseCase
+from infrastructure.repositories.recommendation_repository import RecommendationRepository
+from .tasks import schedule_refresh
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+class JobRecommendationsAPIView(APIView):
+    """Recommended jobs of the logged-in candidate: ?limit="""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        if request.user.role != 'candidate':
+            return Response(
+                {'error': 'Only candidates have job recommendations'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        try:
+            use_case = GetJobRecommendationsUseCase(RecommendationRepository())
+            result = use_case.execute(
+                candidate_id=request.user.id,
+                limit=int(request.query_params.get('limit', 20))
+            )
+            if not result['recommendations']:
+                # Not computed yet (e.g. new candidate); ready on a later visit
+                schedule_refresh('candidate', request.user.id)
+            return Response(result, status=status.HTTP_200_OK)
+        except ValueError:
+            return Response(
+                {'error': 'limit must be an integer'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        except Exception as e:
+            logger.error(f" Error fetching recommendations of candidate {request.user.id}: {str(e)}")
+            return Response(
+                {'error': 'Internal server error'},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class SelectionProcessConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'selection_process'
+
+    def ready(self):
+        import selection_process.signals
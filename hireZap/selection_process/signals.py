@@ -0,0 +1,10 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import SelectionProcessModel
+from infrastructure.repositories.job_repository import JobRepository
+
+
+@receiver([post_save, post_delete], sender=SelectionProcessModel)
+def refresh_job_stage_counters(sender, instance, **kwargs):
+    """ Saving a selection process or (de)activating a stage changes the job's counters """
+    JobRepository().refresh_stage_counters(instance.job_id)
@@ -0,0 +1,45 @@
+"""
+skills/management/commands/rebuild_skill_index.py
+
+Resolves every job requirement and candidate skill to its canonical skill
+(e.g. after adding aliases, or for data written before the index existed).
+
+Usage:
+    python manage.py rebuild_skill_index
+    python manage.py rebuild_skill_index --jobs
+"""
+from django.core.management.base import BaseCommand
+from job.models import JobModel
+from candidate.models import CandidateSkill
+from infrastructure.services.skill_taxonomy import SkillTaxonomy
+from infrastructure.repositories.skill_index_repository import SkillIndexRepository
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the skill -> jobs and skill -> candidates index'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--jobs', action='store_true', help='Only job requirements')
+        parser.add_argument('--candidates', action='store_true', help='Only candidate skills')
+
+    def handle(self, *args, **options):
+        both = not options['jobs'] and not options['candidates']
+        taxonomy = SkillTaxonomy()
+        repository = SkillIndexRepository(taxonomy)
+
+        if both or options['jobs']:
+            jobs = 0
+            for job_id, skills in JobModel.objects.values_list('id', 'skills_required').iterator(chunk_size=500):
+                repository.index_job(job_id, skills or [])
+                jobs += 1
+            self.stdout.write(f"jobs: indexed {jobs}")
+
+        if both or options['candidates']:
+            names = CandidateSkill.objects.values_list('skill_name', flat=True).distinct()
+            resolved = taxonomy.resolve(list(names), create=True)
+            updated = 0
+            for skill_name, skill_id in resolved.items():
+                updated += CandidateSkill.objects.filter(
+                    skill_name=skill_name
+                ).exclude(skill_id=skill_id).update(skill_id=skill_id)
+            self.stdout.write(f"candidate skills: relinked {updated}")
@@ -0,0 +1,68 @@
+from django.db import migrations
+
+# (name, key, aliases); keys and aliases are already normalized
+# (SkillTaxonomy.normalize)
+SKILLS = [
+    ('JavaScript', 'javascript', ['js', 'ecmascript', 'es6']),
+    ('TypeScript', 'typescript', ['ts']),
+    ('Python', 'python', ['python3', 'python 3']),
+    ('Java', 'java', []),
+    ('Go', 'go', ['golang']),
+    ('C++', 'c++', ['cpp']),
+    ('C#', 'c#', ['csharp', 'c sharp']),
+    ('.NET', '.net', ['dotnet']),
+    ('React', 'react', ['react.js', 'reactjs']),
+    ('React Native', 'react native', []),
+    ('Angular', 'angular', ['angularjs', 'angular.js']),
+    ('Vue.js', 'vue.js', ['vue', 'vuejs']),
+    ('Next.js', 'next.js', ['nextjs']),
+    ('Node.js', 'node.js', ['node', 'nodejs']),
+    ('Express.js', 'express.js', ['express', 'expressjs']),
+    ('Django', 'django', []),
+    ('Django REST Framework', 'django rest framework', ['drf']),
+    ('Spring Boot', 'spring boot', ['springboot']),
+    ('HTML', 'html', ['html5']),
+    ('CSS', 'css', ['css3']),
+    ('Tailwind CSS', 'tailwind css', ['tailwind', 'tailwindcss']),
+    ('SQL', 'sql', []),
+    ('PostgreSQL', 'postgresql', ['postgres', 'psql']),
+    ('MySQL', 'mysql', []),
+    ('MongoDB', 'mongodb', ['mongo']),
+    ('Redis', 'redis', []),
+    ('GraphQL', 'graphql', []),
+    ('REST APIs', 'rest api', ['rest', 'rest apis', 'restful api', 'restful apis']),
+    ('Docker', 'docker', []),
+    ('Kubernetes', 'kubernetes', ['k8s']),
+    ('AWS', 'aws', ['amazon web services']),
+    ('Google Cloud', 'gcp', ['google cloud', 'google cloud platform']),
+    ('Azure', 'azure', ['microsoft azure']),
+    ('CI/CD', 'ci cd', ['continuous integration']),
+    ('Git', 'git', []),
+    ('Linux', 'linux', []),
+    ('Machine Learning', 'machine learning', ['ml']),
+    ('Deep Learning', 'deep learning', ['dl']),
+    ('Natural Language Processing', 'natural language processing', ['nlp']),
+    ('TensorFlow', 'tensorflow', []),
+    ('PyTorch', 'pytorch', []),
+    ('Figma', 'figma', []),
+]
+
+
+def seed_skills(apps, schema_editor):
+    Skill = apps.get_model('skills', 'Skill')
+    SkillAlias = apps.get_model('skills', 'SkillAlias')
+    for name, key, aliases in SKILLS:
+        skill, _ = Skill.objects.get_or_create(key=key, defaults={'name': name})
+        for alias in aliases:
+            SkillAlias.objects.get_or_create(alias=alias, defaults={'skill': skill})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('skills', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_skills, migrations.RunPython.noop),
+    ]
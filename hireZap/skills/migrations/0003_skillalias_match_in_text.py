@@ -0,0 +1,28 @@
+# Generated by Django 5.2.5 on 2026-10-19 01:44
+
+from django.db import migrations, models
+
+# Seeded aliases that are everyday words or short tokens; they still
+# resolve skill names but are not looked for in resume text
+AMBIGUOUS_ALIASES = ['rest', 'express', 'node', 'ts', 'ml', 'dl', 'tailwind']
+
+
+def flag_ambiguous_aliases(apps, schema_editor):
+    SkillAlias = apps.get_model('skills', 'SkillAlias')
+    SkillAlias.objects.filter(alias__in=AMBIGUOUS_ALIASES).update(match_in_text=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('skills', '0002_seed_skills'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='skillalias',
+            name='match_in_text',
+            field=models.BooleanField(default=True),
+        ),
+        migrations.RunPython(flag_ambiguous_aliases, migrations.RunPython.noop),
+    ]
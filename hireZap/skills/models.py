@@ -0,0 +1,50 @@
+from django.db import models
+from job.models import JobModel
+
+
+class Skill(models.Model):
+    """
+    Canonical skill. `key` is the normalized name (SkillTaxonomy.normalize);
+    job requirements and candidate skills resolve to it directly or
+    through a SkillAlias.
+    """
+    name = models.CharField(max_length=100)
+    key = models.CharField(max_length=100, unique=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'skills'
+        ordering = ['name']
+
+    def __str__(self):
+        return self.name
+
+
+class SkillAlias(models.Model):
+    """
+    Alternative spelling of a skill (e.g. 'reactjs' for React). Aliases
+    that are also everyday words ('rest', 'express') only resolve skill
+    names, they are not looked for in free text such as resumes.
+    """
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name='aliases')
+    alias = models.CharField(max_length=100, unique=True)
+    match_in_text = models.BooleanField(default=True)
+
+    class Meta:
+        db_table = 'skill_aliases'
+
+    def __str__(self):
+        return f"{self.alias} -> {self.skill.name}"
+
+
+class JobSkill(models.Model):
+    """Inverted index of JobModel.skills_required: skill -> jobs"""
+    job = models.ForeignKey(JobModel, on_delete=models.CASCADE, related_name='indexed_skills')
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name='jobs', db_index=False)
+
+    class Meta:
+        db_table = 'job_skills'
+        unique_together = ['job', 'skill']
+        indexes = [
+            models.Index(fields=['skill', 'job']),
+        ]
@@ -0,0 +1,28 @@
+from django.db.models.signals import post_save, post_delete, pre_save
+from django.dispatch import receiver
+from .models import Skill, SkillAlias
+from job.models import JobModel
+from candidate.models import CandidateSkill
+from infrastructure.services.skill_taxonomy import SkillTaxonomy
+from infrastructure.repositories.skill_index_repository import SkillIndexRepository
+
+
+@receiver([post_save, post_delete], sender=Skill)
+@receiver([post_save, post_delete], sender=SkillAlias)
+def invalidate_taxonomy(sender, instance, **kwargs):
+    """ The cached alias map resolves every skill name """
+    SkillTaxonomy().invalidate()
+
+
+@receiver(post_save, sender=JobModel)
+def index_job_skills(sender, instance, created, update_fields=None, **kwargs):
+    """ Keep skill -> jobs in step with skills_required """
+    if not created and update_fields is not None and 'skills_required' not in update_fields:
+        return
+    SkillIndexRepository().index_job(instance.id, instance.skills_required)
+
+
+@receiver(pre_save, sender=CandidateSkill)
+def resolve_candidate_skill(sender, instance, **kwargs):
+    """ Link the skill name to its canonical skill (skill -> candidates) """
+    instance.skill_id = SkillTaxonomy().resolve_one(instance.skill_name, create=True)
@@ -0,0 +1,10 @@
+from django.urls import path
+from .views import (
+    JobsForCandidateAPIView,
+    CandidatesForJobAPIView,
+)
+
+urlpatterns = [
+    path('matching-jobs/', JobsForCandidateAPIView.as_view(), name='skill-matching-jobs'),
+    path('jobs/<int:job_id>/matching-candidates/', CandidatesForJobAPIView.as_view(), name='skill-matching-candidates'),
+]
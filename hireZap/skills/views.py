@@ -0,0 +1,80 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+
+from core.use_cases.skills.skill_match_usecase import (
+    GetJobsForCandidateUseCase,
+    GetCandidatesForJobUseCase,
+)
+from infrastructure.repositories.skill_index_repository import SkillIndexRepository
+from infrastructure.repositories.job_repository import JobRepository
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+class JobsForCandidateAPIView(APIView):
+    """Active jobs matching the candidate's skills: ?limit="""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        if request.user.role != 'candidate':
+            return Response(
+                {'error': 'Only candidates have skill matches'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        try:
+            use_case = GetJobsForCandidateUseCase(SkillIndexRepository())
+            result = use_case.execute(
+                candidate_id=request.user.id,
+                limit=int(request.query_params.get('limit', 20))
+            )
+            return Response(result, status=status.HTTP_200_OK)
+        except ValueError:
+            return Response(
+                {'error': 'limit must be an integer'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        except Exception as e:
+            logger.error(f" Error matching jobs for candidate {request.user.id}: {str(e)}")
+            return Response(
+                {'error': 'Internal server error'},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class CandidatesForJobAPIView(APIView):
+    """Candidates matching the skills of a job: ?limit="""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, job_id):
+        if request.user.role != 'recruiter':
+            return Response(
+                {'error': 'Only recruiters can search candidates'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        try:
+            use_case = GetCandidatesForJobUseCase(SkillIndexRepository(), JobRepository())
+            result = use_case.execute(
+                job_id=job_id,
+                recruiter_id=request.user.id,
+                limit=int(request.query_params.get('limit', 20))
+            )
+            if not result['success']:
+                return Response(
+                    {'error': result['error']},
+                    status=status.HTTP_404_NOT_FOUND if result['error'] == 'Job not found' else status.HTTP_403_FORBIDDEN
+                )
+            return Response(result, status=status.HTTP_200_OK)
+        except ValueError:
+            return Response(
+                {'error': 'limit must be an integer'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        except Exception as e:
+            logger.error(f" Error matching candidates for job {job_id}: {str(e)}")
+            return Response(
+                {'error': 'Internal server error'},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class TelephonicRoundConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'telephonic_round'
+
+    def ready(self):
+        import telephonic_round.signals
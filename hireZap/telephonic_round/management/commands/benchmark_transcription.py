@@ -0,0 +1,81 @@
+"""
+telephonic_round/management/commands/benchmark_transcription.py
+
+Reports real-time factor (processing time / audio duration) for each
+transcription profile on a sample recording.
+
+Usage:
+    python manage.py benchmark_transcription sample.wav
+    python manage.py benchmark_transcription sample.wav --profiles fast accurate --two-pass
+"""
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from infrastructure.services.telephonic_service import TranscriptionService
+import os
+import time
+
+
+class Command(BaseCommand):
+    help = 'Benchmark Whisper transcription profiles (real-time factor per profile)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('audio_path', help='Path to a sample interview recording')
+        parser.add_argument(
+            '--profiles',
+            nargs='+',
+            default=list(getattr(settings, 'WHISPER_PROFILES', {}).keys()),
+            help='Profiles to benchmark (default: all configured profiles)'
+        )
+        parser.add_argument('--language', default='en')
+        parser.add_argument('--two-pass', action='store_true', help='Enable two-pass re-transcription')
+        parser.add_argument('--threshold', type=float, default=0.6, help='Two-pass confidence threshold')
+
+    def handle(self, *args, **options):
+        audio_path = options['audio_path']
+        if not os.path.exists(audio_path):
+            raise CommandError(f'File not found: {audio_path}')
+
+        service = TranscriptionService()
+        rows = []
+
+        for profile in options['profiles']:
+            # Load the model outside the timed section so only decoding is measured
+            load_start = time.time()
+            service.get_model(profile)
+            load_time = time.time() - load_start
+
+            with open(audio_path, 'rb') as audio_file:
+                result = service.transcribe_audio(
+                    audio_file,
+                    language=options['language'],
+                    profile=profile,
+                    two_pass=options['two_pass'],
+                    confidence_threshold=options['threshold']
+                )
+
+            if not result['success']:
+                self.stderr.write(self.style.ERROR(f"{profile}: {result['error']}"))
+                continue
+
+            segments = result['segments']
+            avg_confidence = (
+                sum(s['confidence'] for s in segments) / len(segments) if segments else 0.0
+            )
+            rows.append((
+                profile,
+                result['model_used'],
+                result['duration'],
+                result['processing_time'],
+                result['real_time_factor'],
+                avg_confidence,
+                load_time
+            ))
+
+        self.stdout.write(
+            f"{'profile':<10} {'model':<20} {'audio(s)':>9} {'time(s)':>8} {'RTF':>6} {'conf':>5} {'load(s)':>8}"
+        )
+        for profile, model_used, duration, elapsed, rtf, confidence, load_time in rows:
+            self.stdout.write(
+                f"{profile:<10} {model_used:<20} {duration:>9.1f} {elapsed:>8.2f} "
+                f"{(rtf or 0):>6.3f} {confidence:>5.2f} {load_time:>8.2f}"
+            )
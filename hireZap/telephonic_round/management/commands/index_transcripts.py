@@ -0,0 +1,47 @@
+"""
+telephonic_round/management/commands/index_transcripts.py
+
+Rebuilds the transcript search index from stored telephonic and HR
+transcriptions (e.g. transcripts created before the index existed).
+
+Usage:
+    python manage.py index_transcripts
+    python manage.py index_transcripts --round hr --job 42
+"""
+from django.core.management.base import BaseCommand
+from telephonic_round.models import InterviewTranscription
+from hr_round.models import HRInterviewTranscription
+from infrastructure.repositories.transcript_search_repository import TranscriptSearchRepository
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the transcript search index from stored transcriptions'
+
+    MODELS = {
+        'telephonic': InterviewTranscription,
+        'hr': HRInterviewTranscription,
+    }
+
+    def add_arguments(self, parser):
+        parser.add_argument('--round', choices=list(self.MODELS), help='Only this interview round')
+        parser.add_argument('--job', type=int, help='Only interviews of this job')
+
+    def handle(self, *args, **options):
+        repository = TranscriptSearchRepository()
+        rounds = [options['round']] if options['round'] else list(self.MODELS)
+
+        for round_type in rounds:
+            transcriptions = self.MODELS[round_type].objects.filter(
+                processing_status='completed'
+            ).select_related('interview').only('segments', 'interview__id', 'interview__job_id')
+            if options['job']:
+                transcriptions = transcriptions.filter(interview__job_id=options['job'])
+
+            interviews = segments = 0
+            for transcription in transcriptions.iterator(chunk_size=200):
+                interview = transcription.interview
+                repository.clear_segments(round_type, interview.id)
+                segments += repository.index_segments(round_type, interview.id, interview.job_id, transcription.segments or [])
+                interviews += 1
+
+            self.stdout.write(f"{round_type}: indexed {segments} segments of {interviews} interviews")
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.5 on 2026-10-19 00:17
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('telephonic_round', '0002_callsession_candidate_joined_at_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='telephonicroundsettings',
+            name='enable_two_pass_transcription',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='telephonicroundsettings',
+            name='transcription_profile',
+            field=models.CharField(choices=[('fast', 'Fast'), ('balanced', 'Balanced'), ('accurate', 'Accurate')], default='balanced', max_length=20),
+        ),
+        migrations.AddField(
+            model_name='telephonicroundsettings',
+            name='two_pass_confidence_threshold',
+            field=models.FloatField(default=0.6, validators=[django.core.validators.MinValueValidator(0.0), django.core.validators.MaxValueValidator(1.0)]),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.5 on 2026-10-19 00:19
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('telephonic_round', '0003_telephonicroundsettings_enable_two_pass_transcription_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='interviewtranscription',
+            name='progress_percent',
+            field=models.IntegerField(default=0, validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(100)]),
+        ),
+    ]
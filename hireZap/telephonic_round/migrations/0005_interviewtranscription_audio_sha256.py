@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-19 00:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('telephonic_round', '0004_interviewtranscription_progress_percent'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='interviewtranscription',
+            name='audio_sha256',
+            field=models.CharField(blank=True, db_index=True, max_length=64, null=True),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.5 on 2026-10-19 00:32
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('application', '0008_applicationstagehistory_score'),
+        ('job', '0007_jobmodel_min_experience'),
+        ('selection_process', '0004_alter_selectionprocessmodel_job_and_more'),
+        ('telephonic_round', '0005_interviewtranscription_audio_sha256'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='telephonicinterview',
+            index=models.Index(fields=['conducted_by', 'scheduled_at'], name='telephonic__conduct_73e88e_idx'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.5 on 2026-10-19 00:51
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job', '0007_jobmodel_min_experience'),
+        ('telephonic_round', '0006_telephonicinterview_telephonic__conduct_73e88e_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TranscriptSegment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('round_type', models.CharField(choices=[('telephonic', 'Telephonic'), ('hr', 'HR')], max_length=20)),
+                ('interview_id', models.IntegerField()),
+                ('start_ms', models.IntegerField()),
+                ('end_ms', models.IntegerField()),
+                ('text', models.TextField()),
+                ('speaker', models.CharField(blank=True, max_length=20, null=True)),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='transcript_segments', to='job.jobmodel')),
+            ],
+            options={
+                'db_table': 'transcript_segments',
+                'indexes': [django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='transcript__search__056a4d_gin'), models.Index(fields=['round_type', 'interview_id', 'start_ms'], name='transcript__round_t_fb4462_idx')],
+            },
+        ),
+    ]
@@ -1,6 +1,8 @@
 from django.db import models
 from django.conf import settings
 from django.core.validators import MinValueValidator, MaxValueValidator 
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from job.models import  JobModel
 from application.models import ApplicationModel
 from selection_process.models import SelectionStageModel
@@ -35,6 +37,22 @@ class TelephonicRoundSettings(models.Model):
     enable_transcription = models.BooleanField(default=True)
     enable_ai_analysis = models.BooleanField(default=True)
 
+    #Transcription settings
+    transcription_profile = models.CharField(
+        max_length=20,
+        choices=[
+            ('fast', 'Fast'),
+            ('balanced', 'Balanced'),
+            ('accurate', 'Accurate'),
+        ],
+        default='balanced'
+    )
+    enable_two_pass_transcription = models.BooleanField(default=False)
+    two_pass_confidence_threshold = models.FloatField(
+        default=0.6,
+        validators=[MinValueValidator(0.0), MaxValueValidator(1.0)]
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -123,6 +141,7 @@ class TelephonicInterview(models.Model):
             models.Index(fields=['application', 'status']),
             models.Index(fields=['scheduled_at', 'status']),
             models.Index(fields=['status', 'scheduled_at']),
+            models.Index(fields=['conducted_by', 'scheduled_at']),
         ]
     
     def __str__(self):
@@ -234,10 +253,19 @@ class InterviewTranscription(models.Model):
     )
     processing_time_seconds = models.FloatField(null=True, blank=True)
     error_message = models.TextField(blank=True, null=True)
+    # Segments are appended in batches while processing; a failed run
+    # resumes from the end of the last stored segment
+    progress_percent = models.IntegerField(
+        default=0,
+        validators=[MinValueValidator(0), MaxValueValidator(100)]
+    )
     
     # Whisper model used
     model_used = models.CharField(max_length=50, default='whisper-1')
     
+    # SHA-256 of the recording content - identical audio reuses the transcript
+    audio_sha256 = models.CharField(max_length=64, blank=True, null=True, db_index=True)
+    
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -247,6 +275,44 @@ class InterviewTranscription(models.Model):
     def __str__(self):
         return f"Transcription - {self.interview.candidate_name}"
     
+class TranscriptSegment(models.Model):
+    """
+    Full-text index of transcript segments of telephonic and HR interviews.
+    One row per Whisper segment, with its offset in the recording.
+    """
+
+    ROUND_CHOICES = [
+        ('telephonic', 'Telephonic'),
+        ('hr', 'HR'),
+    ]
+
+    round_type = models.CharField(max_length=20, choices=ROUND_CHOICES)
+    interview_id = models.IntegerField()
+    job = models.ForeignKey(
+        JobModel,
+        on_delete=models.CASCADE,
+        related_name='transcript_segments'
+    )
+    
+    start_ms = models.IntegerField()
+    end_ms = models.IntegerField()
+    text = models.TextField()
+    speaker = models.CharField(max_length=20, blank=True, null=True)
+    
+    search_vector = SearchVectorField(null=True)
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        db_table = 'transcript_segments'
+        indexes = [
+            GinIndex(fields=['search_vector']),
+            models.Index(fields=['round_type', 'interview_id', 'start_ms']),
+        ]
+    
+    def __str__(self):
+        return f"{self.round_type} interview {self.interview_id} @ {self.start_ms}ms"
+
 class InterviewPerformanceResult(models.Model):
 
     interview = models.OneToOneField(
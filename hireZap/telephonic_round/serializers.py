@@ -31,6 +31,9 @@ class TelephonicRoundSettingsSerializer(serializers.ModelSerializer):
             'enable_recording',
             'enable_transcription',
             'enable_ai_analysis',
+            'transcription_profile',
+            'enable_two_pass_transcription',
+            'two_pass_confidence_threshold',
             'created_at',
             'updated_at',
         ]
@@ -85,6 +88,42 @@ class BulkScheduleSerializer(serializers.Serializer):
     )
 
 
+class AvailabilityWindowSerializer(serializers.Serializer):
+    """Interviewer availability window"""
+    start = serializers.DateTimeField(required=True)
+    end = serializers.DateTimeField(required=True)
+
+    def validate(self, data):
+        if data['end'] <= data['start']:
+            raise serializers.ValidationError("Window end must be after window start")
+        return data
+
+
+class FreeSlotsSerializer(serializers.Serializer):
+    """Free slot query for the requesting interviewer"""
+    windows = serializers.ListField(child=AvailabilityWindowSerializer(), min_length=1)
+    duration = serializers.IntegerField(required=False, default=30, min_value=5)
+    buffer_minutes = serializers.IntegerField(required=False, default=0, min_value=0)
+    limit = serializers.IntegerField(required=False, default=50, min_value=1, max_value=500)
+
+
+class AutoScheduleSerializer(serializers.Serializer):
+    """Pack applications into the recruiter's availability windows"""
+    application_ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        min_length=1,
+        max_length=500
+    )
+    windows = serializers.ListField(child=AvailabilityWindowSerializer(), min_length=1)
+    duration = serializers.IntegerField(required=False, default=30, min_value=5)
+    buffer_minutes = serializers.IntegerField(required=False, default=0, min_value=0)
+    timezone = serializers.CharField(required=False, allow_blank=True)
+    notes = serializers.CharField(required=False, allow_blank=True)
+    schedule = serializers.BooleanField(default=False)
+    send_notifications = serializers.BooleanField(default=True)
+    send_emails = serializers.BooleanField(default=True)
+
+
 class RescheduleInterviewSerializer(serializers.Serializer):
     """Reschedule existing interview"""
     interview_id = serializers.IntegerField(required=True)
@@ -0,0 +1,27 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import TelephonicInterview, InterviewPerformanceResult
+from infrastructure.repositories.telephonic_round_repository import TelephonicRoundRepository
+from infrastructure.repositories.transcript_search_repository import TranscriptSearchRepository
+
+
+@receiver([post_save, post_delete], sender=TelephonicInterview)
+def invalidate_stats_on_interview_change(sender, instance, **kwargs):
+    """ Status transitions change the per-job round statistics """
+    TelephonicRoundRepository().invalidate_job_stats(instance.job_id)
+
+
+@receiver([post_save, post_delete], sender=InterviewPerformanceResult)
+def invalidate_stats_on_result_change(sender, instance, **kwargs):
+    """ Qualified count and average score come from performance results """
+    job_id = TelephonicInterview.objects.filter(
+        id=instance.interview_id
+    ).values_list('job_id', flat=True).first()
+    if job_id:
+        TelephonicRoundRepository().invalidate_job_stats(job_id)
+
+
+@receiver(post_delete, sender=TelephonicInterview)
+def clear_transcript_segments(sender, instance, **kwargs):
+    """ Indexed segments only reference the interview by id """
+    TranscriptSearchRepository().clear_segments('telephonic', instance.id)
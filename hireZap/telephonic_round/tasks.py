@@ -1,14 +1,20 @@
 from celery import shared_task
 from django.utils import timezone
+from datetime import timedelta
 from infrastructure.repositories.telephonic_round_repository import TelephonicRoundRepository
+from infrastructure.repositories.transcript_search_repository import TranscriptSearchRepository
 from infrastructure.services.telephonic_service import (
     TranscriptionService,
     InterviewScorerService
 )
 from infrastructure.services.notification_service import NotificationService
+from infrastructure.services.reminder_scheduler import InterviewReminderScheduler
 from infrastructure.services.storage_factory import StorageFactory
+from core.use_cases.telephonic_round.stream_transcription_usecase import StreamTranscriptionUseCase
+from core.use_cases.telephonic_round.reanalyze_interview_usecase import ReanalyzeInterviewUseCase
 import requests
 import tempfile
+import hashlib
 import os
 import logging
 logger = logging.getLogger(__name__)
@@ -22,16 +28,25 @@ def send_interview_scheduled_email_task(interview_id: int):
         if not interview:
             return {'success': False, 'error': 'Interview not found'}
         
-        # Email content
-        candidate_name = f"{interview.application.first_name} {interview.application.last_name}"
-        candidate_email = interview.application.email
-        job_title = interview.job.job_title
-        scheduled_time = interview.scheduled_at.strftime('%B %d, %Y at %I:%M %p')
-        duration = interview.scheduled_duration_minutes
-        
-        subject = f"Telephonic Interview Scheduled - {job_title}"
+        send_interview_scheduled_email(interview)
+        return {'success': True}
         
-        message = f"""
+    except Exception as e:
+        logger.error(f" Email sending failed: {str(e)}")
+        return {'success': False, 'error': str(e)}
+
+
+def send_interview_scheduled_email(interview):
+    # Email content
+    candidate_name = f"{interview.application.first_name} {interview.application.last_name}"
+    candidate_email = interview.application.email
+    job_title = interview.job.job_title
+    scheduled_time = interview.scheduled_at.strftime('%B %d, %Y at %I:%M %p')
+    duration = interview.scheduled_duration_minutes
+    
+    subject = f"Telephonic Interview Scheduled - {job_title}"
+    
+    message = f"""
 Dear {candidate_name},
 
 Your telephonic interview has been scheduled!
@@ -55,46 +70,140 @@ Good luck!
 Best regards,
 Hiring Team
 """
-        return {'success': True}
-        
-    except Exception as e:
-        logger.error(f" Email sending failed: {str(e)}")
-        return {'success': False, 'error': str(e)}
+    
+    from infrastructure.email.email_sender import EmailSender
+    EmailSender().send_email(candidate_email, subject, message)
+    logger.info(f" Interview scheduled email sent to {candidate_email}")
+
 
+@shared_task(name='telephonic_round.send_bulk_interview_scheduled_notifications')
+def send_bulk_interview_scheduled_notifications_task(
+    interview_ids: list,
+    send_notifications: bool = True,
+    send_emails: bool = True):
+    """Fan out scheduling notifications and emails for a bulk schedule in one task"""
+    repo = TelephonicRoundRepository()
+    notification_service = NotificationService()
+    
+    interviews = repo.get_interviews_by_ids(interview_ids)
+    notified_count = 0
+    emailed_count = 0
+    
+    with notification_service.buffered():
+        for interview in interviews:
+            try:
+                if send_notifications:
+                    notification_service.send_websocket_notification(
+                        user_id=interview.application.candidate_id,
+                        notification_type='interview_scheduled',
+                        data={
+                            'interview_id': interview.id,
+                            'job_id': interview.job_id,
+                            'job_title': interview.job.job_title,
+                            'scheduled_at': interview.scheduled_at.isoformat(),
+                            'duration': interview.scheduled_duration_minutes,
+                            'timezone': interview.timezone,
+                            'notes': interview.scheduling_notes
+                        }
+                    )
+                    notified_count += 1
+            
+                if send_emails:
+                    send_interview_scheduled_email(interview)
+                    emailed_count += 1
+                
+            except Exception as e:
+                logger.error(f" Scheduling notification failed for interview {interview.id}: {str(e)}")
+    
+    logger.info(f" Bulk schedule: {notified_count} notifications, {emailed_count} emails")
+    return {
+        'success': True,
+        'notified': notified_count,
+        'emailed': emailed_count
+    }
 
-@shared_task(name='telephonic_round.send_interview_reminders')
-def send_interview_reminders_task():
+
+def schedule_interview_reminders(interview_ids: list):
+    """Queue ETA reminders for (re)scheduled interviews, using each job's reminder settings"""
+    repo = TelephonicRoundRepository()
+    scheduler = InterviewReminderScheduler()
+    settings_by_job = {}
+
+    for interview in repo.get_interviews_by_ids(interview_ids):
+        try:
+            if interview.job_id not in settings_by_job:
+                settings_by_job[interview.job_id] = repo.get_settings_by_job(interview.job_id)
+            settings = settings_by_job[interview.job_id]
+
+            if interview.status != 'scheduled' or not interview.scheduled_at or (settings and not settings.send_reminders):
+                scheduler.cancel('telephonic', interview.id)
+                continue
+
+            hours_before = settings.reminder_hours_before if settings else 24
+            scheduler.schedule(
+                'telephonic',
+                interview.id,
+                interview.scheduled_at - timedelta(hours=hours_before)
+            )
+        except Exception as e:
+            logger.error(f" Reminder scheduling failed for interview {interview.id}: {str(e)}")
+
+
+@shared_task(name='telephonic_round.schedule_interview_reminders')
+def schedule_interview_reminders_task(interview_ids: list):
+    schedule_interview_reminders(interview_ids)
+    return {'success': True}
+
+
+@shared_task(name='telephonic_round.reschedule_job_reminders')
+def reschedule_job_reminders_task(job_id: int):
+    """Re-queue the reminders of a job's scheduled interviews after its settings change"""
+    repo = TelephonicRoundRepository()
+    interview_ids = [interview.id for interview in repo.get_interviews_by_job(job_id, status='scheduled')]
+    schedule_interview_reminders(interview_ids)
+    return {'success': True, 'interviews': len(interview_ids)}
+
+
+@shared_task(name='telephonic_round.send_due_interview_reminders')
+def send_due_interview_reminders_task(bucket: int):
+    """Send every reminder due in one minute bucket as a single batch"""
     try:
         repo = TelephonicRoundRepository()
         notification_service = NotificationService()
         
-        # Get interviews that need reminders
-        interviews = repo.get_upcoming_interviews_for_reminder(hours_before=24)
+        interview_ids = InterviewReminderScheduler().pop_due('telephonic', bucket)
+        if not interview_ids:
+            return {'success': True, 'reminders_sent': 0}
         
-        sent_count = 0
-        for interview in interviews:
-            # Send WebSocket notification
-            notification_service.send_websocket_notification(
-                user_id=interview.application.candidate_id,
-                notification_type='interview_reminder',
-                data={
-                    'interview_id': interview.id,
-                    'job_title': interview.job.job_title,
-                    'scheduled_at': interview.scheduled_at.isoformat(),
-                    'duration': interview.scheduled_duration_minutes
-                }
-            )
-            
-            # Send email
-            send_interview_reminder_email(interview)
-            
-            # Mark as sent
-            repo.mark_reminder_sent(interview.id)
-            sent_count += 1
+        # Cancelled, started or already reminded interviews drop out here
+        interviews = repo.get_interviews_due_for_reminder(interview_ids)
         
+        sent_ids = []
+        with notification_service.buffered():
+            for interview in interviews:
+                try:
+                    notification_service.send_websocket_notification(
+                        user_id=interview.application.candidate_id,
+                        notification_type='interview_reminder',
+                        data={
+                            'interview_id': interview.id,
+                            'job_title': interview.job.job_title,
+                            'scheduled_at': interview.scheduled_at.isoformat(),
+                            'duration': interview.scheduled_duration_minutes
+                        }
+                    )
+                    send_interview_reminder_email(interview)
+                    sent_ids.append(interview.id)
+                except Exception as e:
+                    logger.error(f" Reminder failed for interview {interview.id}: {str(e)}")
+        
+        if sent_ids:
+            repo.mark_reminders_sent(sent_ids)
+        
+        logger.info(f" Sent {len(sent_ids)} telephonic interview reminders for bucket {bucket}")
         return {
             'success': True,
-            'reminders_sent': sent_count
+            'reminders_sent': len(sent_ids)
         }
         
     except Exception as e:
@@ -102,6 +211,13 @@ def send_interview_reminders_task():
         return {'success': False, 'error': str(e)}
 
 
+@shared_task(name='telephonic_round.queue_interview_reminders')
+def queue_interview_reminders_task():
+    """Hand reminder buckets that are now within the ETA horizon to Celery"""
+    queued = InterviewReminderScheduler().queue_upcoming('telephonic')
+    return {'success': True, 'queued_buckets': queued}
+
+
 def send_interview_reminder_email(interview):
     """Send reminder email"""
     candidate_name = f"{interview.application.first_name} {interview.application.last_name}"
@@ -109,7 +225,7 @@ def send_interview_reminder_email(interview):
     job_title = interview.job.job_title
     scheduled_time = interview.scheduled_at.strftime('%B %d, %Y at %I:%M %p')
     
-    subject = f"Reminder: Telephonic Interview Tomorrow - {job_title}"
+    subject = f"Reminder: Upcoming Telephonic Interview - {job_title}"
     
     message = f"""
 Dear {candidate_name},
@@ -144,6 +260,10 @@ def process_interview_recording_task(call_session_id: str):
         
         interview = session.interview
         
+        settings = repo.get_settings_by_job(interview.job_id)
+        if not settings:
+            settings = repo.create_default_settings(interview.job_id)
+        
         # 2. Download recording
         recording_url = session.recording_url
         if not recording_url:
@@ -155,14 +275,21 @@ def process_interview_recording_task(call_session_id: str):
         
         temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.wav')
         try:
+            # Hash while downloading - identical recordings reuse the stored transcript
+            digest = hashlib.sha256()
             for chunk in response.iter_content(chunk_size=8192):
                 temp_file.write(chunk)
+                digest.update(chunk)
             temp_file.close()
             
-            # 3. Transcribe audio
+            # 3. Transcribe audio (segments are saved in batches as they are decoded)
             logger.info(f" Starting transcription for interview {interview.id}...")
-            with open(temp_file.name, 'rb') as audio_file:
-                transcription_result = transcription_service.transcribe_audio(audio_file)
+            transcription_result = StreamTranscriptionUseCase(
+                repo,
+                transcription_service,
+                notification_service,
+                search_repository=TranscriptSearchRepository()
+            ).execute(interview, temp_file.name, settings, audio_sha256=digest.hexdigest())
             
             if not transcription_result['success']:
                 return {
@@ -170,104 +297,8 @@ def process_interview_recording_task(call_session_id: str):
                     'error': f"Transcription failed: {transcription_result.get('error')}"
                 }
             
-            # Save transcription
-            transcription = repo.create_transcription(
-                interview_id=interview.id,
-                full_text=transcription_result['text'],
-                segments=transcription_result['segments'],
-                detected_language=transcription_result['language']
-            )
-            
             logger.info(f" Transcription completed for interview {interview.id}")
             
-            # 4. Get job requirements and settings
-            settings = repo.get_settings_by_job(interview.job_id)
-            if not settings:
-                settings = repo.create_default_settings(interview.job_id)
-            
-            job_requirements = {
-                'job_title': interview.job.job_title,
-                'required_skills': interview.job.skills_required or [],
-                'minimum_experience': interview.job.min_experience or 0,
-                'responsibilities': interview.job.key_responsibilities or ''
-            }
-            
-            settings_dict = {
-                'communication_weight': settings.communication_weight,
-                'technical_knowledge_weight': settings.technical_knowledge_weight,
-                'problem_solving_weight': settings.problem_solving_weight,
-                'enthusiasm_weight': settings.enthusiasm_weight,
-                'clarity_weight': settings.clarity_weight,
-                'professionalism_weight': settings.professionalism_weight,
-                'minimum_qualifying_score': settings.minimum_qualifying_score
-            }
-            
-            # 5. Analyze interview
-            logger.info(f" Starting AI analysis for interview {interview.id}...")
-            analysis_result = scorer_service.analyze_interview(
-                transcription=transcription_result['text'],
-                job_requirements=job_requirements,
-                settings=settings_dict
-            )
-            
-            if not analysis_result['success']:
-                return {
-                    'success': False,
-                    'error': f"Analysis failed: {analysis_result.get('error')}"
-                }
-            
-            # 6. Save performance results
-            performance = repo.save_performance_result(
-                interview_id=interview.id,
-                scores=analysis_result['scores'],
-                decision=analysis_result['decision'],
-                analysis=analysis_result['analysis']
-            )
-            
-            logger.info(f" Analysis completed for interview {interview.id}")
-            logger.info(f" Score: {performance.overall_score}/100 - Decision: {performance.decision}")
-            
-            # 7. Update application status
-            application = interview.application
-            application.current_stage_status = (
-                'qualified' if performance.decision == 'qualified' else 'rejected'
-            )
-            application.save()
-            
-            # 8. Send notifications
-            # To recruiter
-            notification_service.send_websocket_notification(
-                user_id=interview.conducted_by_id,
-                notification_type='interview_analyzed',
-                data={
-                    'interview_id': interview.id,
-                    'candidate_name': interview.candidate_name,
-                    'score': performance.overall_score,
-                    'decision': performance.decision
-                }
-            )
-            
-            # To candidate
-            notification_service.send_websocket_notification(
-                user_id=interview.application.candidate_id,
-                notification_type='interview_completed',
-                data={
-                    'interview_id': interview.id,
-                    'job_title': interview.job.job_title,
-                    'decision': performance.decision
-                }
-            )
-            
-            # Send email to candidate
-            send_interview_result_email.delay(interview.id)
-            
-            return {
-                'success': True,
-                'interview_id': interview.id,
-                'score': performance.overall_score,
-                'decision': performance.decision
-            }
-            
         finally:
             # Cleanup temp file
             try:
@@ -275,11 +306,60 @@ def process_interview_recording_task(call_session_id: str):
             except:
                 pass
         
+        # 4. Analyze from the stored transcript, update application, notify
+        result = ReanalyzeInterviewUseCase(
+            repo,
+            scorer_service,
+            notification_service
+        ).execute(interview.id, notify_candidate=True)
+        
+        if not result['success']:
+            return result
+        
+        return {
+            'success': True,
+            'interview_id': interview.id,
+            'score': result['score'],
+            'decision': result['decision']
+        }
+        
     except Exception as e:
         logger.error(f" Recording processing failed: {str(e)}")
         return {'success': False, 'error': str(e)}
 
 
+@shared_task(name='telephonic_round.reanalyze_interview')
+def reanalyze_interview_task(interview_id: int):
+    """Re-run scoring from the stored transcript (no download, no transcription)"""
+    try:
+        result = ReanalyzeInterviewUseCase(
+            TelephonicRoundRepository(),
+            InterviewScorerService(),
+            NotificationService()
+        ).execute(interview_id)
+        
+        if not result['success']:
+            logger.error(f" Reanalysis failed for interview {interview_id}: {result.get('error')}")
+        return {k: v for k, v in result.items() if k != 'analysis'}
+        
+    except Exception as e:
+        logger.error(f" Reanalysis failed for interview {interview_id}: {str(e)}")
+        return {'success': False, 'error': str(e)}
+
+
+@shared_task(name='telephonic_round.reanalyze_job_interviews')
+def reanalyze_job_interviews_task(job_id: int):
+    """Queue reanalysis of every completed interview of a job"""
+    repo = TelephonicRoundRepository()
+    interview_ids = repo.get_reanalyzable_interview_ids(job_id)
+    
+    for interview_id in interview_ids:
+        reanalyze_interview_task.delay(interview_id)
+    
+    logger.info(f" Queued reanalysis of {len(interview_ids)} interviews for job {job_id}")
+    return {'success': True, 'job_id': job_id, 'queued': len(interview_ids)}
+
+
 @shared_task(name='telephonic_round.send_interview_result_email')
 def send_interview_result_email(interview_id: int):
     try:
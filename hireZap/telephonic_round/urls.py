@@ -15,6 +15,11 @@ from .views import (
     MoveToNextStageAPIView,
     GetInterviewStatsAPIView,
     AnalyzeInterviewAPIView,
+    ReanalyzeInterviewAPIView,
+    BulkReanalyzeInterviewsAPIView,
+    FreeSlotsAPIView,
+    AutoScheduleInterviewsAPIView,
+    SearchTranscriptsAPIView,
 )
 urlpatterns = [
     path('settings/<int:job_id>/',GetTelephonicSettingsAPIView.as_view(),name='get-settings'),
@@ -24,11 +29,16 @@ urlpatterns = [
     path('schedule/',ScheduleInterviewAPIView.as_view(),name='schedule-interview'),
     path('bulk-schedule/',BulkScheduleInterviewsAPIView.as_view(),name='bulk-schedule-interviews'),
     path('reschedule/<int:interview_id>/',RescheduleInterviewAPIView.as_view(),name='reschedule-interview'),
+    path('calendar/free-slots/',FreeSlotsAPIView.as_view(),name='calendar-free-slots'),
+    path('auto-schedule/',AutoScheduleInterviewsAPIView.as_view(),name='auto-schedule-interviews'),
     path('start-call/',StartCallAPIView.as_view(),name='start-call'),
     path('join-call/',JoinCallAPIView.as_view(), name='join-call'),
     path('end-call/',EndCallAPIView.as_view(),name='end-call'),
     path('details/<int:interview_id>/',GetInterviewDetailsAPIView.as_view(),name='get-interview-details'),
     path('analyze/<int:interview_id>/',AnalyzeInterviewAPIView.as_view(),name='analyze-interview'),
+    path('reanalyze/<int:interview_id>/',ReanalyzeInterviewAPIView.as_view(),name='reanalyze-interview'),
+    path('reanalyze/job/<int:job_id>/',BulkReanalyzeInterviewsAPIView.as_view(),name='bulk-reanalyze-interviews'),
     path('manual-score/',ManualScoreOverrideAPIView.as_view(),name='manual-score-override'),
     path('move-next-stage/',MoveToNextStageAPIView.as_view(),name='move-to-next-stage'),
+    path('transcripts/search/',SearchTranscriptsAPIView.as_view(),name='search-transcripts'),
 ]
\ No newline at end of file
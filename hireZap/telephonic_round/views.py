@@ -17,10 +17,14 @@ from .serializers import (
     TelephonicInterviewSerializer,
     TelephonicCandidateListSerializer,
     ManualScoreOverrideSerializer,
-    MoveToNextStageSerializer
+    MoveToNextStageSerializer,
+    FreeSlotsSerializer,
+    AutoScheduleSerializer
 )
 
 from infrastructure.repositories.telephonic_round_repository import TelephonicRoundRepository
+from infrastructure.repositories.interview_calendar_repository import InterviewCalendarRepository
+from infrastructure.repositories.transcript_search_repository import TranscriptSearchRepository
 from infrastructure.services.notification_service import NotificationService
 from infrastructure.services.storage_factory import StorageFactory
 from infrastructure.services.telephonic_service import TranscriptionService,InterviewScorerService
@@ -39,7 +43,11 @@ from core.use_cases.telephonic_round.get_telephonic_round_settings_usecase impor
 from core.use_cases.telephonic_round.update_settings_usecase import UpdateSettingsUseCase
 from core.use_cases.telephonic_round.get_stats_usecase import GetStatsUsecase
 from core.use_cases.telephonic_round.get_telephonic_round_candidates import GetTelephonicRoundCandidates
-from .tasks import process_interview_recording_task
+from core.use_cases.telephonic_round.reanalyze_interview_usecase import ReanalyzeInterviewUseCase
+from core.use_cases.interview_calendar.get_free_slots_usecase import GetFreeSlotsUseCase
+from core.use_cases.interview_calendar.auto_allocate_slots_usecase import AutoAllocateSlotsUseCase
+from core.use_cases.transcript_search.search_transcripts_usecase import SearchTranscriptsUseCase
+from .tasks import process_interview_recording_task, reanalyze_job_interviews_task
 
 
 class GetTelephonicSettingsAPIView(APIView):
@@ -160,7 +168,7 @@ class ScheduleInterviewAPIView(APIView):
             notification_service = NotificationService()
             
             # Execute use case
-            use_case = ScheduleInterviewUsecase(repository, notification_service)
+            use_case = ScheduleInterviewUsecase(repository, notification_service, InterviewCalendarRepository())
             result = use_case.execute(
                 application_id=data['candidate_id'],
                 scheduled_at=data['scheduled_at'],
@@ -201,7 +209,7 @@ class BulkScheduleInterviewsAPIView(APIView):
             notification_service = NotificationService()
             
             # Execute use case
-            use_case = BulkScheduleUseCase(repository, notification_service)
+            use_case = BulkScheduleUseCase(repository, notification_service, InterviewCalendarRepository())
             result = use_case.execute(
                 schedules=serializer.validated_data['schedules'],
                 send_notifications=request.data.get('send_notifications', True),
@@ -217,6 +225,125 @@ class BulkScheduleInterviewsAPIView(APIView):
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+class FreeSlotsAPIView(APIView):
+    """Free interview slots of the requesting recruiter"""
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        try:
+            serializer = FreeSlotsSerializer(data=request.data)
+            if not serializer.is_valid():
+                return Response({
+                    'success': False,
+                    'errors': serializer.errors
+                }, status=status.HTTP_400_BAD_REQUEST)
+
+            data = serializer.validated_data
+
+            use_case = GetFreeSlotsUseCase(InterviewCalendarRepository())
+            result = use_case.execute(
+                interviewer_id=request.user.id,
+                windows=[(window['start'], window['end']) for window in data['windows']],
+                duration_minutes=data['duration'],
+                buffer_minutes=data['buffer_minutes'],
+                limit=data['limit']
+            )
+
+            if result['success']:
+                return Response(result)
+            else:
+                return Response(result, status=status.HTTP_400_BAD_REQUEST)
+
+        except Exception as e:
+            return Response({
+                'success': False,
+                'error': str(e)
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class AutoScheduleInterviewsAPIView(APIView):
+    """
+    Allocate conflict-free slots for many applications in one call.
+    Returns the proposed slots; with schedule=true they are also booked
+    through the bulk scheduling flow.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        try:
+            serializer = AutoScheduleSerializer(data=request.data)
+            if not serializer.is_valid():
+                return Response({
+                    'success': False,
+                    'errors': serializer.errors
+                }, status=status.HTTP_400_BAD_REQUEST)
+
+            data = serializer.validated_data
+            calendar_repository = InterviewCalendarRepository()
+
+            allocate_use_case = AutoAllocateSlotsUseCase(calendar_repository)
+            result = allocate_use_case.execute(
+                application_ids=data['application_ids'],
+                windows=[(window['start'], window['end']) for window in data['windows']],
+                duration_minutes=data['duration'],
+                round_name='telephonic',
+                buffer_minutes=data['buffer_minutes']
+            )
+
+            if not result['success']:
+                return Response(result, status=status.HTTP_400_BAD_REQUEST)
+
+            if result['interviewer_id'] != request.user.id:
+                return Response({
+                    'success': False,
+                    'error': 'You can only auto-schedule interviews for your own jobs'
+                }, status=status.HTTP_403_FORBIDDEN)
+
+            response = {
+                'success': True,
+                'allocations': [
+                    {
+                        'application_id': allocation['application_id'],
+                        'scheduled_at': allocation['start'].isoformat(),
+                        'end': allocation['end'].isoformat()
+                    }
+                    for allocation in result['allocations']
+                ],
+                'unallocated': result['unallocated'],
+                'not_found': result['not_found'],
+                'message': result['message']
+            }
+
+            if data['schedule'] and result['allocations']:
+                schedule_use_case = BulkScheduleUseCase(
+                    TelephonicRoundRepository(),
+                    NotificationService(),
+                    calendar_repository
+                )
+                response['scheduling'] = schedule_use_case.execute(
+                    schedules=[
+                        {
+                            'application_id': allocation['application_id'],
+                            'scheduled_at': allocation['start'],
+                            'duration': data['duration'],
+                            'timezone': data.get('timezone'),
+                            'notes': data.get('notes', '')
+                        }
+                        for allocation in result['allocations']
+                    ],
+                    send_notifications=data['send_notifications'],
+                    send_emails=data['send_emails']
+                )
+
+            return Response(response)
+
+        except Exception as e:
+            return Response({
+                'success': False,
+                'error': str(e)
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
 class RescheduleInterviewAPIView(APIView):
     permission_classes = [IsAuthenticated]
     
@@ -237,7 +364,7 @@ class RescheduleInterviewAPIView(APIView):
             notification_service = NotificationService()
             
             # Execute use case
-            use_case = RescheduleInterviewUseCase(repository, notification_service)
+            use_case = RescheduleInterviewUseCase(repository, notification_service, InterviewCalendarRepository())
             result = use_case.execute(
                 interview_id=interview_id,
                 new_scheduled_at=data['scheduled_at'],
@@ -550,4 +677,99 @@ class AnalyzeInterviewAPIView(APIView):
             return Response({
                 'success': False,
                 'error': str(e)
-            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
\ No newline at end of file
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class ReanalyzeInterviewAPIView(APIView):
+    """Re-score an interview from its stored transcript (no re-transcription)"""
+    permission_classes = [IsAuthenticated]
+    
+    def post(self, request, interview_id):
+        try:
+            repository = TelephonicRoundRepository()
+            scorer_service = InterviewScorerService()
+            notification_service = NotificationService()
+            
+            use_case = ReanalyzeInterviewUseCase(
+                repository,
+                scorer_service,
+                notification_service
+            )
+            result = use_case.execute(interview_id)
+            
+            if result['success']:
+                return Response(result)
+            else:
+                return Response(result, status=status.HTTP_400_BAD_REQUEST)
+            
+        except Exception as e:
+            return Response({
+                'success': False,
+                'error': str(e)
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class BulkReanalyzeInterviewsAPIView(APIView):
+    """Queue re-scoring of all completed interviews of a job"""
+    permission_classes = [IsAuthenticated]
+    
+    def post(self, request, job_id):
+        try:
+            repository = TelephonicRoundRepository()
+            interview_count = len(repository.get_reanalyzable_interview_ids(job_id))
+            
+            if interview_count == 0:
+                return Response({
+                    'success': False,
+                    'error': 'No completed interviews with transcripts for this job'
+                }, status=status.HTTP_400_BAD_REQUEST)
+            
+            task = reanalyze_job_interviews_task.delay(job_id)
+            
+            return Response({
+                'success': True,
+                'task_id': task.id,
+                'interview_count': interview_count,
+                'message': f'Reanalysis queued for {interview_count} interviews'
+            }, status=status.HTTP_202_ACCEPTED)
+            
+        except Exception as e:
+            return Response({
+                'success': False,
+                'error': str(e)
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class SearchTranscriptsAPIView(APIView):
+    """Search telephonic and HR transcripts: ?q=salary&round=hr&job_id=&interview_id=&limit="""
+    permission_classes = [IsAuthenticated]
+    
+    def get(self, request):
+        try:
+            params = request.query_params
+            
+            use_case = SearchTranscriptsUseCase(TranscriptSearchRepository())
+            result = use_case.execute(
+                query=params.get('q'),
+                recruiter_id=request.user.id,
+                round_type=params.get('round'),
+                job_id=int(params['job_id']) if params.get('job_id') else None,
+                interview_id=int(params['interview_id']) if params.get('interview_id') else None,
+                limit=int(params.get('limit', 20))
+            )
+            
+            if result['success']:
+                return Response(result)
+            else:
+                return Response(result, status=status.HTTP_400_BAD_REQUEST)
+            
+        except ValueError:
+            return Response({
+                'success': False,
+                'error': 'job_id, interview_id and limit must be integers'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return Response({
+                'success': False,
+                'error': str(e)
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)